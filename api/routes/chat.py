@@ -9,7 +9,7 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage
 from sqlalchemy.orm import Session
 from core.database import get_db
-from api.routes.dashboard import get_dashboard
+from core.dashboard import dashboard_cache
 
 load_dotenv()
 
@@ -181,7 +181,7 @@ def format_chat_history(messages: List[ChatMessage]):
 async def get_prediction_context(db: Session) -> str:
     """예측 데이터를 조회하여 챗봇 컨텍스트 생성"""
     try:
-        dashboard_data = await get_dashboard(db)
+        dashboard_data, _ = dashboard_cache.get(db)
         
         # 월간 추이 정보
         trends_text = "\n".join([
@@ -1,26 +1,31 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query, Depends, Path, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from datetime import datetime, date
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from fetch import fetchers
-from enum import Enum
-import numpy as np
-from core.predict import predict_by_vector
-from core.database import get_db
+import json
+import gzip
+import asyncio
+from core import prediction_grid
+from core.ingestion import (
+    UPSTREAM_CONCURRENCY,
+    TrashStatus,
+    fetch_prediction_inputs_async,
+    predict_from_inputs,
+    ensure_beach_predictions,
+)
+from core.database import get_db, SessionLocal
 from models.beach_prediction import BeachPrediction
 from models.beach import Beach
-import os
 
 router = APIRouter(
     prefix="/v1/trash",
     tags=["trash"]
 )
 
-
-class TrashStatus(str, Enum):
-    LOW = "LOW"
-    MEDIUM = "MEDIUM"
-    HIGH = "HIGH"
+# 기간 조회 스트리밍 시 DB 커서에서 한 번에 가져오는 행 수
+RANGE_FETCH_SIZE = 1000
 
 
 class Location(BaseModel):
@@ -39,6 +44,16 @@ class PredictResponse(BaseModel):
     status: TrashStatus
 
 
+class BatchPredictPoint(BaseModel):
+    date: str
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+
+
+class BatchPredictRequest(BaseModel):
+    points: list[BatchPredictPoint] = Field(..., min_length=1, max_length=500)
+
+
 class BeachPredictionResponse(BaseModel):
     name: str
     date: str
@@ -48,65 +63,6 @@ class BeachPredictionResponse(BaseModel):
     temperature: float
 
 
-def calculate_trash_prediction(date_obj: datetime, latitude: float, longitude: float) -> tuple[float, TrashStatus]:
-    """
-    주어진 날짜와 위치에 대한 쓰레기 양을 예측합니다.
-    
-    Args:
-        date_obj: 예측 날짜
-        latitude: 위도
-        longitude: 경도
-    
-    Returns:
-        (trash_amount, status) 튜플
-    """
-    # 해류 및 풍속 데이터 가져오기
-    current_dir, current_speed = fetchers.fetch_current(date_obj, latitude, longitude)
-    wind_dir, wind_speed = fetchers.fetch_wind(date_obj, latitude, longitude)
-
-    # 벡터 계산
-    rad = np.deg2rad(current_dir)
-    current_u = current_speed * np.cos(rad)
-    current_v = current_speed * np.sin(rad)
-
-    rad = np.deg2rad(wind_dir)
-    wind_u = wind_speed * np.cos(rad)
-    wind_v = wind_speed * np.sin(rad)
-
-    # 날짜 feature 계산
-    dayofyear = date_obj.timetuple().tm_yday
-    day_sin = np.sin(2 * np.pi * dayofyear / 365)
-    day_cos = np.cos(2 * np.pi * dayofyear / 365)
-    
-    print(f'Features - dayofyear: {dayofyear}, day_sin: {day_sin:.4f}, day_cos: {day_cos:.4f}, '
-          f'wind_speed: {wind_speed:.2f}, current_speed: {current_speed:.2f}, '
-          f'wind_u: {wind_u:.2f}, wind_v: {wind_v:.2f}, current_u: {current_u:.2f}, current_v: {current_v:.2f}')
-    
-    # trash_amount 예측
-    trash_amount = predict_by_vector(
-        model_path=os.environ.get('MODEL_PATH'),
-        dayofyear=dayofyear,
-        day_sin=day_sin,
-        day_cos=day_cos,
-        wind_speed=wind_speed,
-        current_speed=current_speed,
-        wind_u=wind_u,
-        wind_v=wind_v,
-        current_u=current_u,
-        current_v=current_v
-    )
-    
-    # status 결정
-    if trash_amount < 200:
-        status = TrashStatus.LOW
-    elif trash_amount < 300:
-        status = TrashStatus.MEDIUM
-    else:
-        status = TrashStatus.HIGH
-    
-    return trash_amount, status
-
-
 @router.get("/predict", response_model=PredictResponse)
 async def get_prediction(
     date: str = Query(
@@ -141,7 +97,9 @@ async def get_prediction(
         date_obj = datetime.fromisoformat(date)
         
         # 쓰레기 양 예측
-        trash_amount, status = calculate_trash_prediction(date_obj, latitude, longitude)
+        inputs = await fetch_prediction_inputs_async(date_obj, latitude, longitude)
+        # 모델 추론은 스레드에서 실행 (이벤트 루프 차단 방지)
+        trash_amount, status = (await asyncio.to_thread(predict_from_inputs, [date_obj], [inputs]))[0]
         
         return PredictResponse(
             date=date_obj.strftime("%Y-%m-%d"),
@@ -160,6 +118,54 @@ async def get_prediction(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/predict/batch", response_model=list[PredictResponse])
+async def get_batch_predictions(request: BatchPredictRequest):
+    """
+    여러 (날짜, 위도, 경도) 지점의 쓰레기 양을 한 번에 예측합니다.
+    
+    모든 지점의 feature를 모은 뒤 한 번의 모델 호출로 예측하며, 결과는 요청 순서와 같습니다.
+    
+    - **points**: 예측 지점 목록 (최대 500개, date는 ISO 8601 형식)
+    """
+    try:
+        date_objs = []
+        for i, point in enumerate(request.points):
+            try:
+                date_objs.append(datetime.fromisoformat(point.date))
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{i}번째 지점의 날짜 형식이 올바르지 않습니다 (ISO 8601 형식 필요): {str(e)}"
+                )
+        
+        semaphore = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+        inputs = await asyncio.gather(*(
+            fetch_prediction_inputs_async(date_obj, point.latitude, point.longitude, semaphore)
+            for date_obj, point in zip(date_objs, request.points)
+        ))
+        # 모델 추론은 스레드에서 실행 (큰 배치가 다른 요청을 막지 않도록)
+        predictions = await asyncio.to_thread(predict_from_inputs, date_objs, inputs)
+        
+        return [
+            PredictResponse(
+                date=date_obj.strftime("%Y-%m-%d"),
+                location=Location(
+                    latitude=point.latitude,
+                    longitude=point.longitude
+                ),
+                prediction=Prediction(
+                    trash_amount=trash_amount
+                ),
+                status=status
+            )
+            for date_obj, point, (trash_amount, status) in zip(date_objs, request.points, predictions)
+        ]
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/beach", response_model=list[BeachPredictionResponse])
 async def get_beach_predictions(
     prediction_date: str = Query(
@@ -173,7 +179,7 @@ async def get_beach_predictions(
     제주도 주요 해변의 쓰레기 양 예측 데이터를 조회합니다.
     
     11개 해변의 지정된 날짜 기준 쓰레기 예측량을 반환합니다.
-    DB에 해당 날짜 데이터가 있으면 DB에서 조회하고, 없으면 API 호출 후 저장합니다.
+    DB에 저장된 해변은 DB에서 조회하고, 누락된 해변만 API 호출 후 저장합니다.
     
     - **prediction_date**: 예측 날짜 (YYYY-MM-DD 형식, 선택 사항. 미지정시 오늘 날짜)
     """
@@ -194,92 +200,25 @@ async def get_beach_predictions(
         if not beaches:
             raise Exception("DB에 해변 정보가 없습니다. init_db.py를 실행하여 초기 데이터를 생성하세요.")
         
-        # DB에서 지정된 날짜의 모든 해변 데이터 조회
-        cached_predictions = db.query(BeachPrediction).filter(
-            BeachPrediction.prediction_date == target_date
-        ).all()
-        
-        # DB에 모든 해변 데이터가 있는지 확인
-        cached_beach_names = {pred.beach_name for pred in cached_predictions}
-        all_beach_names = {beach.name for beach in beaches}
+        # DB에 저장된 해변은 그대로 사용하고, 누락된 해변만 계산하여 저장
+        rows = await ensure_beach_predictions(db, target_date, beaches, date_obj)
         
-        results = []
-        
-        # DB에 모든 데이터가 있으면 DB에서 반환
-        if cached_beach_names == all_beach_names:
-            print(f"DB에서 {target_date} 날짜 데이터 조회")
-            for pred in cached_predictions:
-                results.append(BeachPredictionResponse(
-                    name=pred.beach_name,
-                    date=pred.prediction_date.strftime("%Y-%m-%d"),
-                    location=Location(
-                        latitude=pred.latitude,
-                        longitude=pred.longitude
-                    ),
-                    prediction=Prediction(
-                        trash_amount=pred.trash_amount
-                    ),
-                    status=TrashStatus(pred.status),
-                    temperature=pred.temperature if pred.temperature else 0.0
-                ))
-        else:
-            # DB에 데이터가 없거나 불완전하면 API 호출 후 저장
-            print(f"API 호출하여 {target_date} 날짜 데이터 생성")
-            
-            # 기존 날짜 데이터 삭제 (불완전한 데이터 방지)
-            db.query(BeachPrediction).filter(
-                BeachPrediction.prediction_date == target_date
-            ).delete()
-            
-            for beach in beaches:
-                try:
-                    latitude = beach.latitude
-                    longitude = beach.longitude
-                    
-                    # 쓰레기 양 예측
-                    trash_amount, status = calculate_trash_prediction(date_obj, latitude, longitude)
-                    
-                    # 수온 데이터 가져오기
-                    try:
-                        temperature = fetchers.fetch_temperature(date_obj, latitude, longitude)
-                    except Exception as temp_error:
-                        print(f"수온 데이터 조회 실패 ({beach.name}): {str(temp_error)}")
-                        temperature = None
-                    
-                    # DB에 저장
-                    beach_prediction = BeachPrediction(
-                        beach_name=beach.name,
-                        prediction_date=target_date,
-                        latitude=latitude,
-                        longitude=longitude,
-                        trash_amount=trash_amount,
-                        status=status.value,
-                        temperature=temperature
-                    )
-                    db.add(beach_prediction)
-                    
-                    # 결과 리스트에 추가
-                    results.append(BeachPredictionResponse(
-                        name=beach.name,
-                        date=target_date.strftime("%Y-%m-%d"),
-                        location=Location(
-                            latitude=latitude,
-                            longitude=longitude
-                        ),
-                        prediction=Prediction(
-                            trash_amount=trash_amount
-                        ),
-                        status=status,
-                        temperature=temperature if temperature else 0.0
-                    ))
-                    
-                except Exception as beach_error:
-                    # 개별 해변 에러는 로깅만 하고 계속 진행
-                    print(f"해변 {beach.name} 예측 실패: {str(beach_error)}")
-                    continue
-            
-            # DB에 커밋
-            db.commit()
+        results = [
+            BeachPredictionResponse(
+                name=row["beach_name"],
+                date=row["prediction_date"].strftime("%Y-%m-%d"),
+                location=Location(
+                    latitude=row["latitude"],
+                    longitude=row["longitude"]
+                ),
+                prediction=Prediction(
+                    trash_amount=row["trash_amount"]
+                ),
+                status=TrashStatus(row["status"]),
+                temperature=row["temperature"] if row["temperature"] else 0.0
+            )
+            for row in rows
+        ]
         
         if not results:
             raise Exception("모든 해변 예측에 실패했습니다")
@@ -289,3 +228,170 @@ async def get_beach_predictions(
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _stream_beach_prediction_rows(start_date: date, end_date: date, beach: str = None):
+    """
+    기간의 해변 예측 데이터를 서버 측 커서로 읽어 한 행씩 dict로 반환합니다.
+    
+    ORM 객체 대신 필요한 컬럼만 조회하고, 스트리밍 응답이 끝날 때까지 유지되는 별도 세션을 사용합니다.
+    """
+    db = SessionLocal()
+    try:
+        stmt = select(
+            BeachPrediction.beach_name,
+            BeachPrediction.prediction_date,
+            BeachPrediction.latitude,
+            BeachPrediction.longitude,
+            BeachPrediction.trash_amount,
+            BeachPrediction.status,
+            BeachPrediction.temperature
+        ).where(
+            BeachPrediction.prediction_date >= start_date,
+            BeachPrediction.prediction_date <= end_date
+        )
+        if beach:
+            stmt = stmt.where(BeachPrediction.beach_name == beach)
+        stmt = stmt.order_by(BeachPrediction.prediction_date, BeachPrediction.beach_name)
+        
+        for name, prediction_date, latitude, longitude, trash_amount, status, temperature in db.execute(
+            stmt.execution_options(yield_per=RANGE_FETCH_SIZE)
+        ):
+            yield {
+                "name": name,
+                "date": prediction_date.strftime("%Y-%m-%d"),
+                "location": {"latitude": latitude, "longitude": longitude},
+                "prediction": {"trash_amount": trash_amount},
+                "status": status,
+                "temperature": temperature if temperature else 0.0
+            }
+    finally:
+        db.close()
+
+
+def _ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+
+def _json_array_chunks(rows):
+    yield "["
+    for i, row in enumerate(rows):
+        yield ("," if i else "") + json.dumps(row, ensure_ascii=False)
+    yield "]"
+
+
+@router.get("/beach/range")
+def get_beach_prediction_range(
+    start: str = Query(
+        ...,
+        description="시작 날짜 (YYYY-MM-DD 형식)",
+        example="2024-01-01"
+    ),
+    end: str = Query(
+        ...,
+        description="종료 날짜 (YYYY-MM-DD 형식, 포함)",
+        example="2024-01-31"
+    ),
+    beach: str = Query(
+        None,
+        description="해변 이름 (미지정시 모든 해변)"
+    ),
+    format: str = Query(
+        "ndjson",
+        pattern="^(ndjson|json)$",
+        description="응답 형식 (ndjson: 한 줄에 한 행, json: JSON 배열)"
+    )
+):
+    """
+    기간의 해변별 쓰레기 예측 데이터를 스트리밍으로 조회합니다.
+    
+    DB에 저장된 데이터만 반환하며(예측 계산은 하지 않음), 날짜/해변 순으로 정렬됩니다.
+    각 행은 /beach 응답 항목과 같은 형식입니다.
+    
+    - **start**, **end**: 조회 기간 (YYYY-MM-DD 형식, 양 끝 포함)
+    - **beach**: 해변 이름 (선택 사항)
+    - **format**: ndjson (기본, application/x-ndjson) 또는 json (application/json 배열)
+    """
+    try:
+        start_date = datetime.strptime(start, "%Y-%m-%d").date()
+        end_date = datetime.strptime(end, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="날짜 형식이 올바르지 않습니다 (YYYY-MM-DD 형식 필요)")
+    
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="종료 날짜가 시작 날짜보다 이전입니다")
+    
+    rows = _stream_beach_prediction_rows(start_date, end_date, beach)
+    if format == "json":
+        return StreamingResponse(_json_array_chunks(rows), media_type="application/json")
+    return StreamingResponse(_ndjson_lines(rows), media_type="application/x-ndjson")
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Accept-Encoding 헤더가 gzip을 허용하는지 확인 (q=0은 거부로 처리)"""
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+@router.get("/grid/{z}/{x}/{y}")
+async def get_prediction_grid_tile(
+    request: Request,
+    z: int = Path(..., ge=prediction_grid.MIN_ZOOM, le=prediction_grid.MAX_ZOOM, description="줌 레벨"),
+    x: int = Path(..., ge=0, description="타일 x 인덱스"),
+    y: int = Path(..., ge=0, description="타일 y 인덱스"),
+    prediction_date: str = Query(
+        None,
+        description="예측 날짜 (YYYY-MM-DD 형식). 미지정시 오늘 날짜 사용",
+        example="2024-01-15"
+    )
+):
+    """
+    제주 연안 예측 격자 타일을 조회합니다.
+    
+    지도 타일(z/x/y) 영역을 격자로 샘플링한 지점별 쓰레기 예측량을 JSON으로 반환합니다.
+    Accept-Encoding에 gzip이 있으면 저장된 gzip 압축 본문을 그대로, 없으면 압축을 풀어 반환합니다.
+    한 번 계산한 타일은 캐시에서 바로 제공됩니다.
+    
+    - **z, x, y**: Web Mercator 타일 좌표
+    - **prediction_date**: 예측 날짜 (YYYY-MM-DD 형식, 선택 사항. 미지정시 오늘 날짜)
+    
+    응답 형식: {"date", "z", "x", "y", "bounds", "lats": [...], "lons": [...], "trash_amount": [...]}
+    """
+    if x >= 2 ** z or y >= 2 ** z:
+        raise HTTPException(status_code=400, detail="타일 좌표가 줌 레벨 범위를 벗어났습니다")
+    
+    if prediction_date:
+        try:
+            target_date = datetime.strptime(prediction_date, "%Y-%m-%d").date()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="날짜 형식이 올바르지 않습니다 (YYYY-MM-DD 형식 필요)")
+    else:
+        target_date = date.today()
+    
+    try:
+        content = await prediction_grid.tile_store.get_or_compute(target_date, z, x, y)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    headers = {
+        # 공유 캐시가 gzip 응답을 gzip을 모르는 클라이언트에 주지 않도록
+        "Vary": "Accept-Encoding",
+        "Cache-Control": "public, max-age=86400" if target_date < date.today() else "public, max-age=600"
+    }
+    if accepts_gzip(request.headers.get("accept-encoding")):
+        headers["Content-Encoding"] = "gzip"
+    else:
+        content = gzip.decompress(content)
+    
+    return Response(content=content, media_type="application/json", headers=headers)
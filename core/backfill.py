@@ -0,0 +1,229 @@
+"""
+해변 예측 데이터 백필 엔진
+
+날짜 범위를 날짜별 작업 단위(해당 날짜에 누락된 해변 목록)로 나누어 제한된 수의 워커로 동시에 처리합니다.
+완료된 (날짜, 해변)은 체크포인트 파일(JSONL)에 기록하여 중단 후 다시 실행하면 남은 작업부터 이어서 진행하고,
+DB에 이미 모든 해변 데이터가 있는 날짜는 네트워크 호출 없이 건너뜁니다.
+업스트림 API별 초당 요청 수는 fetch.rate_limit (UPSTREAM_RATE_LIMITS)로 제한합니다.
+
+    BACKFILL_WORKERS     동시에 처리할 날짜 수 (기본 4)
+    BACKFILL_CHECKPOINT  체크포인트 파일 경로 (기본 backfill_checkpoint.jsonl)
+"""
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from core.database import SessionLocal
+from core.ingestion import UPSTREAM_CONCURRENCY, compute_beach_predictions, write_beach_predictions
+from fetch.client import async_http_client
+from models.beach import Beach
+from models.beach_prediction import BeachPrediction
+
+BACKFILL_WORKERS = int(os.environ.get("BACKFILL_WORKERS", 4))
+BACKFILL_CHECKPOINT = os.environ.get("BACKFILL_CHECKPOINT", "backfill_checkpoint.jsonl")
+
+
+@dataclass
+class BackfillUnit:
+    """백필 작업 단위: 한 날짜의 누락된 해변들"""
+    target_date: date
+    beaches: list
+
+
+class Checkpoint:
+    """완료된 (날짜, 해변)을 기록하는 JSONL 체크포인트 파일"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+
+    def load(self) -> dict[date, set[str]]:
+        """
+        기록된 완료 항목을 읽습니다.
+
+        Returns:
+            날짜별 완료된 해변 이름 집합
+        """
+        completed: dict[date, set[str]] = {}
+        if not self.path or not os.path.exists(self.path):
+            return completed
+
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    target_date = datetime.strptime(entry["date"], "%Y-%m-%d").date()
+                except (ValueError, KeyError):
+                    # 중단 시점에 잘린 마지막 줄 등은 무시
+                    continue
+                completed.setdefault(target_date, set()).add(entry["beach"])
+        return completed
+
+    def record(self, target_date: date, beach_names: list[str]):
+        """완료된 해변들을 기록합니다."""
+        if not self.path or not beach_names:
+            return
+
+        date_str = target_date.strftime("%Y-%m-%d")
+        with open(self.path, "a", encoding="utf-8") as f:
+            for name in beach_names:
+                f.write(json.dumps({"date": date_str, "beach": name}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class BackfillEngine:
+    """날짜 범위 백필 실행기"""
+
+    def __init__(
+        self,
+        start_date: date,
+        end_date: date,
+        workers: int = None,
+        checkpoint_path: str = None,
+        dates: list[date] = None
+    ):
+        """
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            workers: 동시에 처리할 날짜 수 (미지정시 BACKFILL_WORKERS)
+            checkpoint_path: 체크포인트 파일 경로 (미지정시 BACKFILL_CHECKPOINT, 빈 문자열이면 사용 안 함)
+            dates: 처리할 날짜 목록 (지정시 start_date/end_date 범위 대신 사용)
+        """
+        self.dates = dates if dates is not None else [
+            start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)
+        ]
+        self.workers = workers or BACKFILL_WORKERS
+        self.checkpoint = Checkpoint(checkpoint_path if checkpoint_path is not None else BACKFILL_CHECKPOINT)
+
+    def plan(self, db) -> tuple[list[BackfillUnit], int]:
+        """
+        DB와 체크포인트를 확인하여 남은 작업 단위를 만듭니다 (네트워크 호출 없음).
+
+        Returns:
+            (작업 단위 리스트, 건너뛴 날짜 수)
+        """
+        beaches = db.query(Beach).all()
+        if not beaches:
+            raise Exception("DB에 해변 정보가 없습니다. init_db.py를 실행하여 초기 데이터를 생성하세요.")
+
+        # 범위 안의 저장된 (날짜, 해변)을 한 번에 조회
+        completed = self.checkpoint.load()
+        if self.dates:
+            stored = db.query(BeachPrediction.prediction_date, BeachPrediction.beach_name).filter(
+                BeachPrediction.prediction_date >= min(self.dates),
+                BeachPrediction.prediction_date <= max(self.dates)
+            ).all()
+            for target_date, name in stored:
+                completed.setdefault(target_date, set()).add(name)
+
+        units = []
+        for target_date in self.dates:
+            done = completed.get(target_date, set())
+            missing = [beach for beach in beaches if beach.name not in done]
+            if missing:
+                units.append(BackfillUnit(target_date, missing))
+        return units, len(self.dates) - len(units)
+
+    async def _process(self, unit: BackfillUnit, semaphore: asyncio.Semaphore) -> int:
+        """작업 단위 하나를 계산하여 저장하고, 완료된 해변을 체크포인트에 기록합니다."""
+        rows = await compute_beach_predictions(unit.target_date, unit.beaches, semaphore=semaphore)
+        if not rows:
+            raise Exception("모든 해변 예측에 실패했습니다")
+
+        # DB 쓰기는 짧으므로 워커마다 세션을 열고 바로 닫음
+        db = SessionLocal()
+        try:
+            write_beach_predictions(db, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        self.checkpoint.record(unit.target_date, [row["beach_name"] for row in rows])
+        return len(rows)
+
+    async def run(self) -> dict:
+        """
+        백필을 실행합니다.
+
+        Returns:
+            {"success", "skipped", "failed", "rows", "elapsed", "days_per_minute"} 요약
+        """
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            units, skipped = self.plan(db)
+        finally:
+            db.close()
+
+        summary = {"success": 0, "skipped": skipped, "failed": 0, "rows": 0, "elapsed": 0.0, "days_per_minute": 0.0}
+        print(f"백필 계획: 전체 {len(self.dates)}일, 남은 작업 {len(units)}일, 건너뜀 {skipped}일 (워커 {self.workers}개)")
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for unit in units:
+            queue.put_nowait(unit)
+        semaphore = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+
+        def report(unit: BackfillUnit, message: str):
+            done = summary["success"] + summary["failed"]
+            elapsed = time.perf_counter() - started
+            rate = done / elapsed * 60 if elapsed > 0 else 0.0
+            eta = (len(units) - done) / rate * 60 if rate > 0 else 0.0
+            print(
+                f"[{unit.target_date}] {message} "
+                f"- 진행 {done}/{len(units)}일, {rate:.1f}일/분, 남은 시간 약 {timedelta(seconds=int(eta))}"
+            )
+
+        async def worker():
+            while True:
+                try:
+                    unit = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    count = await self._process(unit, semaphore)
+                    summary["success"] += 1
+                    summary["rows"] += count
+                    report(unit, f"✓ 성공 ({count}개 해변)")
+                except Exception as e:
+                    summary["failed"] += 1
+                    report(unit, f"✗ 오류: {str(e)}")
+
+        await asyncio.gather(*(worker() for _ in range(min(self.workers, len(units)))))
+
+        summary["elapsed"] = time.perf_counter() - started
+        if summary["elapsed"] > 0:
+            summary["days_per_minute"] = (summary["success"] + summary["failed"]) / summary["elapsed"] * 60
+        return summary
+
+
+def run_backfill(
+    start_date: date,
+    end_date: date,
+    workers: int = None,
+    checkpoint_path: str = None,
+    dates: list[date] = None
+) -> dict:
+    """
+    BackfillEngine을 새 이벤트 루프에서 실행합니다 (CLI 스크립트용).
+
+    Returns:
+        BackfillEngine.run 요약
+    """
+    engine = BackfillEngine(start_date, end_date, workers, checkpoint_path, dates)
+
+    async def run():
+        try:
+            return await engine.run()
+        finally:
+            # 이 루프에서 만든 커넥션 풀 정리
+            await async_http_client.aclose()
+
+    return asyncio.run(run())
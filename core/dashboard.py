@@ -0,0 +1,366 @@
+"""
+행정 대시보드 데이터 계산 + 캐시
+
+예측 집계(core.rollups)와 방문객 통계로 DashboardResponse를 만들고, 데이터 버전(core.versions)으로 무효화되는 캐시를 제공합니다.
+API 라우트(대시보드, 챗봇, 보고서)와 스케줄러가 함께 사용합니다.
+"""
+from pydantic import BaseModel
+from datetime import date
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+import os
+import threading
+from core.rollups import month_key, month_range
+from core.versions import current_version
+from models.prediction_rollup import BeachMonthlyRollup, MonthlyPredictionRollup
+from models.coastal_visitor_stats import CoastalVisitorStats
+from typing import List, Optional
+from enum import Enum
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 캐시할 (기준 월, 추이 개월 수, 방문객 조건) 조합 최대 수
+DASHBOARD_CACHE_SIZE = int(os.environ.get("DASHBOARD_CACHE_SIZE", 64))
+# 방문객 통계 기간 미지정시 포함할 최근 개월 수 (최신 데이터 월 기준)
+VISITOR_STATS_MONTHS = int(os.environ.get("VISITOR_STATS_MONTHS", 24))
+
+
+class RiskLevel(str, Enum):
+    HIGH = "높음"
+    MEDIUM = "중간"
+    LOW = "낮음"
+
+
+class ActionType(str, Enum):
+    IMMEDIATE = "즉시 수거"
+    MONITOR = "모니터링 강화"
+    REGULAR = "정기 점검"
+    WATCH = "주의 관찰"
+
+
+class MonthlySummary(BaseModel):
+    total_predicted_amount: float  # 총 예상 유입량 (kg)
+    previous_month_change: float  # 전월 대비 변화율 (%)
+    high_risk_count: int  # 위험 지역 수
+    medium_risk_count: int  # 주의 지역 수
+    immediate_action_count: int  # 즉시 조치 필요 수
+    regular_check_count: int  # 정기 점검 수
+
+
+class MonthlyTrend(BaseModel):
+    month: str  # "Jul", "Aug", "Sep", etc.
+    year: int
+    total_amount: float  # kg
+
+
+class RiskArea(BaseModel):
+    beach_name: str  # 지역명
+    predicted_amount: float  # 예상량 (kg)
+    risk_level: RiskLevel  # 위험도
+    action_required: ActionType  # 조치사항
+    latitude: float
+    longitude: float
+
+
+class VisitorStats(BaseModel):
+    region: str  # 지역명
+    year_month: str  # YYYY-MM
+    visitor: int  # 방문객 수
+
+
+class VisitorMatrix(BaseModel):
+    regions: List[str]  # 지역명 (행)
+    months: List[str]  # YYYY-MM (열)
+    visitors: List[List[int]]  # regions × months 방문객 수 (데이터 없는 칸은 0)
+
+
+class DashboardResponse(BaseModel):
+    target_month: str  # "2025-12"
+    summary: MonthlySummary
+    monthly_trends: List[MonthlyTrend]
+    risk_areas: List[RiskArea]
+    visitor_stats: List[VisitorStats]  # 방문객 통계 데이터 (visitor_format=rows)
+    visitor_matrix: Optional[VisitorMatrix] = None  # 지역 × 월 방문객 행렬 (visitor_format=matrix)
+
+
+@dataclass(frozen=True)
+class VisitorFilter:
+    """방문객 통계 조회 조건 (캐시 키에 포함)"""
+    regions: tuple = ()  # 포함할 지역 (비어 있으면 전체)
+    start_month: Optional[str] = None  # 시작 월 YYYY-MM (미지정시 종료 월 기준 VISITOR_STATS_MONTHS개월)
+    end_month: Optional[str] = None  # 종료 월 YYYY-MM (미지정시 데이터의 최신 월)
+    format: str = "rows"  # rows: 행 목록, matrix: 지역 × 월 행렬
+
+
+def add_months(year: int, month: int, delta: int) -> tuple[int, int]:
+    """(year, month)에서 delta개월 이동한 (연, 월)"""
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+
+def parse_year_month(value: str) -> tuple[int, int]:
+    """YYYY-MM 문자열을 (연, 월)로 변환 (형식이 틀리면 ValueError)"""
+    try:
+        year, month = (int(part) for part in value.split("-"))
+        month_range(year, month)
+    except (ValueError, AttributeError):
+        raise ValueError(f"월 형식이 올바르지 않습니다 (YYYY-MM 형식 필요): {value}")
+    return year, month
+
+
+def load_visitor_stats(db: Session, visitor_filter: VisitorFilter) -> tuple[List[VisitorStats], Optional[VisitorMatrix]]:
+    """
+    조건에 맞는 방문객 통계를 조회합니다 (기간이 제한되므로 응답 크기는 테이블 크기와 무관).
+    
+    Returns:
+        (행 목록, 지역 × 월 행렬) - format에 해당하는 쪽만 채워짐
+    """
+    query = db.query(CoastalVisitorStats.region, CoastalVisitorStats.year_month, CoastalVisitorStats.visitor)
+    if visitor_filter.regions:
+        query = query.filter(CoastalVisitorStats.region.in_(visitor_filter.regions))
+    
+    end_month = visitor_filter.end_month or query.with_entities(func.max(CoastalVisitorStats.year_month)).scalar()
+    if end_month is None:
+        return [], (VisitorMatrix(regions=[], months=[], visitors=[]) if visitor_filter.format == "matrix" else None)
+    
+    end_year, end_month_number = parse_year_month(end_month)
+    if visitor_filter.start_month:
+        start_year, start_month_number = parse_year_month(visitor_filter.start_month)
+    else:
+        start_year, start_month_number = add_months(end_year, end_month_number, -(VISITOR_STATS_MONTHS - 1))
+    
+    # YYYY-MM 문자열은 사전순 = 시간순
+    stats_data = query.filter(
+        CoastalVisitorStats.year_month >= month_key(start_year, start_month_number),
+        CoastalVisitorStats.year_month <= month_key(end_year, end_month_number)
+    ).order_by(CoastalVisitorStats.region, CoastalVisitorStats.year_month).all()
+    
+    if visitor_filter.format != "matrix":
+        return [
+            VisitorStats(region=region, year_month=year_month, visitor=visitor)
+            for region, year_month, visitor in stats_data
+        ], None
+    
+    regions = sorted({region for region, _, _ in stats_data})
+    months_list = sorted({year_month for _, year_month, _ in stats_data})
+    region_index = {region: i for i, region in enumerate(regions)}
+    month_index = {year_month: i for i, year_month in enumerate(months_list)}
+    visitors = [[0] * len(months_list) for _ in regions]
+    for region, year_month, visitor in stats_data:
+        visitors[region_index[region]][month_index[year_month]] = visitor
+    
+    return [], VisitorMatrix(regions=regions, months=months_list, visitors=visitors)
+
+
+def calculate_risk_level(trash_amount: float) -> RiskLevel:
+    """쓰레기 양에 따른 위험도 계산"""
+    if trash_amount >= 300:
+        return RiskLevel.HIGH
+    elif trash_amount >= 200:
+        return RiskLevel.MEDIUM
+    else:
+        return RiskLevel.LOW
+
+
+def calculate_action_type(trash_amount: float) -> ActionType:
+    """쓰레기 양에 따른 조치사항 결정"""
+    if trash_amount >= 400:
+        return ActionType.IMMEDIATE
+    elif trash_amount >= 300:
+        return ActionType.MONITOR
+    elif trash_amount >= 200:
+        return ActionType.REGULAR
+    else:
+        return ActionType.WATCH
+
+
+def build_dashboard(
+    db: Session,
+    months: int = 6,
+    target_month: str = None,
+    visitor_filter: VisitorFilter = None
+) -> DashboardResponse:
+    """
+    대시보드 데이터를 집계합니다 (라우트, 보고서, 챗봇에서 공통 사용).
+    
+    Args:
+        db: DB 세션
+        months: 월별 추이 개월 수 (기준 월 포함)
+        target_month: 기준 월 (YYYY-MM, 미지정시 현재 월)
+        visitor_filter: 방문객 통계 조회 조건 (미지정시 전체 지역, 최근 VISITOR_STATS_MONTHS개월, 행 목록)
+    
+    Returns:
+        DashboardResponse
+    
+    Raises:
+        ValueError: 기준 월/방문객 기간 형식이 올바르지 않은 경우
+    """
+    # 기준 월 (미지정시 현재 월)
+    if target_month:
+        try:
+            current_year, current_month = parse_year_month(target_month)
+        except ValueError:
+            raise ValueError(f"기준 월 형식이 올바르지 않습니다 (YYYY-MM 형식 필요): {target_month}")
+    else:
+        today = date.today()
+        current_year = today.year
+        current_month = today.month
+    
+    # 지난 달
+    last_month_year, last_month = add_months(current_year, current_month, -1)
+    
+    # 1. 이번 달 / 지난 달 합계 (월별 집계 테이블 기본 키 조회)
+    current_rollup = db.get(MonthlyPredictionRollup, month_key(current_year, current_month))
+    current_total = current_rollup.total_amount if current_rollup else 0.0
+    
+    last_month_rollup = db.get(MonthlyPredictionRollup, month_key(last_month_year, last_month))
+    last_month_total = last_month_rollup.total_amount if last_month_rollup else 0.0
+    
+    # 전월 대비 변화율 계산
+    if last_month_total > 0:
+        change_rate = ((current_total - last_month_total) / last_month_total) * 100
+    else:
+        change_rate = 0.0
+    
+    # 2. 이번 달 위험 지역 분석 (해변별 월간 집계에 저장된 이번 달 최신 예측)
+    current_predictions = db.query(BeachMonthlyRollup).filter(
+        BeachMonthlyRollup.year_month == month_key(current_year, current_month)
+    ).all()
+    
+    # 위험도별 카운트
+    high_risk_count = 0
+    medium_risk_count = 0
+    immediate_action_count = 0
+    regular_check_count = 0
+    
+    risk_areas = []
+    
+    for pred in current_predictions:
+        risk_level = calculate_risk_level(pred.latest_amount)
+        action_type = calculate_action_type(pred.latest_amount)
+        
+        if risk_level == RiskLevel.HIGH:
+            high_risk_count += 1
+        elif risk_level == RiskLevel.MEDIUM:
+            medium_risk_count += 1
+        
+        if action_type == ActionType.IMMEDIATE:
+            immediate_action_count += 1
+        elif action_type in [ActionType.REGULAR, ActionType.WATCH]:
+            regular_check_count += 1
+        
+        risk_areas.append(RiskArea(
+            beach_name=pred.beach_name,
+            predicted_amount=pred.latest_amount,
+            risk_level=risk_level,
+            action_required=action_type,
+            latitude=pred.latitude,
+            longitude=pred.longitude
+        ))
+    
+    # 위험도 순으로 정렬 (쓰레기 양 많은 순)
+    risk_areas.sort(key=lambda x: x.predicted_amount, reverse=True)
+    
+    # 3. 최근 months개월 월별 추이 (월별 집계 테이블에서 월 키 목록으로 한 번에 조회)
+    first_year, first_month = add_months(current_year, current_month, -(months - 1))
+    trend_months = [add_months(first_year, first_month, i) for i in range(months)]
+    month_totals = {
+        rollup.year_month: rollup.total_amount
+        for rollup in db.query(MonthlyPredictionRollup).filter(
+            MonthlyPredictionRollup.year_month.in_([month_key(y, m) for y, m in trend_months])
+        ).all()
+    }
+    
+    monthly_trends = []
+    month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", 
+                  "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    
+    for target_year, target_month_number in trend_months:  # months개월 전부터 기준 월까지 (데이터가 없는 달은 0)
+        monthly_trends.append(MonthlyTrend(
+            month=month_names[target_month_number - 1],
+            year=target_year,
+            total_amount=round(month_totals.get(month_key(target_year, target_month_number), 0.0), 2)
+        ))
+    
+    # 4. 방문객 통계 데이터 조회 (지역/기간 조건)
+    visitor_stats, visitor_matrix = load_visitor_stats(db, visitor_filter or VisitorFilter())
+    
+    # 5. 응답 구성
+    summary = MonthlySummary(
+        total_predicted_amount=round(current_total, 2),
+        previous_month_change=round(change_rate, 1),
+        high_risk_count=high_risk_count,
+        medium_risk_count=medium_risk_count,
+        immediate_action_count=immediate_action_count,
+        regular_check_count=regular_check_count
+    )
+    
+    return DashboardResponse(
+        target_month=f"{current_year}-{current_month:02d}",
+        summary=summary,
+        monthly_trends=monthly_trends,
+        risk_areas=risk_areas,
+        visitor_stats=visitor_stats,
+        visitor_matrix=visitor_matrix
+    )
+
+
+class DashboardCache:
+    """
+    DashboardResponse 캐시 (키: 기준 월, 추이 개월 수, 방문객 조건)
+    
+    항목마다 계산 당시의 대시보드 데이터 버전(core.versions)을 함께 저장하고,
+    예측 저장으로 버전이 바뀌면 다음 조회에서 다시 계산합니다.
+    """
+    
+    def __init__(self, max_entries: int = DASHBOARD_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()  # (기준 월, 개월 수, 방문객 조건) -> (버전, 응답, ETag)
+        self._lock = threading.Lock()
+    
+    def get(
+        self,
+        db: Session,
+        months: int = 6,
+        target_month: str = None,
+        visitor_filter: VisitorFilter = None
+    ) -> tuple[DashboardResponse, str]:
+        """
+        캐시된 대시보드를 반환하고, 없거나 버전이 바뀌었으면 다시 계산합니다.
+        
+        반환된 응답 객체는 여러 요청이 공유하므로 수정하지 않아야 합니다.
+        
+        Returns:
+            (DashboardResponse, ETag)
+        """
+        target_month = target_month or date.today().strftime("%Y-%m")
+        visitor_filter = visitor_filter or VisitorFilter()
+        key = (target_month, months, visitor_filter)
+        version = current_version(db)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1], entry[2]
+        
+        dashboard = build_dashboard(db, months=months, target_month=target_month, visitor_filter=visitor_filter)
+        etag = f'"{sha256(dashboard.model_dump_json().encode()).hexdigest()[:32]}"'
+        
+        with self._lock:
+            self._entries[key] = (version, dashboard, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return dashboard, etag
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+dashboard_cache = DashboardCache()
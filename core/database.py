@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -40,3 +42,21 @@ def get_db():
 def init_db():
     """데이터베이스 초기화 (테이블 생성)"""
     Base.metadata.create_all(bind=engine)
+
+
+def upsert_statement(model, rows: list[dict], key_columns: tuple, dialect_name: str):
+    """
+    key_columns(기본 키 또는 유니크 키) 기준 다중 행 upsert 문 생성
+    
+    MySQL은 INSERT ... ON DUPLICATE KEY UPDATE, SQLite(로컬 테스트/벤치마크)는 ON CONFLICT DO UPDATE를 사용합니다.
+    """
+    update_columns = [column for column in rows[0] if column not in key_columns]
+    if dialect_name == "mysql":
+        stmt = mysql_insert(model).values(rows)
+        return stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in update_columns})
+    
+    stmt = sqlite_insert(model).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=list(key_columns),
+        set_={column: stmt.excluded[column] for column in update_columns}
+    )
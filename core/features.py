@@ -0,0 +1,116 @@
+"""
+모델 입력 feature 생성 모듈
+
+날짜, 해류(방향/속도), 바람(방향/속도) 배열을 core.predict.FEATURE_ORDER 순서의
+N×9 feature 행렬로 한 번에 변환합니다. 단건 예측, 배치 예측, 백필이 모두 이 모듈을 사용합니다.
+"""
+import numpy as np
+
+
+class FeatureBuilder:
+    """날짜/해류/바람 배열을 모델 입력 feature 행렬로 변환합니다."""
+
+    def __init__(self, period: float = 365):
+        """
+        Args:
+            period: 날짜 주기 feature 계산에 사용하는 주기 (학습 시 365 사용)
+        """
+        # 연중 일자(1-366)별 sin/cos 조회 테이블 (인덱스 0은 사용하지 않음)
+        days = np.arange(367, dtype=float)
+        self.day_sin_table = np.sin(2 * np.pi * days / period)
+        self.day_cos_table = np.cos(2 * np.pi * days / period)
+
+    @staticmethod
+    def dayofyear(dates) -> np.ndarray:
+        """
+        날짜 배열의 연중 일자(1-366)를 계산합니다.
+
+        Args:
+            dates: date/datetime 객체, 'YYYY-MM-DD' 문자열 또는 datetime64 배열
+
+        Returns:
+            연중 일자 정수 배열
+        """
+        days = np.asarray(dates, dtype='datetime64[D]').reshape(-1)
+        return (days - days.astype('datetime64[Y]')).astype(np.int64) + 1
+
+    def build(self, dates, current_dir, current_speed, wind_dir, wind_speed) -> np.ndarray:
+        """
+        feature 행렬을 생성합니다.
+
+        Args:
+            dates: 예측 날짜 배열 (길이 N)
+            current_dir: 해류 방향 (도)
+            current_speed: 유속
+            wind_dir: 풍향 (도)
+            wind_speed: 풍속
+
+        Returns:
+            FEATURE_ORDER 순서의 N×9 feature 행렬
+        """
+        current_rad = np.deg2rad(np.asarray(current_dir, dtype=float).reshape(-1))
+        current_speed = np.asarray(current_speed, dtype=float).reshape(-1)
+        wind_rad = np.deg2rad(np.asarray(wind_dir, dtype=float).reshape(-1))
+        wind_speed = np.asarray(wind_speed, dtype=float).reshape(-1)
+
+        return self._assemble(
+            dates,
+            wind_speed=wind_speed,
+            current_speed=current_speed,
+            wind_u=wind_speed * np.cos(wind_rad),
+            wind_v=wind_speed * np.sin(wind_rad),
+            current_u=current_speed * np.cos(current_rad),
+            current_v=current_speed * np.sin(current_rad)
+        )
+
+    def build_from_components(self, dates, current_u, current_v, wind_u, wind_v) -> np.ndarray:
+        """
+        u/v 벡터 성분으로부터 feature 행렬을 생성합니다.
+
+        Args:
+            dates: 예측 날짜 배열 (길이 N)
+            current_u: 해류 벡터 u 성분
+            current_v: 해류 벡터 v 성분
+            wind_u: 바람 벡터 u 성분
+            wind_v: 바람 벡터 v 성분
+
+        Returns:
+            FEATURE_ORDER 순서의 N×9 feature 행렬
+        """
+        current_u = np.asarray(current_u, dtype=float).reshape(-1)
+        current_v = np.asarray(current_v, dtype=float).reshape(-1)
+        wind_u = np.asarray(wind_u, dtype=float).reshape(-1)
+        wind_v = np.asarray(wind_v, dtype=float).reshape(-1)
+
+        return self._assemble(
+            dates,
+            wind_speed=np.hypot(wind_u, wind_v),
+            current_speed=np.hypot(current_u, current_v),
+            wind_u=wind_u,
+            wind_v=wind_v,
+            current_u=current_u,
+            current_v=current_v
+        )
+
+    def _assemble(self, dates, wind_speed, current_speed, wind_u, wind_v, current_u, current_v) -> np.ndarray:
+        """계산된 성분들을 FEATURE_ORDER 순서의 행렬로 배치합니다."""
+        dayofyear = self.dayofyear(dates)
+        if dayofyear.shape[0] == 1 and current_u.shape[0] > 1:
+            # 단일 날짜를 모든 지점에 적용
+            dayofyear = np.repeat(dayofyear, current_u.shape[0])
+
+        features = np.empty((current_u.shape[0], 9), dtype=float)
+        features[:, 0] = dayofyear
+        features[:, 1] = self.day_sin_table[dayofyear]
+        features[:, 2] = self.day_cos_table[dayofyear]
+        features[:, 3] = wind_speed
+        features[:, 4] = current_speed
+        features[:, 5] = wind_u
+        features[:, 6] = wind_v
+        features[:, 7] = current_u
+        features[:, 8] = current_v
+        return features
+
+
+# 공용 FeatureBuilder 인스턴스
+feature_builder = FeatureBuilder()
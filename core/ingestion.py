@@ -0,0 +1,474 @@
+"""
+해변 예측 데이터 수집 파이프라인
+
+해류/풍속/수온 조회 → feature 생성 → 배치 예측 → DB 일괄 upsert를 한 프로세스 안에서 수행합니다.
+API(/v1/trash/beach), 스케줄러(매일 오전 6시), 데이터 생성 스크립트가 모두 같은 파이프라인을 사용합니다.
+
+    UPSTREAM_CONCURRENCY         업스트림 API 동시 요청 수 (기본 8)
+    BEACH_PREDICTION_BATCH_SIZE  예측 결과 upsert 배치 크기 (기본 500)
+    PREDICTION_DB_LOCK           true면 날짜별 계산에 MySQL GET_LOCK 사용 (다중 워커 배포용, 기본 false)
+    PREDICTION_DB_LOCK_TIMEOUT   잠금 대기 시간 (초, 기본 60)
+"""
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from enum import Enum
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal, upsert_statement
+from core.rollups import refresh_rollups
+from core.features import feature_builder
+from core.predict import predict_many
+from fetch import fetchers
+from fetch.client import async_http_client
+from models.beach import Beach
+from models.beach_prediction import BeachPrediction
+
+# 업스트림 API 동시 요청 수 제한
+UPSTREAM_CONCURRENCY = int(os.environ.get('UPSTREAM_CONCURRENCY', 8))
+
+# 예측 결과 upsert 한 문장당 행 수
+BEACH_PREDICTION_BATCH_SIZE = int(os.environ.get('BEACH_PREDICTION_BATCH_SIZE', 500))
+
+# beach_predictions 유니크 키 (uk_beach_date)
+UPSERT_KEY = ("beach_name", "prediction_date")
+
+# 다중 워커 배포에서 날짜별 계산을 MySQL GET_LOCK으로 직렬화
+PREDICTION_DB_LOCK = os.environ.get('PREDICTION_DB_LOCK', 'false').lower() == 'true'
+PREDICTION_DB_LOCK_TIMEOUT = float(os.environ.get('PREDICTION_DB_LOCK_TIMEOUT', 60))
+
+# 날짜별로 진행 중인 예측 계산 (프로세스 내 single-flight)
+_inflight: dict[date, asyncio.Future] = {}
+
+
+class TrashStatus(str, Enum):
+    LOW = "LOW"
+    MEDIUM = "MEDIUM"
+    HIGH = "HIGH"
+
+
+def classify_trash_amount(trash_amount: float) -> TrashStatus:
+    """쓰레기 양에 따른 status 결정"""
+    if trash_amount < 200:
+        return TrashStatus.LOW
+    elif trash_amount < 300:
+        return TrashStatus.MEDIUM
+    else:
+        return TrashStatus.HIGH
+
+
+async def _bounded(semaphore: asyncio.Semaphore, coro):
+    """세마포어로 동시 실행 수를 제한하여 코루틴을 실행합니다."""
+    async with semaphore:
+        return await coro
+
+
+async def fetch_prediction_inputs_async(
+    date_obj: datetime,
+    latitude: float,
+    longitude: float,
+    semaphore: asyncio.Semaphore = None
+) -> tuple[float, float, float, float]:
+    """
+    예측 모델 입력에 필요한 해류와 풍속 데이터를 동시에 조회합니다.
+
+    Args:
+        date_obj: 예측 날짜
+        latitude: 위도
+        longitude: 경도
+        semaphore: 업스트림 동시 요청 수 제한 (미지정시 새로 생성)
+
+    Returns:
+        (current_dir, current_speed, wind_dir, wind_speed) 튜플
+    """
+    semaphore = semaphore or asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+    (current_dir, current_speed), (wind_dir, wind_speed) = await asyncio.gather(
+        _bounded(semaphore, fetchers.fetch_current_async(date_obj, latitude, longitude)),
+        _bounded(semaphore, fetchers.fetch_wind_async(date_obj, latitude, longitude))
+    )
+    return current_dir, current_speed, wind_dir, wind_speed
+
+
+async def fetch_beach_inputs(date_obj: datetime, beaches: list, semaphore: asyncio.Semaphore = None) -> list[tuple]:
+    """
+    모든 해변의 해류/풍속/수온 데이터를 동시에 조회합니다.
+
+    개별 해변의 해류/풍속 조회 실패는 로깅 후 제외하고, 수온 조회 실패는 None으로 처리합니다.
+
+    Args:
+        date_obj: 예측 날짜
+        beaches: Beach 리스트
+        semaphore: 업스트림 동시 요청 수 제한 (미지정시 새로 생성)
+
+    Returns:
+        (beach, inputs, temperature) 튜플 리스트
+    """
+    semaphore = semaphore or asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+
+    async def fetch_one(beach):
+        inputs, temperature = await asyncio.gather(
+            fetch_prediction_inputs_async(date_obj, beach.latitude, beach.longitude, semaphore),
+            _bounded(semaphore, fetchers.fetch_temperature_async(date_obj, beach.latitude, beach.longitude)),
+            return_exceptions=True
+        )
+        if isinstance(inputs, Exception):
+            print(f"해변 {beach.name} 예측 실패: {str(inputs)}")
+            return None
+        if isinstance(temperature, Exception):
+            print(f"수온 데이터 조회 실패 ({beach.name}): {str(temperature)}")
+            temperature = None
+        return beach, inputs, temperature
+
+    results = await asyncio.gather(*(fetch_one(beach) for beach in beaches))
+    return [result for result in results if result is not None]
+
+
+def predict_from_inputs(dates: list, inputs: list[tuple[float, float, float, float]]) -> list[tuple[float, TrashStatus]]:
+    """
+    조회한 해류/풍속 데이터로 feature 행렬을 만들어 한 번의 모델 호출로 예측합니다.
+
+    Args:
+        dates: 예측 날짜 리스트
+        inputs: fetch_prediction_inputs_async 결과 리스트 (dates와 같은 길이)
+
+    Returns:
+        (trash_amount, status) 튜플 리스트
+    """
+    if not inputs:
+        return []
+
+    current_dir, current_speed, wind_dir, wind_speed = np.asarray(inputs, dtype=float).T
+    features = feature_builder.build(dates, current_dir, current_speed, wind_dir, wind_speed)
+
+    trash_amounts = predict_many(os.environ.get('MODEL_PATH'), features)
+    return [(float(amount), classify_trash_amount(amount)) for amount in trash_amounts]
+
+
+async def compute_beach_predictions(
+    target_date: date,
+    beaches: list,
+    date_obj: datetime = None,
+    semaphore: asyncio.Semaphore = None
+) -> list[dict]:
+    """
+    해변 목록의 예측 결과를 계산합니다 (DB에 쓰지 않음).
+
+    Args:
+        target_date: 예측 날짜
+        beaches: Beach 리스트
+        date_obj: 모델 입력에 사용할 일시 (미지정시 target_date 자정)
+        semaphore: 업스트림 동시 요청 수 제한
+
+    Returns:
+        BeachPrediction 컬럼 이름을 키로 하는 dict 리스트 (조회에 실패한 해변은 제외)
+    """
+    date_obj = date_obj or datetime(target_date.year, target_date.month, target_date.day)
+
+    # 모든 해변의 입력 데이터를 동시에 수집 (개별 해변 에러는 로깅만 하고 계속 진행)
+    fetched = await fetch_beach_inputs(date_obj, beaches, semaphore)
+
+    # 모든 해변을 한 번의 모델 호출로 예측
+    predictions = predict_from_inputs(
+        [date_obj] * len(fetched),
+        [inputs for _, inputs, _ in fetched]
+    )
+
+    rows = []
+    for (beach, inputs, temperature), (trash_amount, status) in zip(fetched, predictions):
+        current_dir, current_speed, wind_dir, wind_speed = inputs
+        rows.append({
+            "beach_name": beach.name,
+            "prediction_date": target_date,
+            "latitude": beach.latitude,
+            "longitude": beach.longitude,
+            "trash_amount": trash_amount,
+            "status": status.value,
+            "temperature": temperature,
+            "current_dir": float(current_dir),
+            "current_speed": float(current_speed),
+            "wind_dir": float(wind_dir),
+            "wind_speed": float(wind_speed),
+            "created_at": datetime.utcnow()
+        })
+    return rows
+
+
+def _upsert_statement(dialect_name: str, rows: list[dict]):
+    """(beach_name, prediction_date) 유니크 키 기준 INSERT ... ON DUPLICATE KEY UPDATE 문 생성"""
+    return upsert_statement(BeachPrediction, rows, UPSERT_KEY, dialect_name)
+
+
+def write_beach_predictions(db: Session, rows: list[dict], batch_size: int = None) -> int:
+    """
+    해변 예측 결과를 일괄 upsert합니다 (커밋은 호출자가 수행).
+
+    batch_size건씩 묶어 INSERT ... ON DUPLICATE KEY UPDATE 한 번으로 저장하므로,
+    같은 (해변, 날짜)가 이미 있으면 새 값으로 갱신되고 다른 해변의 데이터는 그대로 유지됩니다.
+    저장한 날짜의 일별/월별 집계(core.rollups)도 같은 트랜잭션에서 갱신합니다.
+
+    Args:
+        db: DB 세션
+        rows: compute_beach_predictions 결과 (여러 날짜가 섞여 있어도 됨)
+        batch_size: 한 문장에 담을 행 수 (미지정시 BEACH_PREDICTION_BATCH_SIZE)
+
+    Returns:
+        저장한 행 수
+    """
+    batch_size = batch_size or BEACH_PREDICTION_BATCH_SIZE
+    dialect_name = db.get_bind().dialect.name
+
+    for i in range(0, len(rows), batch_size):
+        db.execute(_upsert_statement(dialect_name, rows[i:i + batch_size]))
+
+    # 같은 트랜잭션에서 저장한 날짜/월의 집계 갱신
+    refresh_rollups(db, {row["prediction_date"] for row in rows})
+    return len(rows)
+
+
+def prediction_to_row(prediction: BeachPrediction) -> dict:
+    """BeachPrediction 객체를 compute_beach_predictions 결과와 같은 형태의 dict로 변환합니다."""
+    return {
+        column.name: getattr(prediction, column.name)
+        for column in BeachPrediction.__table__.columns
+        if column.name != "id"
+    }
+
+
+def missing_beaches(db: Session, target_date: date, beaches: list) -> list:
+    """DB에 날짜의 예측 데이터가 없는 해변 목록"""
+    cached_names = {
+        name for (name,) in db.query(BeachPrediction.beach_name).filter(
+            BeachPrediction.prediction_date == target_date
+        ).all()
+    }
+    return [beach for beach in beaches if beach.name not in cached_names]
+
+
+@asynccontextmanager
+async def prediction_date_lock(db: Session, target_date: date):
+    """
+    날짜별 예측 계산을 여러 워커/프로세스 사이에서 직렬화하는 MySQL 잠금 (GET_LOCK).
+
+    PREDICTION_DB_LOCK이 꺼져 있거나 MySQL이 아니면 아무것도 하지 않습니다.
+    잠금은 세션과 별도의 커넥션에 잡으며(세션 커밋 후에도 유지), 이벤트 루프를 막지 않도록
+    대기 없이 시도하고 잠시 쉬는 방식으로 기다립니다. 대기 시간을 넘기면 잠금 없이 진행합니다
+    (upsert이므로 중복 계산이 되더라도 데이터는 일관됨).
+
+    Yields:
+        잠금 획득 여부
+    """
+    bind = db.get_bind()
+    if not PREDICTION_DB_LOCK or bind.dialect.name != "mysql":
+        yield False
+        return
+
+    name = f"beach_predictions:{target_date}"
+    conn = bind.connect()
+    acquired = False
+    try:
+        deadline = time.monotonic() + PREDICTION_DB_LOCK_TIMEOUT
+        while True:
+            acquired = conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": name}).scalar() == 1
+            if acquired or time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(0.2)
+        if not acquired:
+            print(f"{target_date} 날짜 잠금 대기 시간 초과 - 잠금 없이 진행")
+        yield acquired
+    finally:
+        if acquired:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": name})
+        conn.close()
+
+
+def _stored_rows(db: Session, target_date: date) -> dict[str, dict]:
+    """DB에 저장된 날짜의 예측 결과 (해변 이름 → dict)"""
+    return {
+        prediction.beach_name: prediction_to_row(prediction)
+        for prediction in db.query(BeachPrediction).filter(
+            BeachPrediction.prediction_date == target_date
+        ).all()
+    }
+
+
+async def _fill_missing_beaches(db: Session, target_date: date, beaches: list, date_obj: datetime = None) -> list[dict]:
+    """누락된 해변을 계산하여 저장하고, beaches 순서의 전체 결과를 반환합니다."""
+    async with prediction_date_lock(db, target_date) as locked:
+        if locked:
+            # 잠금을 기다리는 동안 다른 워커가 저장했을 수 있으므로 새 트랜잭션으로 다시 조회
+            db.commit()
+        cached = _stored_rows(db, target_date)
+        missing = [beach for beach in beaches if beach.name not in cached]
+
+        if missing:
+            print(f"API 호출하여 {target_date} 날짜 데이터 생성 (누락된 해변 {len(missing)}/{len(beaches)}개)")
+            rows = await compute_beach_predictions(target_date, missing, date_obj)
+            if rows:
+                try:
+                    write_beach_predictions(db, rows)
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+            cached.update((row["beach_name"], row) for row in rows)
+
+    return [cached[beach.name] for beach in beaches if beach.name in cached]
+
+
+async def ensure_beach_predictions(
+    db: Session,
+    target_date: date,
+    beaches: list,
+    date_obj: datetime = None
+) -> list[dict]:
+    """
+    날짜의 해변 예측 결과를 반환합니다. DB에 없는 해변만 계산하여 저장한 뒤 합칩니다.
+
+    저장된 해변은 그대로 사용하고 누락된 해변만 동시에 조회/예측하므로,
+    업스트림 조회에 실패한 해변이 있어도 다음 요청에서는 그 해변만 다시 계산합니다.
+    같은 날짜에 대한 동시 요청은 하나의 계산 결과를 함께 기다립니다 (프로세스 내 single-flight,
+    PREDICTION_DB_LOCK 설정시 워커 간에는 MySQL 잠금).
+
+    Args:
+        db: DB 세션
+        target_date: 예측 날짜
+        beaches: Beach 리스트
+        date_obj: 모델 입력에 사용할 일시 (미지정시 target_date 자정)
+
+    Returns:
+        beaches 순서의 예측 결과 dict 리스트 (계산에 실패한 해변은 제외)
+    """
+    cached = _stored_rows(db, target_date)
+    if all(beach.name in cached for beach in beaches):
+        print(f"DB에서 {target_date} 날짜 데이터 조회")
+        return [cached[beach.name] for beach in beaches]
+
+    loop = asyncio.get_running_loop()
+    future = _inflight.get(target_date)
+    if future is not None and future.get_loop() is loop:
+        print(f"{target_date} 날짜 데이터 생성 대기 (진행 중인 요청)")
+        return list(await asyncio.shield(future))
+
+    future = loop.create_future()
+    _inflight[target_date] = future
+    try:
+        rows = await _fill_missing_beaches(db, target_date, beaches, date_obj)
+        future.set_result(rows)
+        return rows
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()
+        raise
+    finally:
+        if _inflight.get(target_date) is future:
+            del _inflight[target_date]
+
+
+async def ingest_date(db: Session, target_date: date, beaches: list = None, semaphore: asyncio.Semaphore = None) -> int:
+    """
+    하루치 해변 예측 데이터를 계산하여 저장합니다.
+
+    Args:
+        db: DB 세션
+        target_date: 예측 날짜
+        beaches: Beach 리스트 (미지정시 DB에서 조회)
+        semaphore: 업스트림 동시 요청 수 제한
+
+    Returns:
+        저장한 해변 수
+    """
+    beaches = beaches if beaches is not None else db.query(Beach).all()
+    if not beaches:
+        raise Exception("DB에 해변 정보가 없습니다. init_db.py를 실행하여 초기 데이터를 생성하세요.")
+
+    rows = await compute_beach_predictions(target_date, beaches, semaphore=semaphore)
+    if not rows:
+        raise Exception("모든 해변 예측에 실패했습니다")
+
+    try:
+        write_beach_predictions(db, rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(rows)
+
+
+def _date_range(start_date: date, end_date: date) -> list[date]:
+    return [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+
+
+async def ingest_range(start_date: date, end_date: date, skip_complete: bool = True, dates: list[date] = None) -> dict:
+    """
+    날짜 범위의 해변 예측 데이터를 순서대로 수집합니다.
+
+    날짜 하나가 실패해도 로깅 후 다음 날짜를 계속 진행합니다.
+
+    Args:
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        skip_complete: DB에 저장된 해변은 건너뜀 (모든 해변이 있는 날짜는 날짜 전체를 건너뜀)
+        dates: 수집할 날짜 목록 (지정시 start_date/end_date 대신 사용)
+
+    Returns:
+        {"success", "skipped", "failed", "rows", "elapsed"} 요약
+    """
+    summary = {"success": 0, "skipped": 0, "failed": 0, "rows": 0, "elapsed": 0.0}
+    started = time.perf_counter()
+    semaphore = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+
+    db = SessionLocal()
+    try:
+        beaches = db.query(Beach).all()
+
+        for target_date in dates if dates is not None else _date_range(start_date, end_date):
+            try:
+                # 같은 날짜를 계산 중인 다른 워커(API 요청 등)와 겹치지 않도록 잠금
+                async with prediction_date_lock(db, target_date) as locked:
+                    if locked:
+                        db.commit()
+
+                    # 저장된 해변은 다시 계산하지 않음
+                    targets = missing_beaches(db, target_date, beaches) if skip_complete else beaches
+                    if not targets:
+                        print(f"[{target_date}] 이미 저장된 데이터 - 건너뜀")
+                        summary["skipped"] += 1
+                        continue
+
+                    count = await ingest_date(db, target_date, targets, semaphore)
+                print(f"[{target_date}] ✓ 성공 ({count}개 해변)")
+                summary["success"] += 1
+                summary["rows"] += count
+            except Exception as e:
+                print(f"[{target_date}] ✗ 오류: {str(e)}")
+                summary["failed"] += 1
+    finally:
+        db.close()
+
+    summary["elapsed"] = time.perf_counter() - started
+    return summary
+
+
+def run_ingestion(start_date: date, end_date: date, skip_complete: bool = True, dates: list[date] = None) -> dict:
+    """
+    ingest_range를 새 이벤트 루프에서 실행합니다 (스케줄러 스레드, CLI 스크립트용).
+
+    Returns:
+        ingest_range 요약
+    """
+    async def run():
+        try:
+            return await ingest_range(start_date, end_date, skip_complete, dates)
+        finally:
+            # 이 루프에서 만든 커넥션 풀 정리
+            await async_http_client.aclose()
+
+    return asyncio.run(run())
@@ -1,64 +1,160 @@
 import joblib
 import numpy as np
-from typing import Optional
-
-
-def predict_by_vector(
-    model_path: str,
-    dayofyear: int,
-    day_sin: float,
-    day_cos: float,
-    wind_speed: float,
-    current_speed: float,
-    wind_u: float,
-    wind_v: float,
-    current_u: float,
-    current_v: float
-) -> float:
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class LoadedModel:
+    """레지스트리에 적재된 모델 정보"""
+    path: str
+    mtime_ns: int
+    size: int
+    model: Any
+    load_seconds: float
+    loaded_at: float
+    memory_bytes: Optional[int] = None
+
+    def estimate_memory_bytes(self) -> int:
+        """모델의 메모리 사용량 추정치 (직렬화 크기 기준, 최초 1회만 계산)"""
+        if self.memory_bytes is None:
+            self.memory_bytes = len(pickle.dumps(self.model, protocol=pickle.HIGHEST_PROTOCOL))
+        return self.memory_bytes
+
+
+class ModelRegistry:
     """
-    학습된 모델을 사용하여 쓰레기 양을 예측합니다.
-    
+    모델 파일을 프로세스 단위로 한 번만 로드해 공유하는 레지스트리
+
+    모델은 (경로, mtime, 파일 크기)로 식별되며, 파일이 교체되면 다음 조회 시 다시 로드합니다.
+    반환되는 모델은 모든 요청이 공유하므로 읽기 전용(predict 호출)으로만 사용해야 합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[str, LoadedModel] = {}
+
+    def get(self, model_path: str) -> Any:
+        """
+        모델을 반환합니다. 캐시에 없거나 파일이 변경된 경우에만 디스크에서 로드합니다.
+
+        Args:
+            model_path: 모델 파일 경로
+
+        Returns:
+            로드된 모델 객체
+        """
+        if not model_path:
+            raise Exception("모델 파일 경로가 지정되지 않았습니다 (MODEL_PATH)")
+
+        path = os.path.abspath(model_path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise Exception(f"모델 파일을 찾을 수 없습니다: {model_path}")
+
+        entry = self._entries.get(path)
+        if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry.model
+
+        with self._lock:
+            # 다른 스레드가 먼저 로드했는지 다시 확인
+            entry = self._entries.get(path)
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                return entry.model
+
+            start = time.perf_counter()
+            try:
+                model = joblib.load(path)
+            except FileNotFoundError:
+                raise Exception(f"모델 파일을 찾을 수 없습니다: {model_path}")
+            except Exception as e:
+                raise Exception(f"모델 로드 실패: {str(e)}")
+
+            self._entries[path] = LoadedModel(
+                path=path,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                model=model,
+                load_seconds=time.perf_counter() - start,
+                loaded_at=time.time()
+            )
+            print(f"모델 로드 완료: {path} ({self._entries[path].load_seconds:.3f}s)")
+            return model
+
+    def stats(self) -> list[dict]:
+        """적재된 모델별 로드 시간과 메모리 사용량을 반환합니다."""
+        return [
+            {
+                "path": entry.path,
+                "file_size_bytes": entry.size,
+                "memory_bytes": entry.estimate_memory_bytes(),
+                "load_seconds": round(entry.load_seconds, 4),
+                "loaded_at": entry.loaded_at
+            }
+            for entry in list(self._entries.values())
+        ]
+
+    def clear(self):
+        """적재된 모델을 모두 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+
+
+# 프로세스 전역 모델 레지스트리
+model_registry = ModelRegistry()
+
+# 모델 학습 시 사용한 feature 순서
+FEATURE_ORDER = [
+    'dayofyear',
+    '일자_sin',
+    '일자_cos',
+    '풍속',
+    '유속',
+    'wind_u',
+    'wind_v',
+    'current_u',
+    'current_v'
+]
+
+
+def predict_many(model_path: str, features) -> np.ndarray:
+    """
+    여러 지점의 쓰레기 양을 한 번의 model.predict 호출로 예측합니다.
+
     Args:
         model_path: 모델 파일 경로
-        dayofyear: 연중 몇 번째 날인지 (1-365)
-        day_sin: sin(2π * dayofyear / 365)
-        day_cos: cos(2π * dayofyear / 365)
-        wind_speed: 풍속
-        current_speed: 유속
-        wind_u: 바람 벡터 u 성분
-        wind_v: 바람 벡터 v 성분
-        current_u: 해류 벡터 u 성분
-        current_v: 해류 벡터 v 성분
-    
+        features: FEATURE_ORDER 순서의 N×9 행렬, 또는 FEATURE_ORDER 이름을 키로 하는 열 단위 dict
+
     Returns:
-        예측된 쓰레기 양
+        길이 N의 예측값 배열
     """
-    # 모델 로드
-    try:
-        model = joblib.load(model_path)
-    except FileNotFoundError:
-        raise Exception(f"모델 파일을 찾을 수 없습니다: {model_path}")
-    except Exception as e:
-        raise Exception(f"모델 로드 실패: {str(e)}")
-    
-    # feature_order에 맞춰 feature 준비
-    features = np.array([[
-        dayofyear,      # 'dayofyear'
-        day_sin,        # '일자_sin'
-        day_cos,        # '일자_cos'
-        wind_speed,     # '풍속'
-        current_speed,  # '유속'
-        wind_u,         # 'wind_u'
-        wind_v,         # 'wind_v'
-        current_u,      # 'current_u'
-        current_v       # 'current_v'
-    ]])
-
-    print(f'features: {features}')
-    
+    if isinstance(features, dict):
+        missing = [name for name in FEATURE_ORDER if name not in features]
+        if missing:
+            raise Exception(f"feature가 누락되었습니다: {', '.join(missing)}")
+        matrix = np.column_stack([np.asarray(features[name], dtype=float) for name in FEATURE_ORDER])
+    else:
+        matrix = np.asarray(features, dtype=float)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+
+    if matrix.ndim != 2 or matrix.shape[1] != len(FEATURE_ORDER):
+        raise Exception(f"feature 행렬 형태가 올바르지 않습니다: {matrix.shape} (N×{len(FEATURE_ORDER)} 필요)")
+
+    if matrix.shape[0] == 0:
+        return np.empty(0, dtype=float)
+
+    # 모델 조회 (레지스트리에 캐시된 모델 재사용)
+    model = model_registry.get(model_path)
+
     # 예측 수행
     try:
-        prediction = model.predict(features)
-        return float(prediction[0])
+        return np.asarray(model.predict(matrix), dtype=float).reshape(-1)
     except Exception as e:
         raise Exception(f"예측 실패: {str(e)}")
+
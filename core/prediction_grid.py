@@ -0,0 +1,332 @@
+"""
+제주 연안 예측 격자 타일
+
+지도 타일(z/x/y, Web Mercator) 영역을 위경도 격자로 샘플링하여, 보간한 해류장과 관측소 바람을
+입력으로 한 번의 배치 예측을 수행하고 결과를 gzip 압축 JSON 타일로 저장합니다.
+한 번 계산한 타일은 메모리(LRU)와 디스크에서 바로 제공되므로 지도 이동 시 모델/업스트림을 호출하지 않습니다.
+
+    PREDICTION_GRID_SAMPLES   타일 한 변의 샘플 수 (기본 16, 타일당 최대 16×16 지점)
+    PREDICTION_GRID_BOUNDS    예측 영역 "min_lat,min_lon,max_lat,max_lon" (기본 제주 연안)
+    PREDICTION_GRID_METHOD    해류 보간 방식 (idw | bilinear | nearest, 기본 bilinear)
+    PREDICTION_TILE_DIR       타일 저장 디렉토리 (미설정시 메모리 캐시만 사용)
+    PREDICTION_TILE_TODAY_TTL 오늘 날짜 타일의 유효 시간 (초, 기본 600)
+    PREDICTION_PRECOMPUTE_ZOOMS  매일 수집 후 미리 계산할 줌 레벨 (기본 "10,11,12", 빈 값이면 미리 계산 안 함)
+
+미리 계산한 오늘 날짜 타일은 TTL과 관계없이 그날 자정까지 메모리에서 제공합니다
+(해변 예측과 같이 하루 한 번 수집한 입력을 기준으로 함).
+"""
+import asyncio
+import gzip
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import numpy as np
+from dotenv import load_dotenv
+
+from core.features import feature_builder
+from core.predict import predict_many
+from fetch import fetchers
+from fetch.client import async_http_client
+from utils import location
+
+load_dotenv()
+
+GRID_SAMPLES = int(os.environ.get("PREDICTION_GRID_SAMPLES", 16))
+GRID_BOUNDS = tuple(
+    float(value) for value in os.environ.get("PREDICTION_GRID_BOUNDS", "33.05,126.05,33.65,127.0").split(",")
+)
+GRID_METHOD = os.environ.get("PREDICTION_GRID_METHOD", "bilinear")
+PRECOMPUTE_ZOOMS = [
+    int(value) for value in os.environ.get("PREDICTION_PRECOMPUTE_ZOOMS", "10,11,12").split(",") if value.strip()
+]
+
+# 지원하는 줌 레벨 (너무 넓은 타일은 샘플 간격이 커서 의미가 없음)
+MIN_ZOOM = 8
+MAX_ZOOM = 16
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """
+    Web Mercator 타일의 위경도 범위를 계산합니다.
+
+    Returns:
+        (min_lat, min_lon, max_lat, max_lon)
+    """
+    n = 2 ** z
+    min_lon = x / n * 360.0 - 180.0
+    max_lon = (x + 1) / n * 360.0 - 180.0
+    max_lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / n))))
+    min_lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (y + 1) / n))))
+    return min_lat, min_lon, max_lat, max_lon
+
+
+def tiles_for_bounds(z: int, bounds: tuple[float, float, float, float] = GRID_BOUNDS) -> list[tuple[int, int]]:
+    """위경도 범위를 덮는 z 레벨 타일 (x, y) 목록"""
+    min_lat, min_lon, max_lat, max_lon = bounds
+    n = 2 ** z
+
+    def to_tile(lat, lon):
+        x = int((lon + 180.0) / 360.0 * n)
+        y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n)
+        return x, y
+
+    min_x, min_y = to_tile(max_lat, min_lon)
+    max_x, max_y = to_tile(min_lat, max_lon)
+    return [(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)]
+
+
+def sample_points(z: int, x: int, y: int, samples: int = GRID_SAMPLES) -> tuple[np.ndarray, np.ndarray]:
+    """
+    타일 안의 격자 샘플 지점 (셀 중심) 중 예측 영역 안에 있는 지점을 반환합니다.
+
+    Returns:
+        (lats, lons) 배열
+    """
+    min_lat, min_lon, max_lat, max_lon = tile_bounds(z, x, y)
+    lat_step = (max_lat - min_lat) / samples
+    lon_step = (max_lon - min_lon) / samples
+    lats, lons = np.meshgrid(
+        min_lat + lat_step * (np.arange(samples) + 0.5),
+        min_lon + lon_step * (np.arange(samples) + 0.5),
+        indexing="ij"
+    )
+    lats, lons = lats.ravel(), lons.ravel()
+
+    area_min_lat, area_min_lon, area_max_lat, area_max_lon = GRID_BOUNDS
+    inside = (
+        (lats >= area_min_lat) & (lats <= area_max_lat)
+        & (lons >= area_min_lon) & (lons <= area_max_lon)
+    )
+    return lats[inside], lons[inside]
+
+
+async def _current_components(date_obj: datetime, lats: np.ndarray, lons: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """샘플 지점의 해류 u/v (1°×1° 해류 타일별로 한 번씩 조회 후 보간)"""
+    current_u = np.empty(lats.shape[0])
+    current_v = np.empty(lats.shape[0])
+
+    tile_keys = np.floor(lats).astype(int) * 1000 + np.floor(lons).astype(int)
+    groups = [np.flatnonzero(tile_keys == key) for key in np.unique(tile_keys)]
+    fields = await asyncio.gather(*(
+        fetchers.fetch_current_field_async(date_obj, lats[group[0]], lons[group[0]])
+        for group in groups
+    ))
+
+    for group, field in zip(groups, fields):
+        current_u[group], current_v[group] = field.interpolate(lats[group], lons[group], method=GRID_METHOD)
+    return current_u, current_v
+
+
+async def _wind_components(date_obj: datetime, lats: np.ndarray, lons: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """샘플 지점의 바람 u/v (가장 가까운 관측소 값, 관측소별로 한 번씩 조회)"""
+    station_indices = location.find_nearest_location_indices(lats, lons)
+    stations = np.unique(station_indices)
+    winds = await asyncio.gather(*(
+        fetchers.fetch_wind_async(
+            date_obj,
+            location.OBSERVATORY_LOCATIONS[i].latitude,
+            location.OBSERVATORY_LOCATIONS[i].longitude
+        )
+        for i in stations
+    ))
+
+    wind_dir = np.empty(len(location.OBSERVATORY_LOCATIONS))
+    wind_speed = np.empty(len(location.OBSERVATORY_LOCATIONS))
+    for i, (direction, speed) in zip(stations, winds):
+        wind_dir[i] = direction
+        wind_speed[i] = speed
+
+    rad = np.deg2rad(wind_dir[station_indices])
+    speed = wind_speed[station_indices]
+    return speed * np.cos(rad), speed * np.sin(rad)
+
+
+async def compute_tile(target_date: date, z: int, x: int, y: int) -> dict:
+    """
+    타일 하나의 예측 격자를 계산합니다.
+
+    Returns:
+        열 단위 예측 결과 dict (lats, lons, trash_amount)
+    """
+    lats, lons = sample_points(z, x, y)
+    result = {
+        "date": target_date.strftime("%Y-%m-%d"),
+        "z": z,
+        "x": x,
+        "y": y,
+        "bounds": [round(value, 6) for value in tile_bounds(z, x, y)],
+        "lats": [],
+        "lons": [],
+        "trash_amount": []
+    }
+    if lats.shape[0] == 0:
+        return result
+
+    date_obj = datetime(target_date.year, target_date.month, target_date.day)
+    (current_u, current_v), (wind_u, wind_v) = await asyncio.gather(
+        _current_components(date_obj, lats, lons),
+        _wind_components(date_obj, lats, lons)
+    )
+
+    features = feature_builder.build_from_components([date_obj], current_u, current_v, wind_u, wind_v)
+    # 모델 추론은 스레드에서 실행 (첫 타일 계산/미리 계산이 다른 요청을 막지 않도록)
+    trash_amounts = await asyncio.to_thread(predict_many, os.environ.get("MODEL_PATH"), features)
+
+    result["lats"] = np.round(lats, 5).tolist()
+    result["lons"] = np.round(lons, 5).tolist()
+    result["trash_amount"] = np.round(trash_amounts, 2).tolist()
+    return result
+
+
+class TileStore:
+    """gzip 압축 타일 저장소 (메모리 LRU + 디스크)"""
+
+    def __init__(self, directory: str = None, max_entries: int = 1024, today_ttl: float = None):
+        self.directory = directory if directory is not None else os.environ.get("PREDICTION_TILE_DIR")
+        self.max_entries = max_entries
+        self.today_ttl = today_ttl if today_ttl is not None else float(os.environ.get("PREDICTION_TILE_TODAY_TTL", 600))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[bytes, Optional[float]]] = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Future] = {}
+
+    def _path(self, key: tuple) -> str:
+        target_date, z, x, y = key
+        return os.path.join(self.directory, target_date.strftime("%Y-%m-%d"), str(z), str(x), f"{y}.json.gz")
+
+    def _expires_at(self, target_date: date, created_at: float, pinned: bool = False) -> Optional[float]:
+        # 지난 날짜 타일은 입력 데이터가 바뀌지 않으므로 영구 보관
+        if target_date < date.today():
+            return None
+        # 미리 계산한 타일은 해당 날짜가 끝날 때까지 유지
+        if pinned:
+            return datetime.combine(target_date + timedelta(days=1), datetime.min.time()).timestamp()
+        return created_at + self.today_ttl
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        """저장된 타일 (gzip bytes). 없거나 만료된 경우 None"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                content, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    return content
+                del self._entries[key]
+
+        if self.directory:
+            path = self._path(key)
+            if os.path.exists(path):
+                expires_at = self._expires_at(key[0], os.path.getmtime(path))
+                if expires_at is None or expires_at > now:
+                    with open(path, "rb") as f:
+                        content = f.read()
+                    self._put_memory(key, content, expires_at)
+                    return content
+        return None
+
+    def set(self, key: tuple, content: bytes, pinned: bool = False):
+        """타일을 저장합니다 (pinned: 미리 계산한 타일, 메모리에서 그날 자정까지 유지)."""
+        self._put_memory(key, content, self._expires_at(key[0], time.time(), pinned))
+        if self.directory:
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+    def _put_memory(self, key: tuple, content: bytes, expires_at: Optional[float]):
+        with self._lock:
+            self._entries[key] = (content, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self, target_date: date, z: int, x: int, y: int, refresh: bool = False, pinned: bool = False
+    ) -> bytes:
+        """
+        타일을 반환합니다. 없으면 계산하여 저장합니다.
+
+        같은 타일에 대한 동시 요청은 하나의 계산 결과를 함께 기다립니다.
+
+        Args:
+            refresh: 저장된 타일이 있어도 다시 계산
+            pinned: 계산한 타일을 그날 자정까지 유지 (미리 계산용)
+        """
+        key = (target_date, z, x, y)
+        if not refresh:
+            content = self.get(key)
+            if content is not None:
+                return content
+
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(key)
+        if future is not None and future.get_loop() is loop:
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            tile = await compute_tile(target_date, z, x, y)
+            content = gzip.compress(json.dumps(tile, separators=(",", ":")).encode("utf-8"))
+            self.set(key, content, pinned)
+            future.set_result(content)
+            return content
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+
+# 프로세스 전역 타일 저장소
+tile_store = TileStore()
+
+
+async def precompute_tiles(target_date: date, zooms: list[int] = None) -> int:
+    """
+    예측 영역을 덮는 모든 타일을 새로 계산하여 저장합니다 (첫 지도 이동이 계산을 기다리지 않도록).
+
+    Args:
+        target_date: 예측 날짜
+        zooms: 줌 레벨 목록 (미지정시 PRECOMPUTE_ZOOMS)
+
+    Returns:
+        계산한 타일 수
+    """
+    count = 0
+    for z in (PRECOMPUTE_ZOOMS if zooms is None else zooms):
+        for x, y in tiles_for_bounds(z):
+            await tile_store.get_or_compute(target_date, z, x, y, refresh=True, pinned=True)
+            count += 1
+    return count
+
+
+def run_precompute_tiles(target_date: date, zooms: list[int] = None) -> int:
+    """
+    precompute_tiles를 새 이벤트 루프에서 실행합니다 (스케줄러 스레드용).
+
+    Returns:
+        계산한 타일 수
+    """
+    async def run():
+        try:
+            return await precompute_tiles(target_date, zooms)
+        finally:
+            # 이 루프에서 만든 커넥션 풀 정리
+            await async_http_client.aclose()
+
+    return asyncio.run(run())
@@ -0,0 +1,128 @@
+"""
+보고서 렌더링용 프로세스 풀
+
+PDF 생성(ReportLab)은 CPU를 오래 사용하는 동기 작업이라 이벤트 루프에서 실행하면
+렌더링하는 동안 같은 워커의 다른 요청(헬스 체크 포함)이 모두 멈춥니다.
+RenderPool은 작업을 별도 프로세스에서 실행하고, 대기 중인 작업 수와 작업별 대기 시간을 제한합니다.
+
+    REPORT_RENDER_WORKERS  렌더링 프로세스 수 (기본 2)
+    REPORT_RENDER_QUEUE    실행 중인 작업 외에 대기할 수 있는 작업 수 (기본 4, 초과시 RenderPoolBusy)
+    REPORT_RENDER_TIMEOUT  작업 하나의 최대 대기 시간 (초, 기본 60, 초과시 RenderTimeout)
+
+작업 함수와 인자는 프로세스 경계를 넘어 pickle되므로 모듈 최상위 함수와 dict/list 같은 단순 데이터만 전달합니다.
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+from core.report_assets import load_report_assets
+
+REPORT_RENDER_WORKERS = int(os.environ.get("REPORT_RENDER_WORKERS", 2))
+REPORT_RENDER_QUEUE = int(os.environ.get("REPORT_RENDER_QUEUE", 4))
+REPORT_RENDER_TIMEOUT = float(os.environ.get("REPORT_RENDER_TIMEOUT", 60))
+
+
+class RenderPoolBusy(Exception):
+    """대기 중인 렌더링 작업이 한도를 넘은 경우"""
+
+
+class RenderTimeout(Exception):
+    """렌더링이 제한 시간 안에 끝나지 않은 경우"""
+
+
+class RenderPool:
+    """작업 수가 제한된 ProcessPoolExecutor (start() 또는 첫 작업 제출 시 생성)"""
+
+    def __init__(
+        self,
+        workers: int = None,
+        max_queue: int = None,
+        timeout: float = None,
+        initializer: Optional[Callable] = None
+    ):
+        """
+        Args:
+            workers: 프로세스 수 (미지정시 REPORT_RENDER_WORKERS)
+            max_queue: 대기 가능한 작업 수 (미지정시 REPORT_RENDER_QUEUE)
+            timeout: 작업별 최대 대기 시간 (초, 미지정시 REPORT_RENDER_TIMEOUT)
+            initializer: 각 프로세스 시작 시 한 번 실행할 함수
+        """
+        self.workers = workers or REPORT_RENDER_WORKERS
+        self.max_queue = max_queue if max_queue is not None else REPORT_RENDER_QUEUE
+        self.timeout = timeout or REPORT_RENDER_TIMEOUT
+        self.initializer = initializer
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """실행 중이거나 대기 중인 작업 수"""
+        return self._pending
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # API 서버 프로세스에는 스케줄러/HTTP 클라이언트 스레드가 있으므로 fork 대신 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer
+            )
+        return self._executor
+
+    def start(self):
+        """
+        프로세스를 미리 띄웁니다 (앱 시작 시 호출).
+
+        각 프로세스는 시작할 때 initializer(보고서 리소스 로드)를 실행하므로 첫 렌더링 요청이 기다리지 않습니다.
+        """
+        executor = self._get_executor()
+        for _ in range(self.workers):
+            executor.submit(os.getpid)
+
+    def _release(self, _future):
+        with self._lock:
+            self._pending -= 1
+
+    async def submit(self, fn: Callable, *args):
+        """
+        작업을 프로세스 풀에서 실행하고 결과를 기다립니다.
+
+        제한 시간을 넘기면 RenderTimeout을 발생시키지만, 이미 시작된 작업은 끝날 때까지
+        프로세스를 사용하므로 그동안 대기 한도에 계속 포함됩니다.
+
+        Raises:
+            RenderPoolBusy: 실행 중 + 대기 중인 작업이 workers + max_queue개인 경우
+            RenderTimeout: timeout 안에 끝나지 않은 경우
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                raise RenderPoolBusy(f"보고서 생성 요청이 많습니다 (처리 중 {self._pending}건)")
+            self._pending += 1
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            # 아직 시작하지 않은 작업이면 취소됨
+            future.cancel()
+            raise RenderTimeout(f"보고서 생성 시간이 {self.timeout:.0f}초를 초과했습니다")
+
+    def shutdown(self):
+        """프로세스 풀 종료 (대기 중인 작업은 취소)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 렌더링 프로세스는 시작할 때 폰트/로고/스타일을 한 번 불러옴
+report_render_pool = RenderPool(initializer=load_report_assets)
@@ -0,0 +1,234 @@
+"""
+보고서(ReportLab) 정적 리소스 관리
+
+한글 폰트 등록, 로고 이미지 축소, ParagraphStyle/TableStyle 생성을 프로세스마다 한 번만 수행합니다.
+렌더링 프로세스(core.render_pool)는 시작할 때 load_report_assets로 미리 불러오고,
+create_pdf_report는 데이터에 따라 달라지는 요소(문단, 차트, 표 내용)만 만듭니다.
+"""
+import os
+import threading
+import time
+from io import BytesIO
+from typing import Optional
+
+from PIL import Image as PILImage
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import Image, TableStyle
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+FONT_DIR = os.path.join(PROJECT_ROOT, 'fonts')
+LOGO_PATH = os.path.join(PROJECT_ROOT, 'resources', 'Emblem_of_the_Government_of_the_Republic_of_Korea.png')
+
+# 로고 출력 크기와 미리 축소할 해상도
+LOGO_SIZE = 15*mm
+LOGO_DPI = 300
+
+
+class ReportAssets:
+    """폰트, 로고, 스타일을 한 번 불러와 보관하는 리소스 관리자"""
+
+    def __init__(self, font_dir: str = FONT_DIR, logo_paths: tuple = (LOGO_PATH,)):
+        self.font_dir = font_dir
+        self.logo_paths = logo_paths
+        self.font = 'Helvetica'
+        self.bold_font = 'Helvetica'
+        self.styles: dict[str, ParagraphStyle] = {}
+        self.table_styles: dict[str, TableStyle] = {}
+        self.logos: dict[str, bytes] = {}  # 경로 -> 축소한 PNG
+        self.timings: dict[str, float] = {}  # 단계별 로드 시간 (초)
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def load(self) -> "ReportAssets":
+        """리소스를 불러옵니다 (이미 불러왔으면 바로 반환)."""
+        if self.loaded:
+            return self
+
+        with self._lock:
+            if self.loaded:
+                return self
+
+            started = time.perf_counter()
+            self._register_fonts()
+            self.timings["fonts"] = time.perf_counter() - started
+
+            step = time.perf_counter()
+            for path in self.logo_paths:
+                self._load_logo(path)
+            self.timings["logos"] = time.perf_counter() - step
+
+            step = time.perf_counter()
+            self._build_styles()
+            self.timings["styles"] = time.perf_counter() - step
+
+            self.timings["total"] = time.perf_counter() - started
+            self.loaded = True
+
+        print(
+            f"보고서 리소스 로드 완료 (pid {os.getpid()}): "
+            + ", ".join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in self.timings.items())
+        )
+        return self
+
+    def _register_fonts(self):
+        """한글 폰트 등록 (NotoSansKR 폰트 사용, 실패 시 기본 폰트)"""
+        font_path = os.path.join(self.font_dir, 'NotoSansKR-Regular.ttf')
+        bold_font_path = os.path.join(self.font_dir, 'NotoSansKR-Bold.ttf')
+        try:
+            if not os.path.exists(font_path):
+                raise FileNotFoundError(f"폰트 파일을 찾을 수 없습니다: {font_path}")
+
+            if 'Korean' not in pdfmetrics.getRegisteredFontNames():
+                pdfmetrics.registerFont(TTFont('Korean', font_path))
+            self.font = self.bold_font = 'Korean'
+
+            # Bold 폰트도 등록 (있는 경우)
+            if os.path.exists(bold_font_path):
+                if 'Korean-Bold' not in pdfmetrics.getRegisteredFontNames():
+                    pdfmetrics.registerFont(TTFont('Korean-Bold', bold_font_path))
+                self.bold_font = 'Korean-Bold'
+        except Exception as e:
+            print(f"폰트 등록 실패: {e}")
+            self.font = self.bold_font = 'Helvetica'
+
+    def _load_logo(self, path: str):
+        """로고를 출력 크기(LOGO_SIZE, LOGO_DPI)로 축소하여 PNG로 보관"""
+        if not os.path.exists(path):
+            return
+        try:
+            pixels = int(round(LOGO_SIZE / 72 * LOGO_DPI))
+            with PILImage.open(path) as image:
+                image.thumbnail((pixels, pixels), PILImage.LANCZOS)
+                buffer = BytesIO()
+                image.save(buffer, format='PNG', optimize=True)
+            self.logos[path] = buffer.getvalue()
+        except Exception as e:
+            print(f"로고 이미지 로드 실패: {e}")
+
+    def logo(self, path: str = LOGO_PATH, width: float = LOGO_SIZE, height: float = LOGO_SIZE) -> Optional[Image]:
+        """축소해 둔 로고 이미지 flowable (없으면 None)"""
+        if path not in self.logos:
+            self._load_logo(path)
+        content = self.logos.get(path)
+        if content is None:
+            return None
+        return Image(BytesIO(content), width=width, height=height)
+
+    def _build_styles(self):
+        """문단/표 스타일 생성"""
+        styles = getSampleStyleSheet()
+        font = self.font
+
+        self.styles = {
+            # 제목
+            'title': ParagraphStyle(
+                'CustomTitle',
+                parent=styles['Heading1'],
+                fontName=font,
+                fontSize=20,
+                textColor=colors.HexColor('#1a1a1a'),
+                alignment=TA_CENTER,
+                spaceAfter=2*mm
+            ),
+            # 부제목
+            'subtitle': ParagraphStyle(
+                'CustomSubtitle',
+                parent=styles['Normal'],
+                fontName=font,
+                fontSize=14,
+                textColor=colors.HexColor('#666666'),
+                alignment=TA_CENTER,
+                spaceAfter=3*mm
+            ),
+            # 섹션 제목
+            'section_title': ParagraphStyle(
+                'SectionTitle',
+                parent=styles['Heading2'],
+                fontName=self.bold_font,
+                fontSize=14,
+                textColor=colors.HexColor('#1a1a1a'),
+                spaceAfter=2*mm,
+                spaceBefore=4*mm
+            ),
+            # 본문
+            'body': ParagraphStyle(
+                'CustomBody',
+                parent=styles['Normal'],
+                fontName=font,
+                fontSize=10,
+                textColor=colors.HexColor('#333333'),
+                leading=14
+            ),
+            # 헤더 (로고 옆 기관명 / 발행 연도)
+            'org': ParagraphStyle('OrgStyle', alignment=TA_LEFT, fontName=font),
+            'year': ParagraphStyle(
+                'YearStyle', alignment=TA_RIGHT, fontName=font, textColor=colors.grey, wordWrap='LTR'
+            ),
+            # 헤더 (로고 없을 때)
+            'org_header': ParagraphStyle(
+                'OrgHeader',
+                parent=styles['Normal'],
+                fontName=font,
+                fontSize=9,
+                alignment=TA_RIGHT,
+                textColor=colors.grey
+            ),
+        }
+
+        self.table_styles = {
+            # 로고 + 기관명 헤더
+            'header': TableStyle([
+                ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+                ('ALIGN', (2, 0), (2, 0), 'LEFT'),
+                ('ALIGN', (2, 1), (2, 1), 'RIGHT'),
+                ('VALIGN', (1, 0), (2, 0), 'MIDDLE'),
+                ('LEFTPADDING', (0, 0), (-1, -1), 0),
+                ('LEFTPADDING', (2, 0), (2, 0), 3*mm),
+                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+                ('TOPPADDING', (0, 0), (-1, -1), 0),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+            ]),
+            # 위험 지역 현황 표
+            'risk': TableStyle([
+                # 헤더 스타일
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4A90E2')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('FONTNAME', (0, 0), (-1, 0), font),
+                ('FONTSIZE', (0, 0), (-1, 0), 8),
+                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+                ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+
+                # 데이터 행 스타일
+                ('FONTNAME', (0, 1), (-1, -1), font),
+                ('FONTSIZE', (0, 1), (-1, -1), 7),
+                ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+                ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
+
+                # 격자선
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+
+                # 교대 행 배경색
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')])
+            ]),
+            # 추이 그래프 + 위험 지역 표 2열 배치
+            'layout': TableStyle([
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('LEFTPADDING', (0, 0), (-1, -1), 0),
+                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+                ('TOPPADDING', (0, 0), (-1, -1), 0),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+            ]),
+        }
+
+
+report_assets = ReportAssets()
+
+
+def load_report_assets():
+    """보고서 리소스를 미리 불러옵니다 (렌더링 프로세스 초기화 함수)."""
+    report_assets.load()
@@ -0,0 +1,130 @@
+"""
+보고서 PDF 디스크 캐시 (내용 주소 기반)
+
+렌더링한 PDF를 입력 내용의 해시(대시보드 데이터 + 발행 기관명 + 템플릿 버전 + 생성일) 이름의 파일로 저장합니다.
+입력이 같으면 같은 파일을 그대로 내려주므로(FileResponse, sendfile) 다시 렌더링하지 않고,
+입력이 바뀌면 키가 달라지므로 별도의 무효화가 필요 없습니다.
+자주 내려받는 파일은 OS 페이지 캐시에 남으므로 별도의 메모리 캐시는 두지 않습니다.
+
+    REPORT_CACHE_DIR        PDF 저장 디렉토리 (기본 report_cache)
+    REPORT_CACHE_MAX_FILES  보관할 최대 파일 수 (기본 200, 초과시 오래 사용하지 않은 파일부터 삭제)
+    REPORT_CACHE_GRACE      최근 사용한 파일을 삭제 대상에서 제외하는 시간 (초, 기본 60)
+                            get()이 반환한 경로를 FileResponse가 열기 전에 삭제되지 않도록 함
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def content_key(payload: dict) -> str:
+    """JSON으로 직렬화 가능한 입력 내용의 SHA-256 해시 (키 순서와 무관)"""
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ReportCache:
+    """해시 키로 찾는 PDF 파일 저장소"""
+
+    def __init__(self, directory: str = None, max_files: int = None, grace: float = None):
+        self.directory = directory if directory is not None else os.environ.get("REPORT_CACHE_DIR", "report_cache")
+        self.max_files = max_files or int(os.environ.get("REPORT_CACHE_MAX_FILES", 200))
+        self.grace = grace if grace is not None else float(os.environ.get("REPORT_CACHE_GRACE", 60))
+        self._lock = threading.Lock()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pdf")
+
+    def get(self, key: str) -> Optional[str]:
+        """저장된 PDF 경로. 없으면 None"""
+        path = self.path_for(key)
+        try:
+            # 사용 시각 갱신 (오래된 파일 정리 기준)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, content: bytes) -> str:
+        """PDF를 저장하고 경로를 반환합니다."""
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        self._prune()
+        return path
+
+    def _prune(self):
+        """
+        max_files를 넘으면 오래 사용하지 않은 파일부터 삭제
+
+        grace초 안에 저장/조회된 파일은 응답으로 전송 중일 수 있으므로 한도를 넘어도 남겨 둡니다.
+        """
+        with self._lock:
+            files = []
+            for root, _, names in os.walk(self.directory):
+                for name in names:
+                    if name.endswith(".pdf"):
+                        path = os.path.join(root, name)
+                        try:
+                            files.append((os.path.getmtime(path), path))
+                        except FileNotFoundError:
+                            continue
+            if len(files) <= self.max_files:
+                return
+            files.sort()
+            recent_after = time.time() - self.grace
+            for mtime, path in files[:len(files) - self.max_files]:
+                if mtime >= recent_after:
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    async def get_or_render(self, key: str, render: Callable[[], Awaitable[bytes]]) -> str:
+        """
+        저장된 PDF 경로를 반환합니다. 없으면 render()로 만들어 저장합니다.
+
+        같은 키에 대한 동시 요청은 하나의 렌더링 결과를 함께 기다립니다.
+        """
+        path = self.get(key)
+        if path is not None:
+            return path
+
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(key)
+        if future is not None and future.get_loop() is loop:
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            content = await render()
+            path = await asyncio.to_thread(self.put, key, content)
+            future.set_result(path)
+            return path
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없어도 "Future exception was never retrieved" 경고가 나지 않도록
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+
+report_cache = ReportCache()
@@ -0,0 +1,230 @@
+"""
+보고서 일괄 생성 작업 관리
+
+여러 (월, 발행 기관) 보고서를 하나의 작업으로 받아 백그라운드에서 동시에 생성하고,
+작업 상태(job.json)와 결과 PDF를 작업별 디렉토리에 저장합니다.
+요청은 작업 id만 받아 바로 끝나므로 PDF 생성 시간이 요청 시간 제한에 묶이지 않습니다.
+
+    REPORT_JOB_DIR             작업 저장 디렉토리 (기본 report_jobs)
+    REPORT_JOB_CONCURRENCY     모든 작업을 합쳐 동시에 생성할 보고서 수 (기본 2)
+    REPORT_JOB_MAX_SPECS       작업 하나에 요청할 수 있는 보고서 수 (기본 24)
+    REPORT_JOB_RETENTION_DAYS  완료된 작업 보관 기간 (일, 기본 7)
+
+보고서 생성 방법(render)은 호출자가 넘겨주며, (PDF 경로, 다운로드 파일명)을 반환해야 합니다.
+"""
+import asyncio
+import json
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+
+from core.render_pool import RenderPoolBusy
+
+load_dotenv()
+
+REPORT_JOB_CONCURRENCY = int(os.environ.get("REPORT_JOB_CONCURRENCY", 2))
+REPORT_JOB_MAX_SPECS = int(os.environ.get("REPORT_JOB_MAX_SPECS", 24))
+REPORT_JOB_RETENTION_DAYS = float(os.environ.get("REPORT_JOB_RETENTION_DAYS", 7))
+
+# 작업/보고서 상태
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+COMPLETED_WITH_ERRORS = "completed_with_errors"
+FINISHED = {COMPLETED, FAILED, COMPLETED_WITH_ERRORS}
+
+# 렌더링 풀이 가득 찬 경우 다시 시도하기 전 대기 시간 (초)
+BUSY_RETRY_DELAY = 2.0
+
+
+class ReportJobManager:
+    """보고서 일괄 생성 작업 저장소 + 실행기"""
+
+    def __init__(self, directory: str = None, concurrency: int = None, retention_days: float = None):
+        self.directory = directory if directory is not None else os.environ.get("REPORT_JOB_DIR", "report_jobs")
+        self.concurrency = concurrency or REPORT_JOB_CONCURRENCY
+        self.retention_days = retention_days if retention_days is not None else REPORT_JOB_RETENTION_DAYS
+        self._jobs: dict[str, dict] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def _job_dir(self, job_id: str) -> str:
+        return os.path.join(self.directory, job_id)
+
+    def _save(self, job: dict):
+        """작업 상태를 job.json에 저장"""
+        job_dir = self._job_dir(job["job_id"])
+        os.makedirs(job_dir, exist_ok=True)
+        path = os.path.join(job_dir, "job.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(job, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Semaphore는 이벤트 루프에 묶이므로 루프별로 생성
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphores = {loop: semaphore}
+        return semaphore
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """
+        작업 상태를 반환합니다 (메모리에 없으면 디스크에서 읽음).
+
+        서버 재시작 등으로 실행이 끊긴 작업은 끝나지 않은 보고서를 실패로 표시합니다.
+        """
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+
+        # 경로 조작 방지 (uuid hex만 허용)
+        if len(job_id) != 32 or not all(c in "0123456789abcdef" for c in job_id):
+            return None
+        path = os.path.join(self._job_dir(job_id), "job.json")
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            job = json.load(f)
+
+        if job["status"] not in FINISHED:
+            for artifact in job["artifacts"]:
+                if artifact["status"] not in FINISHED:
+                    artifact["status"] = FAILED
+                    artifact["error"] = "작업이 중단되었습니다 (서버 재시작)"
+            self._finish(job)
+            self._save(job)
+        return job
+
+    def artifact_path(self, job_id: str, index: int) -> Optional[str]:
+        """완료된 보고서 PDF 경로 (없거나 아직 생성 중이면 None)"""
+        job = self.get(job_id)
+        if job is None or not 0 <= index < len(job["artifacts"]):
+            return None
+        if job["artifacts"][index]["status"] != COMPLETED:
+            return None
+        return os.path.join(self._job_dir(job_id), f"{index}.pdf")
+
+    def submit(self, specs: list[dict], render: Callable[[dict], Awaitable[tuple[str, str]]]) -> dict:
+        """
+        작업을 등록하고 백그라운드에서 실행합니다 (실행 중인 이벤트 루프에서 호출).
+
+        Args:
+            specs: 보고서 조건 목록 (예: {"month": "2025-03", "organization_name": "해양환경공단"})
+            render: spec 하나로 보고서를 만들어 (PDF 경로, 다운로드 파일명)을 반환하는 함수
+
+        Returns:
+            등록된 작업 상태
+        """
+        if not specs:
+            raise ValueError("생성할 보고서가 없습니다")
+        if len(specs) > REPORT_JOB_MAX_SPECS:
+            raise ValueError(f"작업 하나에 보고서는 최대 {REPORT_JOB_MAX_SPECS}개까지 요청할 수 있습니다")
+
+        self.cleanup()
+
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": PENDING,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "finished_at": None,
+            "artifacts": [
+                {"index": i, **spec, "status": PENDING, "filename": None, "error": None}
+                for i, spec in enumerate(specs)
+            ]
+        }
+        self._jobs[job["job_id"]] = job
+        self._save(job)
+
+        task = asyncio.get_running_loop().create_task(self._run(job, specs, render))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _run(self, job: dict, specs: list[dict], render):
+        job["status"] = RUNNING
+        self._save(job)
+        try:
+            await asyncio.gather(*(
+                self._run_artifact(job, artifact, spec, render)
+                for artifact, spec in zip(job["artifacts"], specs)
+            ))
+        finally:
+            self._finish(job)
+            self._save(job)
+            # 완료된 작업은 디스크의 job.json으로 조회
+            self._jobs.pop(job["job_id"], None)
+
+    async def _run_artifact(self, job: dict, artifact: dict, spec: dict, render):
+        async with self._semaphore():
+            artifact["status"] = RUNNING
+            self._save(job)
+            try:
+                while True:
+                    try:
+                        pdf_path, filename = await render(spec)
+                        break
+                    except RenderPoolBusy:
+                        # 화면에서 요청한 보고서가 렌더링 풀을 쓰고 있으면 잠시 후 다시 시도
+                        await asyncio.sleep(BUSY_RETRY_DELAY)
+
+                target = os.path.join(self._job_dir(job["job_id"]), f"{artifact['index']}.pdf")
+                await asyncio.to_thread(_link_or_copy, pdf_path, target)
+                artifact["filename"] = filename
+                artifact["status"] = COMPLETED
+            except Exception as e:
+                artifact["status"] = FAILED
+                artifact["error"] = str(e)
+            self._save(job)
+
+    @staticmethod
+    def _finish(job: dict):
+        statuses = {artifact["status"] for artifact in job["artifacts"]}
+        if statuses == {COMPLETED}:
+            job["status"] = COMPLETED
+        elif COMPLETED in statuses:
+            job["status"] = COMPLETED_WITH_ERRORS
+        else:
+            job["status"] = FAILED
+        job["finished_at"] = datetime.now().isoformat(timespec="seconds")
+
+    def cleanup(self):
+        """보관 기간이 지난 작업 디렉토리 삭제"""
+        if not os.path.isdir(self.directory):
+            return
+        expires_before = time.time() - self.retention_days * 86400
+        for job_id in os.listdir(self.directory):
+            if job_id in self._jobs:
+                continue
+            job_dir = self._job_dir(job_id)
+            try:
+                if os.path.getmtime(job_dir) < expires_before:
+                    shutil.rmtree(job_dir, ignore_errors=True)
+            except FileNotFoundError:
+                continue
+
+    async def wait(self):
+        """실행 중인 작업이 모두 끝날 때까지 대기 (테스트/종료용)"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+def _link_or_copy(source: str, target: str):
+    """같은 파일 시스템이면 하드 링크, 아니면 복사 (보고서 캐시 정리와 무관하게 결과 보관)"""
+    tmp_path = f"{target}.tmp"
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, target)
+
+
+report_job_manager = ReportJobManager()
@@ -0,0 +1,451 @@
+"""
+월간 보고서 PDF 생성
+
+대시보드 데이터로 ReportLab PDF를 만들고(create_pdf_report), 렌더링 프로세스 풀(core.render_pool)과
+PDF 디스크 캐시(core.report_cache)를 거쳐 파일 경로로 제공합니다.
+보고서 API 라우트와 스케줄러(데이터 수집 후 미리 생성)가 함께 사용하며,
+렌더링 프로세스는 이 모듈만 불러오므로 API 라우터를 import하지 않습니다.
+"""
+import asyncio
+from datetime import date
+from io import BytesIO
+
+# ReportLab imports
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.lib.units import mm
+from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+from reportlab.graphics.shapes import Drawing, Line
+from reportlab.graphics.charts.linecharts import HorizontalLineChart
+
+from core.dashboard import DashboardResponse, VisitorFilter, VisitorMatrix, dashboard_cache
+from core.database import SessionLocal
+from core.render_pool import report_render_pool
+from core.report_assets import LOGO_PATH, report_assets
+from core.report_cache import content_key, report_cache
+
+# 보고서 기본 발행 기관명
+DEFAULT_ORGANIZATION_NAME = "해양환경공단"
+
+# 보고서 레이아웃(create_pdf_report, core.report_assets)을 바꾸면 올려서 캐시된 PDF를 무효화
+REPORT_TEMPLATE_VERSION = "2"
+
+
+def create_pdf_report(dashboard_data, buffer, organization_name=DEFAULT_ORGANIZATION_NAME, logo_path=None):
+    """PDF 보고서 생성
+    
+    Args:
+        dashboard_data: DashboardResponse 데이터
+        buffer: BytesIO 버퍼
+        organization_name: 발행 기관명
+        logo_path: 로고 이미지 경로
+    """
+    # 폰트/로고/스타일 (프로세스당 한 번 로드)
+    assets = report_assets.load()
+    korean_font = assets.font
+    
+    # PDF 문서 생성
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=20*mm,
+        leftMargin=20*mm,
+        topMargin=10*mm,
+        bottomMargin=20*mm
+    )
+    
+    # 스타일
+    title_style = assets.styles['title']
+    subtitle_style = assets.styles['subtitle']
+    section_title_style = assets.styles['section_title']
+    body_style = assets.styles['body']
+    
+    # 문서 요소 리스트
+    elements = []
+    
+    # 헤더 섹션 (로고 + 기관명 + 발행연도)
+    year, month = dashboard_data.target_month.split('-')
+    current_year = date.today().year
+    
+    # 로고 이미지 추가 (우측 상단, 미리 축소해 둔 이미지 사용)
+    logo = assets.logo(logo_path) if logo_path else None
+    if logo is not None:
+        org_text = Paragraph(
+            f'<font name="{korean_font}" size="15">{organization_name}</font>',
+            assets.styles['org']
+        )
+        year_text = Paragraph(
+            f'<font name="{korean_font}" size="9" color="black">발행 연도: {current_year}-{month}-REPORT</font>',
+            assets.styles['year']
+        )
+        
+        # 우측 정렬을 위한 테이블 (로고와 기관명을 가로로 배치)
+        header_data = [
+            ['', logo, org_text],
+            ['', '', year_text]
+        ]
+        
+        header_table = Table(header_data, colWidths=[120*mm, 17*mm, 43*mm])
+        header_table.setStyle(assets.table_styles['header'])
+        elements.append(header_table)
+        elements.append(Spacer(1, 1*mm))
+    else:
+        # 로고 없이 텍스트만
+        org_style = assets.styles['org_header']
+        elements.append(Paragraph(f"{organization_name}", org_style))
+        elements.append(Paragraph(f"발행 연도: {current_year}-{month}-REPORT", org_style))
+        elements.append(Spacer(1, 1*mm))
+    
+    # 1. 제목
+    title = Paragraph(f"제주 해양쓰레기 월간 예측 보고서", title_style)
+    subtitle = Paragraph(f"{year}년 {month}월", subtitle_style)
+    elements.append(title)
+    elements.append(subtitle)
+    
+    # 구분선 추가
+    line_drawing = Drawing(170*mm, 1*mm)
+    line = Line(0, 0, 340*mm, 0)
+    line.strokeColor = colors.HexColor('#1a1a1a')
+    line.strokeWidth = 0.5
+    line_drawing.add(line)
+    elements.append(line_drawing)
+    elements.append(Spacer(1, 3*mm))
+    
+    # 2. 요약 섹션
+    summary_title = Paragraph("요약", section_title_style)
+    elements.append(summary_title)
+    
+    # 요약 박스 데이터
+    summary = dashboard_data.summary
+    change_direction = "증가" if summary.previous_month_change > 0 else "감소"
+    
+    summary_bullets = [
+        f"• {month}월 해양쓰레기 유입량 전월 대비 {abs(summary.previous_month_change):.1f}% {change_direction}",
+        f"• 총 예상 유입량: {summary.total_predicted_amount:.0f}개",
+        f"• 위험 지역 {summary.high_risk_count}개소, 주의 지역 {summary.medium_risk_count}개소",
+        f"• 즉시 조치 필요: {summary.immediate_action_count}개소"
+    ]
+    
+    for bullet in summary_bullets:
+        elements.append(Paragraph(bullet, body_style))
+    
+    elements.append(Spacer(1, 8*mm))
+    
+    # 3. 월간 유입량 추이 (그래프) + 위험 지역 현황 (테이블) - 가로 배치
+    
+    # 왼쪽: 월간 유입량 추이 그래프
+    trend_title = Paragraph("월간 유입량 추이", section_title_style)
+    trend_spacer = Spacer(1, 2*mm)
+    
+    # 그래프 생성 (80mm x 45mm)
+    drawing = Drawing(80*mm, 45*mm)
+    chart = HorizontalLineChart()
+    chart.x = 3*mm
+    chart.y = 5*mm
+    chart.height = 38*mm
+    chart.width = 72*mm
+    
+    # 데이터 설정 (6개월)
+    months_data = dashboard_data.monthly_trends
+    chart.data = [[t.total_amount for t in months_data]]
+    
+    # X축 설정 (월 이름)
+    chart.categoryAxis.categoryNames = [t.month for t in months_data]
+    chart.categoryAxis.labels.fontName = korean_font
+    chart.categoryAxis.labels.fontSize = 7
+    chart.categoryAxis.labels.angle = 45
+    
+    # Y축 설정
+    chart.valueAxis.labels.fontName = korean_font
+    chart.valueAxis.labels.fontSize = 7
+    chart.valueAxis.valueMin = 0
+    max_value = max([t.total_amount for t in months_data]) if months_data else 1000
+    chart.valueAxis.valueMax = max_value * 1.2
+    chart.valueAxis.valueStep = max_value / 5
+    
+    # 선 스타일
+    chart.lines[0].strokeColor = colors.HexColor('#4A90E2')
+    chart.lines[0].strokeWidth = 2
+    chart.lines[0].symbol = None
+    
+    # 그리드
+    chart.categoryAxis.visibleGrid = True
+    chart.valueAxis.visibleGrid = True
+    chart.categoryAxis.gridStrokeColor = colors.HexColor('#E0E0E0')
+    chart.valueAxis.gridStrokeColor = colors.HexColor('#E0E0E0')
+    
+    drawing.add(chart)
+    
+    # 오른쪽: 위험 지역 현황 테이블
+    risk_title = Paragraph("위험 지역 현황", section_title_style)
+    risk_spacer = Spacer(1, 2*mm)
+    
+    # 테이블 헤더
+    risk_table_data = [
+        ['지역', '예측량', '위험도', '조치']
+    ]
+    
+    # 상위 5개 위험 지역만 표시
+    for area in dashboard_data.risk_areas[:5]:
+        risk_table_data.append([
+            area.beach_name,
+            f"{area.predicted_amount:.0f}개",
+            area.risk_level.value,
+            area.action_required.value
+        ])
+    
+    # 테이블 생성 (80mm 너비로 조정, 행 높이 지정으로 전체 높이 맞춤)
+    risk_table = Table(
+        risk_table_data, 
+        colWidths=[21*mm, 19*mm, 17*mm, 23*mm],  # 총 80mm
+        rowHeights=[8*mm] + [8*mm] * 5  # 헤더 7mm + 데이터 행 7mm x 5 = 총 42mm
+    )
+    risk_table.setStyle(assets.table_styles['risk'])
+    
+    # 제목과 Spacer와 내용을 묶어서 2열 테이블로 배치
+    combined_data = [
+        [trend_title, risk_title],
+        [trend_spacer, risk_spacer],
+        [drawing, risk_table]
+    ]
+    
+    combined_table = Table(combined_data, colWidths=[85*mm, 85*mm])
+    combined_table.setStyle(assets.table_styles['layout'])
+    
+    elements.append(combined_table)
+    elements.append(Spacer(1, 6*mm))
+    
+    # 4. 방문객 통계 그래프 (가로로 길게)
+    # 대시보드의 지역 × 월 행렬을 그대로 라인 차트 시리즈로 사용
+    visitor_matrix = dashboard_data.visitor_matrix or VisitorMatrix(regions=[], months=[], visitors=[])
+    sorted_months = visitor_matrix.months
+    chart_data = visitor_matrix.visitors
+    region_names = visitor_matrix.regions
+    
+    if sorted_months:
+        period = f"{sorted_months[0].replace('-', '.')} - {sorted_months[-1].replace('-', '.')}"
+        visitor_title = Paragraph(f"제주 해안별 월별 방문객 추이 ({period})", section_title_style)
+    else:
+        visitor_title = Paragraph("제주 해안별 월별 방문객 추이", section_title_style)
+    elements.append(visitor_title)
+    elements.append(Spacer(1, 2*mm))
+    
+    # 방문객 그래프 생성 (가로로 길게: 170mm x 55mm)
+    visitor_drawing = Drawing(170*mm, 60*mm)
+    visitor_chart = HorizontalLineChart()
+    visitor_chart.x = 10*mm
+    visitor_chart.y = 8*mm
+    visitor_chart.height = 44*mm
+    visitor_chart.width = 150*mm
+    
+    # 데이터 설정
+    visitor_chart.data = chart_data
+    
+    # X축 설정 (월 레이블)
+    month_labels = [m.split('-')[1] + '월' for m in sorted_months]
+    visitor_chart.categoryAxis.categoryNames = month_labels
+    visitor_chart.categoryAxis.labels.fontName = korean_font
+    visitor_chart.categoryAxis.labels.fontSize = 6
+    visitor_chart.categoryAxis.labels.angle = 45
+    
+    # Y축 설정
+    visitor_chart.valueAxis.labels.fontName = korean_font
+    visitor_chart.valueAxis.labels.fontSize = 7
+    visitor_chart.valueAxis.valueMin = 0
+    
+    if chart_data:
+        all_values = [val for line in chart_data for val in line]
+        max_visitor = max(all_values) if all_values else 100000
+        visitor_chart.valueAxis.valueMax = max_visitor * 1.1
+        visitor_chart.valueAxis.valueStep = max_visitor / 5
+    
+    # 각 라인 스타일 설정 (다양한 색상)
+    line_colors = [
+        colors.HexColor('#4A90E2'),  # 파란색
+        colors.HexColor('#E24A4A'),  # 빨간색
+        colors.HexColor('#4AE290'),  # 초록색
+        colors.HexColor('#E2904A'),  # 주황색
+        colors.HexColor('#904AE2'),  # 보라색
+        colors.HexColor('#E2E24A'),  # 노란색
+        colors.HexColor('#4AE2E2'),  # 청록색
+        colors.HexColor('#E24AE2'),  # 마젠타
+        colors.HexColor('#90E24A'),  # 연두색
+    ]
+    
+    for i in range(len(chart_data)):
+        visitor_chart.lines[i].strokeColor = line_colors[i % len(line_colors)]
+        visitor_chart.lines[i].strokeWidth = 1.5
+        visitor_chart.lines[i].symbol = None
+    
+    # 그리드
+    visitor_chart.categoryAxis.visibleGrid = True
+    visitor_chart.valueAxis.visibleGrid = True
+    visitor_chart.categoryAxis.gridStrokeColor = colors.HexColor('#E0E0E0')
+    visitor_chart.valueAxis.gridStrokeColor = colors.HexColor('#E0E0E0')
+    
+    visitor_drawing.add(visitor_chart)
+    
+    # 범례 추가 (차트 오른쪽)
+    legend_x = 162*mm
+    legend_y = 48*mm
+    for i, region in enumerate(region_names):
+        # 색상 박스
+        visitor_drawing.add(Line(legend_x, legend_y - i*4*mm, legend_x + 3*mm, legend_y - i*4*mm,
+                                strokeColor=line_colors[i % len(line_colors)], strokeWidth=2))
+        # 텍스트
+        from reportlab.graphics.shapes import String
+        visitor_drawing.add(String(legend_x + 4*mm, legend_y - i*4*mm - 1*mm, region,
+                                   fontName=korean_font, fontSize=6, fillColor=colors.black))
+    
+    elements.append(visitor_drawing)
+    elements.append(Spacer(1, 4*mm))
+    
+    # 5. 분석 섹션
+    analysis_title = Paragraph("분석", section_title_style)
+    elements.append(analysis_title)
+    
+    # 분석 내용 생성
+    analysis_items = []
+    
+    if summary.high_risk_count > 0:
+        analysis_items.append(
+            f"현재 {summary.high_risk_count}개 지역이 높은 위험도를 보이고 있으며, "
+            f"즉각적인 수거 작업이 필요합니다."
+        )
+    
+    if summary.previous_month_change > 5:
+        analysis_items.append(
+            f"전월 대비 {summary.previous_month_change:.1f}% 증가로 유입량이 크게 증가했습니다. "
+            f"기상 조건과 해류 패턴의 변화가 주요 원인으로 분석됩니다."
+        )
+    elif summary.previous_month_change < -5:
+        analysis_items.append(
+            f"전월 대비 {abs(summary.previous_month_change):.1f}% 감소로 개선 추세를 보이고 있습니다."
+        )
+    
+    # 가장 위험한 지역 언급
+    if dashboard_data.risk_areas:
+        top_risk = dashboard_data.risk_areas[0]
+        analysis_items.append(
+            f"{top_risk.beach_name} 지역이 {top_risk.predicted_amount:.0f}개로 "
+            f"가장 높은 유입량이 예상되며, {top_risk.action_required} 조치가 필요합니다."
+        )
+    
+    for item in analysis_items:
+        elements.append(Paragraph(f"• {item}", body_style))
+        elements.append(Spacer(1, 2*mm))
+    
+    # 페이지 하단에 고정될 footer 함수 정의
+    def add_page_footer(canvas, doc):
+        """모든 페이지 하단에 보고서 생성일 추가"""
+        canvas.saveState()
+        footer_text = f"보고서 생성일: {date.today().strftime('%Y년 %m월 %d일')}"
+        canvas.setFont(korean_font, 8)
+        canvas.setFillColor(colors.grey)
+        # 페이지 하단 중앙에 배치 (하단에서 10mm)
+        canvas.drawCentredString(A4[0] / 2, 10*mm, footer_text)
+        canvas.restoreState()
+    
+    # PDF 생성 (footer를 페이지 하단에 고정)
+    doc.build(elements, onFirstPage=add_page_footer, onLaterPages=add_page_footer)
+
+
+def render_monthly_report(dashboard_dict: dict, organization_name: str, logo_path: str = None) -> bytes:
+    """
+    PDF 보고서를 만들어 bytes로 반환합니다 (렌더링 프로세스에서 실행).
+    
+    Args:
+        dashboard_dict: DashboardResponse.model_dump(mode="json") 결과 (프로세스 간 전달용 단순 데이터)
+        organization_name: 발행 기관명
+        logo_path: 로고 이미지 경로
+    
+    Returns:
+        PDF 파일 내용
+    """
+    buffer = BytesIO()
+    create_pdf_report(
+        DashboardResponse.model_validate(dashboard_dict),
+        buffer,
+        organization_name=organization_name,
+        logo_path=logo_path
+    )
+    return buffer.getvalue()
+
+
+def report_cache_key(dashboard_dict: dict, organization_name: str) -> str:
+    """
+    보고서 캐시 키 (입력 내용 해시)
+    
+    PDF 하단에 생성일이 들어가므로 날짜도 키에 포함합니다.
+    """
+    return content_key({
+        "dashboard": dashboard_dict,
+        "organization_name": organization_name,
+        "template_version": REPORT_TEMPLATE_VERSION,
+        "report_date": date.today().isoformat()
+    })
+
+
+async def get_or_render_monthly_report(dashboard_dict: dict, organization_name: str) -> tuple[str, str]:
+    """
+    캐시된 보고서 PDF 경로를 반환하고, 없으면 렌더링 프로세스에서 만들어 저장합니다.
+    
+    Returns:
+        (PDF 파일 경로, 캐시 키)
+    """
+    key = report_cache_key(dashboard_dict, organization_name)
+    path = await report_cache.get_or_render(
+        key,
+        lambda: report_render_pool.submit(render_monthly_report, dashboard_dict, organization_name, LOGO_PATH)
+    )
+    return path, key
+
+
+def report_filename(target_month: str) -> str:
+    """보고서 다운로드 파일명 (target_month: YYYY-MM)"""
+    year, month = target_month.split('-')
+    return f"제주_해양쓰레기_월간_예측_보고서_{year}년_{month}월.pdf"
+
+
+async def render_report_for_job(spec: dict) -> tuple[str, str]:
+    """
+    일괄 생성 작업의 보고서 하나를 만듭니다 (core.report_jobs에서 호출).
+    
+    Args:
+        spec: {"month": "YYYY-MM", "organization_name": 발행 기관명}
+    
+    Returns:
+        (PDF 파일 경로, 다운로드 파일명)
+    """
+    def load_dashboard() -> dict:
+        db = SessionLocal()
+        try:
+            dashboard_data, _ = dashboard_cache.get(
+                db, target_month=spec["month"], visitor_filter=VisitorFilter(format="matrix")
+            )
+        finally:
+            db.close()
+        return dashboard_data.model_dump(mode="json")
+    
+    # DB 조회는 스레드에서 실행 (이벤트 루프 차단 방지)
+    dashboard_dict = await asyncio.to_thread(load_dashboard)
+    pdf_path, _ = await get_or_render_monthly_report(dashboard_dict, spec["organization_name"])
+    return pdf_path, report_filename(dashboard_dict["target_month"])
+
+
+def prerender_monthly_report(organization_name: str = None) -> str:
+    """
+    현재 월의 기본 보고서를 미리 렌더링합니다 (스케줄러의 데이터 수집 후 실행).
+    
+    Returns:
+        PDF 파일 경로
+    """
+    organization_name = organization_name or DEFAULT_ORGANIZATION_NAME
+    db = SessionLocal()
+    try:
+        dashboard_data, _ = dashboard_cache.get(db, visitor_filter=VisitorFilter(format="matrix"))
+    finally:
+        db.close()
+    
+    path, _ = asyncio.run(get_or_render_monthly_report(dashboard_data.model_dump(mode="json"), organization_name))
+    return path
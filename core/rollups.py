@@ -0,0 +1,229 @@
+"""
+해변 예측 집계(rollup) 테이블 관리
+
+beach_predictions에 예측이 저장될 때(write_beach_predictions) 같은 트랜잭션에서 호출되어
+저장된 날짜의 일별 집계와, 그 날짜가 속한 월의 월별/해변별 월간 집계를 다시 계산하고
+대시보드 데이터 버전(core.versions)을 올립니다.
+대시보드와 보고서는 원본 행을 매번 집계하지 않고 이 테이블을 기본 키로 조회합니다.
+
+    daily_prediction_rollups    날짜별 합계/건수/위험도 구간별 해변 수
+    monthly_prediction_rollups  월별 합계/건수/위험도 구간별 건수 (일별 집계의 합)
+    beach_monthly_rollups       (월, 해변)별 합계와 해당 월의 최신 예측
+
+과거 데이터는 rebuild_rollups (scripts/rebuild_rollups.py)로 다시 만들 수 있습니다.
+"""
+from datetime import date, datetime
+from typing import Iterable
+
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from core.database import upsert_statement
+from core.versions import bump_version
+from models.beach_prediction import BeachPrediction
+from models.prediction_rollup import BeachMonthlyRollup, DailyPredictionRollup, MonthlyPredictionRollup
+
+
+def month_range(year: int, month: int) -> tuple[date, date]:
+    """
+    월의 반열린 날짜 구간 [해당 월 1일, 다음 달 1일)
+
+    prediction_date >= start AND prediction_date < end 조건은 인덱스를 사용할 수 있습니다
+    (extract('year'/'month', ...) 조건은 모든 행을 계산해야 하므로 인덱스를 사용하지 못함).
+    """
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+def month_key(year: int, month: int) -> str:
+    """집계 테이블의 월 키 (YYYY-MM)"""
+    return f"{year}-{month:02d}"
+
+
+def _status_count(status: str):
+    return func.sum(case((BeachPrediction.status == status, 1), else_=0))
+
+
+def latest_per_beach(start: date, end: date):
+    """
+    [start, end) 구간에서 해변별 최신 예측을 정확히 한 건씩 조회하는 SELECT
+
+    ROW_NUMBER() 윈도 함수로 해변마다 (prediction_date, id) 내림차순 첫 행만 남기므로
+    (해변, 최신 날짜) 자기 조인과 달리 같은 날짜 행이 여러 개여도 중복되지 않습니다.
+    읽는 컬럼은 모두 ix_beach_predictions_date_cover 인덱스에 있어 테이블 행을 읽지 않습니다.
+    """
+    ranked = select(
+        BeachPrediction.beach_name,
+        BeachPrediction.prediction_date,
+        BeachPrediction.trash_amount,
+        BeachPrediction.status,
+        BeachPrediction.latitude,
+        BeachPrediction.longitude,
+        func.row_number().over(
+            partition_by=BeachPrediction.beach_name,
+            order_by=(BeachPrediction.prediction_date.desc(), BeachPrediction.id.desc())
+        ).label("row_number")
+    ).where(
+        BeachPrediction.prediction_date >= start,
+        BeachPrediction.prediction_date < end
+    ).subquery()
+
+    return select(
+        ranked.c.beach_name,
+        ranked.c.prediction_date,
+        ranked.c.trash_amount,
+        ranked.c.status,
+        ranked.c.latitude,
+        ranked.c.longitude
+    ).where(ranked.c.row_number == 1)
+
+
+def _refresh_daily(db: Session, dates: list[date], dialect_name: str, now: datetime):
+    """날짜별 집계를 beach_predictions에서 다시 계산합니다."""
+    rows = [
+        {
+            "prediction_date": prediction_date,
+            "total_amount": float(total or 0.0),
+            "prediction_count": int(count),
+            "high_count": int(high or 0),
+            "medium_count": int(medium or 0),
+            "low_count": int(low or 0),
+            "updated_at": now
+        }
+        for prediction_date, total, count, high, medium, low in db.query(
+            BeachPrediction.prediction_date,
+            func.sum(BeachPrediction.trash_amount),
+            func.count(BeachPrediction.id),
+            _status_count("HIGH"),
+            _status_count("MEDIUM"),
+            _status_count("LOW")
+        ).filter(
+            BeachPrediction.prediction_date.in_(dates)
+        ).group_by(BeachPrediction.prediction_date).all()
+    ]
+    if rows:
+        db.execute(upsert_statement(DailyPredictionRollup, rows, ("prediction_date",), dialect_name))
+
+
+def _refresh_month(db: Session, year: int, month: int, dialect_name: str, now: datetime):
+    """월별 집계(일별 집계의 합)와 해변별 월간 집계를 다시 계산합니다."""
+    start, end = month_range(year, month)
+    key = month_key(year, month)
+
+    total, count, high, medium, low = db.query(
+        func.sum(DailyPredictionRollup.total_amount),
+        func.sum(DailyPredictionRollup.prediction_count),
+        func.sum(DailyPredictionRollup.high_count),
+        func.sum(DailyPredictionRollup.medium_count),
+        func.sum(DailyPredictionRollup.low_count)
+    ).filter(
+        DailyPredictionRollup.prediction_date >= start,
+        DailyPredictionRollup.prediction_date < end
+    ).one()
+
+    db.execute(upsert_statement(MonthlyPredictionRollup, [{
+        "year_month": key,
+        "total_amount": float(total or 0.0),
+        "prediction_count": int(count or 0),
+        "high_count": int(high or 0),
+        "medium_count": int(medium or 0),
+        "low_count": int(low or 0),
+        "updated_at": now
+    }], ("year_month",), dialect_name))
+
+    # 해변별 월간 합계 + 최신 예측 (해변 수만큼의 행만 DB에서 읽음)
+    totals = {
+        name: (float(total or 0.0), int(count))
+        for name, total, count in db.query(
+            BeachPrediction.beach_name,
+            func.sum(BeachPrediction.trash_amount),
+            func.count(BeachPrediction.id)
+        ).filter(
+            BeachPrediction.prediction_date >= start,
+            BeachPrediction.prediction_date < end
+        ).group_by(BeachPrediction.beach_name).all()
+    }
+    beaches = [
+        {
+            "year_month": key,
+            "beach_name": name,
+            "total_amount": totals[name][0],
+            "prediction_count": totals[name][1],
+            "latest_date": prediction_date,
+            "latest_amount": amount,
+            "latest_status": status,
+            "latitude": latitude,
+            "longitude": longitude,
+            "updated_at": now
+        }
+        for name, prediction_date, amount, status, latitude, longitude in db.execute(latest_per_beach(start, end)).all()
+    ]
+
+    if beaches:
+        db.execute(upsert_statement(BeachMonthlyRollup, beaches, ("year_month", "beach_name"), dialect_name))
+
+
+def refresh_rollups(db: Session, dates: Iterable[date]) -> int:
+    """
+    저장된 날짜들의 일별 집계와 해당 월들의 월별/해변별 집계를 갱신합니다 (커밋은 호출자가 수행).
+
+    Args:
+        db: DB 세션 (beach_predictions 저장과 같은 트랜잭션)
+        dates: 예측이 저장된 날짜들
+
+    Returns:
+        갱신한 월 수
+    """
+    dates = sorted(set(dates))
+    if not dates:
+        return 0
+
+    dialect_name = db.get_bind().dialect.name
+    now = datetime.utcnow()
+
+    _refresh_daily(db, dates, dialect_name, now)
+
+    months = sorted({(d.year, d.month) for d in dates})
+    for year, month in months:
+        _refresh_month(db, year, month, dialect_name, now)
+
+    # 대시보드 응답 캐시 무효화 (커밋되면 집계와 함께 보임)
+    bump_version(db)
+    return len(months)
+
+
+def rebuild_rollups(db: Session, start_date: date = None, end_date: date = None) -> int:
+    """
+    beach_predictions 전체(또는 기간)에서 집계 테이블을 다시 만듭니다 (커밋은 호출자가 수행).
+
+    기간을 지정하지 않으면 기존 집계를 모두 지우고 처음부터 만듭니다.
+
+    Args:
+        db: DB 세션
+        start_date: 시작 날짜 (포함)
+        end_date: 종료 날짜 (포함)
+
+    Returns:
+        갱신한 월 수
+    """
+    if start_date is None and end_date is None:
+        db.query(BeachMonthlyRollup).delete(synchronize_session=False)
+        db.query(MonthlyPredictionRollup).delete(synchronize_session=False)
+        db.query(DailyPredictionRollup).delete(synchronize_session=False)
+
+    query = db.query(BeachPrediction.prediction_date).distinct()
+    if start_date is not None:
+        query = query.filter(BeachPrediction.prediction_date >= start_date)
+    if end_date is not None:
+        query = query.filter(BeachPrediction.prediction_date <= end_date)
+    dates = [row[0] for row in query.all()]
+
+    # 월 단위로 나누어 갱신 (IN 목록이 너무 길어지지 않도록)
+    by_month: dict[tuple[int, int], list[date]] = {}
+    for d in dates:
+        by_month.setdefault((d.year, d.month), []).append(d)
+
+    for month_dates in by_month.values():
+        refresh_rollups(db, month_dates)
+    return len(by_month)
@@ -0,0 +1,29 @@
+"""
+데이터 버전 카운터
+
+대시보드 입력 데이터(예측 집계, 방문객 통계)가 바뀌면 같은 트랜잭션에서 버전을 올리고,
+응답 캐시는 캐시된 버전과 현재 버전이 다르면 다시 계산합니다.
+카운터는 DB에 있으므로 API 서버 워커가 여러 개이거나 백필 스크립트처럼 다른 프로세스에서 저장해도 무효화됩니다.
+"""
+from sqlalchemy.orm import Session
+
+from models.data_version import DataVersion
+
+# 대시보드(예측 집계 + 방문객 통계) 버전 이름
+DASHBOARD_VERSION = "dashboard"
+
+
+def bump_version(db: Session, name: str = DASHBOARD_VERSION):
+    """버전을 1 올립니다 (커밋은 호출자가 수행)."""
+    updated = db.query(DataVersion).filter(DataVersion.name == name).update(
+        {DataVersion.version: DataVersion.version + 1}, synchronize_session=False
+    )
+    if not updated:
+        db.add(DataVersion(name=name, version=1))
+        db.flush()
+
+
+def current_version(db: Session, name: str = DASHBOARD_VERSION) -> int:
+    """현재 버전 (기본 키 조회, 기록이 없으면 0)"""
+    version = db.query(DataVersion.version).filter(DataVersion.name == name).scalar()
+    return version or 0
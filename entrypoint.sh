@@ -11,5 +11,8 @@ echo "MySQL is ready!"
 echo "Initializing database..."
 python init_db.py
 
+echo "Applying database migrations..."
+python scripts/migrate.py
+
 echo "Starting application..."
 exec "$@"
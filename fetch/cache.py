@@ -0,0 +1,175 @@
+"""
+업스트림 API 응답 캐시
+
+KHOA 해류/바람/수온 API 응답을 (feed, 관측소 코드 또는 영역, 날짜) 키로 캐시합니다.
+메모리 LRU를 1차로 사용하고, FETCH_CACHE_PATH가 설정되면 SQLite 파일을 2차 캐시로 사용합니다.
+지난 날짜의 데이터는 영구 보관하고, 오늘(또는 이후) 데이터는 아직 갱신 중이므로 TTL을 적용합니다.
+
+    FETCH_CACHE_PATH        SQLite 캐시 파일 경로 (미설정시 메모리 캐시만 사용)
+    FETCH_CACHE_MAX_ENTRIES 메모리 LRU 최대 항목 수 (기본 512)
+    FETCH_CACHE_TODAY_TTL   오늘 데이터의 TTL (초, 기본 600)
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def make_key(feed: str, *parts) -> str:
+    """캐시 키 생성 (예: "wind|DT_0004|20250301")"""
+    return "|".join([feed, *[str(part) for part in parts]])
+
+
+class ResponseCache:
+    """메모리 LRU + SQLite 2단계 응답 캐시"""
+
+    def __init__(self, max_entries: int = None, db_path: str = None, today_ttl: float = None):
+        self.max_entries = max_entries or int(os.environ.get("FETCH_CACHE_MAX_ENTRIES", 512))
+        self.today_ttl = today_ttl if today_ttl is not None else float(os.environ.get("FETCH_CACHE_TODAY_TTL", 600))
+        self.db_path = db_path if db_path is not None else os.environ.get("FETCH_CACHE_PATH")
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Any, Optional[float]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._db = None
+        self.hits = 0
+        self.misses = 0
+
+        if self.db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self._db.commit()
+
+    def ttl_for(self, target_date) -> Optional[float]:
+        """데이터 날짜에 따른 TTL (지난 날짜는 None = 영구 보관)"""
+        if isinstance(target_date, datetime):
+            target_date = target_date.date()
+        if target_date < date.today():
+            return None
+        return self.today_ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 값을 반환합니다. 없거나 만료된 경우 None"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and (row[1] is None or row[1] > now):
+                    value = json.loads(row[0])
+                    self._put_memory(key, value, row[1])
+                    self.hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        값을 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: JSON 직렬화 가능한 값
+            ttl: 유효 시간 (초, None이면 영구 보관)
+        """
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._put_memory(key, value, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), expires_at)
+                )
+                self._db.commit()
+
+    def _put_memory(self, key: str, value: Any, expires_at: Optional[float]):
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_or_fetch(self, key: str, ttl: Optional[float], fetch: Callable[[], Any]) -> Any:
+        """캐시에 없으면 fetch()를 호출하여 저장 후 반환합니다."""
+        value = self.get(key)
+        if value is None:
+            value = fetch()
+            self.set(key, value, ttl)
+        return value
+
+    async def get_or_fetch_async(self, key: str, ttl: Optional[float], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        get_or_fetch의 비동기 버전.
+
+        같은 키에 대한 동시 요청은 하나의 업스트림 호출 결과를 함께 기다립니다.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(key)
+        if future is not None and future.get_loop() is loop:
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+            self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def clear(self):
+        """캐시를 모두 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """캐시 적중 통계"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk": self.db_path
+        }
+
+
+# 프로세스 전역 응답 캐시
+response_cache = ResponseCache()
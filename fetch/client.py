@@ -0,0 +1,204 @@
+"""
+외부 API 호출용 공용 HTTP 클라이언트
+
+KHOA 등 업스트림 API 호출이 TCP/TLS 연결을 재사용하도록 프로세스 전역 Session을 공유합니다.
+비동기 경로(FastAPI 라우트, 수집/백필)에서는 같은 설정의 httpx.AsyncClient를 사용합니다.
+httpx에는 호스트별 풀 설정이 없으므로 호스트별 최대 커넥션 수는 호스트마다 asyncio.Semaphore로 제한합니다.
+호스트별 커넥션 풀 크기와 connect/read 타임아웃은 환경 변수로 설정합니다.
+
+    HTTP_CONNECT_TIMEOUT   연결 타임아웃 (초, 기본 3.05)
+    HTTP_READ_TIMEOUT      응답 대기 타임아웃 (초, 기본 30)
+    HTTP_POOL_CONNECTIONS  커넥션 풀을 유지할 호스트 수 (기본 10)
+    HTTP_POOL_MAXSIZE      호스트당 최대 커넥션 수 (기본 10)
+    HTTP_HOST_POOL_SIZES   호스트별 최대 커넥션 수 (예: "www.khoa.go.kr=4,apis.data.go.kr=8")
+"""
+import asyncio
+import os
+import threading
+import weakref
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _parse_host_pool_sizes(value: str) -> dict[str, int]:
+    """"host=size,host=size" 형식의 설정을 dict로 변환합니다."""
+    sizes = {}
+    for item in (value or "").split(","):
+        if "=" not in item:
+            continue
+        host, size = item.split("=", 1)
+        if host.strip() and size.strip().isdigit():
+            sizes[host.strip()] = int(size.strip())
+    return sizes
+
+
+class HttpClient:
+    """커넥션 풀과 keep-alive를 사용하는 공용 HTTP 클라이언트"""
+
+    def __init__(
+        self,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        host_pool_sizes: dict[str, int] = None
+    ):
+        self.connect_timeout = connect_timeout or float(os.environ.get("HTTP_CONNECT_TIMEOUT", 3.05))
+        self.read_timeout = read_timeout or float(os.environ.get("HTTP_READ_TIMEOUT", 30))
+        self.pool_connections = pool_connections or int(os.environ.get("HTTP_POOL_CONNECTIONS", 10))
+        self.pool_maxsize = pool_maxsize or int(os.environ.get("HTTP_POOL_MAXSIZE", 10))
+        self.host_pool_sizes = (
+            host_pool_sizes if host_pool_sizes is not None
+            else _parse_host_pool_sizes(os.environ.get("HTTP_HOST_POOL_SIZES", ""))
+        )
+        self._session = None
+        self._lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+
+        # 기본 풀 (호스트당 pool_maxsize개 커넥션, 초과 요청은 커넥션 반환까지 대기)
+        default_adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=True
+        )
+        session.mount("http://", default_adapter)
+        session.mount("https://", default_adapter)
+
+        # 호스트별 풀 크기 설정
+        for host, size in self.host_pool_sizes.items():
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size, pool_block=True)
+            session.mount(f"http://{host}/", adapter)
+            session.mount(f"https://{host}/", adapter)
+
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """공유 Session (최초 사용 시 생성)"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        """(connect, read) 타임아웃"""
+        return self.connect_timeout, self.read_timeout
+
+    def get(self, url: str, params: dict = None, timeout=None) -> requests.Response:
+        """
+        GET 요청을 보냅니다.
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            timeout: 타임아웃 (미지정시 (connect, read) 기본값 사용)
+
+        Returns:
+            requests.Response
+        """
+        return self.session.get(url, params=params, timeout=timeout or self.timeout)
+
+    def close(self):
+        """Session과 커넥션 풀을 닫습니다."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+class AsyncHttpClient:
+    """커넥션 풀과 keep-alive를 사용하는 공용 비동기 HTTP 클라이언트 (httpx)"""
+
+    def __init__(
+        self,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+        pool_connections: int = None,
+        max_connections: int = None,
+        host_pool_sizes: dict[str, int] = None
+    ):
+        self.connect_timeout = connect_timeout or float(os.environ.get("HTTP_CONNECT_TIMEOUT", 3.05))
+        self.read_timeout = read_timeout or float(os.environ.get("HTTP_READ_TIMEOUT", 30))
+        self.pool_connections = pool_connections or int(os.environ.get("HTTP_POOL_CONNECTIONS", 10))
+        # 호스트당 최대 커넥션 수 (HttpClient의 pool_maxsize와 같은 의미)
+        self.max_connections = max_connections or int(os.environ.get("HTTP_POOL_MAXSIZE", 10))
+        self.host_pool_sizes = (
+            host_pool_sizes if host_pool_sizes is not None
+            else _parse_host_pool_sizes(os.environ.get("HTTP_HOST_POOL_SIZES", ""))
+        )
+        # 이벤트 루프별 AsyncClient와 호스트별 Semaphore (API 서버 루프와 스케줄러 스레드 루프가 각자 사용)
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._host_limits: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프의 AsyncClient (최초 사용 시 생성)"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            # 전체 커넥션 수는 HttpClient와 같이 (호스트 수 x 호스트당 커넥션 수)까지, 호스트별 제한은 host_limit에서 적용
+            total = max(
+                self.pool_connections * self.max_connections,
+                sum(self.host_pool_sizes.values()) + self.max_connections
+            )
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=total,
+                    max_keepalive_connections=total
+                )
+            )
+            self._clients[loop] = client
+        return client
+
+    def host_limit(self, host: str) -> asyncio.Semaphore:
+        """현재 이벤트 루프에서 host의 동시 요청 수를 제한하는 Semaphore"""
+        loop = asyncio.get_running_loop()
+        limits = self._host_limits.get(loop)
+        if limits is None:
+            limits = self._host_limits[loop] = {}
+        semaphore = limits.get(host)
+        if semaphore is None:
+            semaphore = limits[host] = asyncio.Semaphore(self.host_pool_sizes.get(host, self.max_connections))
+        return semaphore
+
+    async def get(self, url: str, params: dict = None, timeout=None) -> httpx.Response:
+        """
+        GET 요청을 보냅니다.
+
+        호스트별 최대 커넥션 수(HTTP_HOST_POOL_SIZES, 미설정시 HTTP_POOL_MAXSIZE)를 넘는 요청은
+        앞선 요청이 끝날 때까지 기다립니다.
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            timeout: 타임아웃 (미지정시 클라이언트 기본값 사용)
+
+        Returns:
+            httpx.Response
+        """
+        async with self.host_limit(httpx.URL(url).host):
+            if timeout is None:
+                return await self.client.get(url, params=params)
+            return await self.client.get(url, params=params, timeout=timeout)
+
+    async def aclose(self):
+        """현재 이벤트 루프의 AsyncClient와 커넥션 풀을 닫습니다."""
+        loop = asyncio.get_running_loop()
+        self._host_limits.pop(loop, None)
+        client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+# 프로세스 전역 HTTP 클라이언트
+http_client = HttpClient()
+async_http_client = AsyncHttpClient()
@@ -0,0 +1,202 @@
+"""
+해류 격자 데이터
+
+해류 API가 반환한 한 영역(1°×1° 타일)의 격자 지점을 NumPy 배열과 KD-tree 인덱스로 보관하고,
+임의 개수의 좌표에 대한 최근접/k-최근접 조회와 보간(IDW, bilinear)을 한 번의 벡터 연산으로 처리합니다.
+"""
+import numpy as np
+from sklearn.neighbors import KDTree
+
+# 보간 방식
+INTERPOLATION_METHODS = ("nearest", "idw", "bilinear")
+
+
+class CurrentField:
+    """한 시각, 한 타일의 해류 격자"""
+
+    def __init__(self, lats, lons, directions, speeds):
+        """
+        Args:
+            lats: 격자 지점 위도 배열
+            lons: 격자 지점 경도 배열
+            directions: 해류 방향 (도)
+            speeds: 유속
+        """
+        self.lats = np.asarray(lats, dtype=float).reshape(-1)
+        self.lons = np.asarray(lons, dtype=float).reshape(-1)
+        self.directions = np.asarray(directions, dtype=float).reshape(-1)
+        self.speeds = np.asarray(speeds, dtype=float).reshape(-1)
+
+        if self.lats.shape[0] == 0:
+            raise Exception("유효한 데이터가 없습니다")
+
+        rad = np.deg2rad(self.directions)
+        self.u = self.speeds * np.cos(rad)
+        self.v = self.speeds * np.sin(rad)
+
+        # 위경도 평면(도 단위 유클리드 거리) 기준 KD-tree
+        self._tree = KDTree(np.column_stack([self.lats, self.lons]))
+        self._grid = None
+
+    @classmethod
+    def from_points(cls, points: list) -> "CurrentField":
+        """
+        해류 API 응답의 격자 지점 목록으로 CurrentField를 생성합니다.
+
+        current_dir/current_speed/pre_lat/pre_lon 중 하나라도 없는 지점은 제외합니다.
+        """
+        keys = ('pre_lat', 'pre_lon', 'current_dir', 'current_speed')
+        rows = [
+            [float(d[key]) for key in keys]
+            for d in points
+            if all(d.get(key) is not None for key in keys)
+        ]
+        if not rows:
+            raise Exception("유효한 데이터가 없습니다")
+
+        lats, lons, directions, speeds = np.array(rows, dtype=float).T
+        return cls(lats, lons, directions, speeds)
+
+    def __len__(self) -> int:
+        return self.lats.shape[0]
+
+    def query(self, lats, lons, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        좌표별 k-최근접 격자 지점을 찾습니다.
+
+        Args:
+            lats: 조회 위도 배열 (길이 N)
+            lons: 조회 경도 배열 (길이 N)
+            k: 최근접 지점 수 (격자 지점 수보다 크면 격자 지점 수로 제한)
+
+        Returns:
+            (distances, indices) - 각각 N×k 배열, 가까운 순서
+        """
+        queries = np.column_stack([
+            np.asarray(lats, dtype=float).reshape(-1),
+            np.asarray(lons, dtype=float).reshape(-1)
+        ])
+        return self._tree.query(queries, k=min(k, len(self)))
+
+    def nearest(self, lats, lons) -> tuple[np.ndarray, np.ndarray]:
+        """
+        좌표별 가장 가까운 격자 지점의 해류를 반환합니다.
+
+        Returns:
+            (directions, speeds) - 각각 길이 N 배열
+        """
+        _, indices = self.query(lats, lons, k=1)
+        indices = indices[:, 0]
+        return self.directions[indices], self.speeds[indices]
+
+    def interpolate(self, lats, lons, method: str = "idw", k: int = 4, power: float = 2.0) -> tuple[np.ndarray, np.ndarray]:
+        """
+        좌표별 해류 u/v 성분을 보간합니다.
+
+        Args:
+            lats: 조회 위도 배열 (길이 N)
+            lons: 조회 경도 배열 (길이 N)
+            method: "nearest", "idw"(역거리 가중), "bilinear"(정규 격자 쌍선형)
+            k: IDW에 사용할 최근접 지점 수
+            power: IDW 거리 가중 지수
+
+        Returns:
+            (u, v) - 각각 길이 N 배열
+
+        bilinear는 격자 범위 밖이거나 주변 4개 격자 중 값이 없는 지점(육지 등)은 IDW로 대체합니다.
+        """
+        if method not in INTERPOLATION_METHODS:
+            raise Exception(f"지원하지 않는 보간 방식입니다: {method}")
+
+        lats = np.asarray(lats, dtype=float).reshape(-1)
+        lons = np.asarray(lons, dtype=float).reshape(-1)
+
+        if method == "nearest":
+            _, indices = self.query(lats, lons, k=1)
+            return self.u[indices[:, 0]], self.v[indices[:, 0]]
+        if method == "idw":
+            return self._interpolate_idw(lats, lons, k, power)
+
+        u, v = self._interpolate_bilinear(lats, lons)
+        missing = np.isnan(u) | np.isnan(v)
+        if missing.any():
+            u[missing], v[missing] = self._interpolate_idw(lats[missing], lons[missing], k, power)
+        return u, v
+
+    def interpolate_direction_speed(self, lats, lons, method: str = "idw", **kwargs) -> tuple[np.ndarray, np.ndarray]:
+        """
+        interpolate 결과를 (방향, 속도)로 변환합니다.
+
+        Returns:
+            (directions, speeds) - 방향은 0~360도
+        """
+        u, v = self.interpolate(lats, lons, method=method, **kwargs)
+        return np.rad2deg(np.arctan2(v, u)) % 360, np.hypot(u, v)
+
+    def _interpolate_idw(self, lats, lons, k: int, power: float) -> tuple[np.ndarray, np.ndarray]:
+        """역거리 가중(IDW) 보간"""
+        if lats.shape[0] == 0:
+            return np.empty(0), np.empty(0)
+
+        distances, indices = self.query(lats, lons, k=k)
+
+        # 격자 지점과 정확히 일치하는 좌표는 해당 지점 값을 그대로 사용
+        exact = distances[:, 0] < 1e-12
+        with np.errstate(divide="ignore"):
+            weights = 1.0 / np.power(distances, power)
+        weights[exact] = 0.0
+        weights[exact, 0] = 1.0
+
+        total = weights.sum(axis=1)
+        u = (weights * self.u[indices]).sum(axis=1) / total
+        v = (weights * self.v[indices]).sum(axis=1) / total
+        return u, v
+
+    def _regular_grid(self):
+        """
+        격자 지점을 (위도 축, 경도 축, U, V) 정규 격자로 재배열합니다 (최초 1회).
+
+        격자가 정규 격자로 보기 어려우면 None을 반환합니다.
+        """
+        if self._grid is None:
+            lat_axis, lat_index = np.unique(np.round(self.lats, 6), return_inverse=True)
+            lon_axis, lon_index = np.unique(np.round(self.lons, 6), return_inverse=True)
+
+            # 축이 2개 미만이거나 격자 칸 대비 지점 수가 너무 적으면 정규 격자가 아님
+            cells = lat_axis.shape[0] * lon_axis.shape[0]
+            if lat_axis.shape[0] < 2 or lon_axis.shape[0] < 2 or cells > 4 * len(self):
+                self._grid = False
+            else:
+                grid_u = np.full((lat_axis.shape[0], lon_axis.shape[0]), np.nan)
+                grid_v = np.full_like(grid_u, np.nan)
+                grid_u[lat_index, lon_index] = self.u
+                grid_v[lat_index, lon_index] = self.v
+                self._grid = (lat_axis, lon_axis, grid_u, grid_v)
+        return self._grid or None
+
+    def _interpolate_bilinear(self, lats, lons) -> tuple[np.ndarray, np.ndarray]:
+        """정규 격자 쌍선형 보간 (보간 불가 지점은 NaN)"""
+        grid = self._regular_grid()
+        if grid is None:
+            return np.full(lats.shape[0], np.nan), np.full(lats.shape[0], np.nan)
+
+        lat_axis, lon_axis, grid_u, grid_v = grid
+        i = np.clip(np.searchsorted(lat_axis, lats, side="right") - 1, 0, lat_axis.shape[0] - 2)
+        j = np.clip(np.searchsorted(lon_axis, lons, side="right") - 1, 0, lon_axis.shape[0] - 2)
+
+        ty = (lats - lat_axis[i]) / (lat_axis[i + 1] - lat_axis[i])
+        tx = (lons - lon_axis[j]) / (lon_axis[j + 1] - lon_axis[j])
+
+        def blend(grid_values):
+            return (
+                (1 - ty) * ((1 - tx) * grid_values[i, j] + tx * grid_values[i, j + 1])
+                + ty * ((1 - tx) * grid_values[i + 1, j] + tx * grid_values[i + 1, j + 1])
+            )
+
+        u = blend(grid_u)
+        v = blend(grid_v)
+
+        outside = (ty < 0) | (ty > 1) | (tx < 0) | (tx > 1)
+        u[outside] = np.nan
+        v[outside] = np.nan
+        return u, v
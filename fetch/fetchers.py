@@ -1,25 +1,32 @@
-import requests
 import numpy as np
 from datetime import datetime, timedelta
 import os
 from dotenv import load_dotenv
 from utils import location
+from fetch.client import http_client, async_http_client
+from fetch.rate_limit import upstream_rate_limits
+from fetch.cache import response_cache, make_key
+from fetch.current_field import CurrentField
+from collections import OrderedDict
+import threading
 
 load_dotenv()
 
-def fetch_current(date: datetime, lat: float, lot: float):
-    base_url = os.environ.get('CURRENT_API_URL')
+# 해류 조회 방식 ("nearest": 최근접 격자, "idw"/"bilinear": 주변 격자 보간)
+CURRENT_INTERPOLATION = os.environ.get('CURRENT_INTERPOLATION', 'nearest')
 
+def _current_params(date: datetime, lat: float, lot: float) -> dict:
+    """해류 API 요청 파라미터 (위경도를 포함하는 1°×1° 영역)"""
     target_date = date.strftime("%Y%m%d")
     target_hour = date.strftime("%H")
     target_minute = date.strftime("%M")
-    
+
     min_y = int(np.floor(lat))
     max_y = int(np.ceil(lat))
     min_x = int(np.floor(lot))
     max_x = int(np.ceil(lot))
 
-    params = {
+    return {
         "ServiceKey": os.environ.get('CURRENT_API_KEY'),
         "Date": target_date,
         "Hour": target_hour,
@@ -31,53 +38,15 @@ def fetch_current(date: datetime, lat: float, lot: float):
         "ResultType": "json"
     }
 
-    response = requests.get(base_url, params=params)
-
-    if response.status_code != 200:
-        raise Exception(f"API 요청 실패: {response.status_code}")
-
-    try:
-        data = response.json()
-    except ValueError as e:
-        raise Exception(f"JSON 파싱 실패: {response.text}")
-
-    if 'result' not in data or 'data' not in data['result']:
-        raise Exception("응답 데이터 형식이 올바르지 않습니다")
-
-    # 요청한 위경도와 가장 가까운 데이터 찾기
-    min_distance = float('inf')
-    closest_data = None
-
-    for d in data['result']['data']:
-        if 'current_dir' not in d or 'current_speed' not in d:
-            continue
-        if 'pre_lat' not in d or 'pre_lon' not in d:
-            continue
-        
-        # 위경도 간의 거리 계산 (유클리드 거리)
-        data_lat = float(d['pre_lat'])
-        data_lon = float(d['pre_lon'])
-        distance = np.sqrt((lat - data_lat)**2 + (lot - data_lon)**2)
-        
-        if distance < min_distance:
-            min_distance = distance
-            closest_data = d
-
-    if closest_data is None:
-        raise Exception("유효한 데이터가 없습니다")
-
-    return float(closest_data['current_dir']), float(closest_data['current_speed'])
-
-def fetch_wind(date: datetime, lat: float, lot: float):
-    base_url = os.environ.get('WIND_API_URL')
-
+def _station_params(api_key: str, date: datetime, lat: float, lot: float) -> dict:
+    """관측소 API(바람/수온) 요청 파라미터 (가장 가까운 관측소 기준)"""
     nearest = location.find_nearest_location(lat, lot)
-    
+
     # 날짜를 YYYYMMDD 형식으로 변환
     req_date = date.strftime("%Y%m%d")
 
-    params = {
-        "serviceKey": os.environ.get('WIND_API_KEY'),
+    return {
+        "serviceKey": api_key,
         "obsCode": nearest.code,
         "reqDate": req_date,
         "min": 30,
@@ -85,20 +54,22 @@ def fetch_wind(date: datetime, lat: float, lot: float):
         "type": "json"
     }
 
-    response = requests.get(base_url, params=params)
-
+def _decode_response(response) -> dict:
+    """응답 상태 코드를 확인하고 JSON을 파싱합니다 (requests/httpx 응답 공용)"""
     if response.status_code != 200:
         raise Exception(f"API 요청 실패: {response.status_code}")
 
     try:
-        data = response.json()
+        return response.json()
     except ValueError as e:
         raise Exception(f"JSON 파싱 실패: {response.text}")
 
+def _station_items(data: dict) -> list:
+    """관측소 API 응답을 검증하고 item 목록을 반환합니다."""
     # header 검증
     if 'header' not in data:
         raise Exception("응답 데이터 형식이 올바르지 않습니다")
-    
+
     if data['header']['resultCode'] != "00":
         raise Exception(f"API 오류: {data['header'].get('resultMsg', 'Unknown error')}")
 
@@ -106,8 +77,17 @@ def fetch_wind(date: datetime, lat: float, lot: float):
     if 'body' not in data or 'items' not in data['body'] or 'item' not in data['body']['items']:
         raise Exception("응답 데이터 형식이 올바르지 않습니다")
 
-    items = data['body']['items']['item']
-    
+    return data['body']['items']['item']
+
+def _current_points(data: dict) -> list:
+    """해류 API 응답을 검증하고 격자 지점 목록을 반환합니다."""
+    if 'result' not in data or 'data' not in data['result']:
+        raise Exception("응답 데이터 형식이 올바르지 않습니다")
+
+    return data['result']['data']
+
+def _average_wind(items: list):
+    """관측소 바람 데이터의 평균 (풍향, 풍속)"""
     total_wind_dir = 0.0
     total_wind_speed = 0.0
     cnt = 0
@@ -126,47 +106,8 @@ def fetch_wind(date: datetime, lat: float, lot: float):
 
     return total_wind_dir / cnt, total_wind_speed / cnt
 
-def fetch_temperature(date: datetime, lat: float, lot: float):
-    base_url = os.environ.get('TEMPERATURE_API_URL')
-
-    nearest = location.find_nearest_location(lat, lot)
-
-    # 날짜를 YYYYMMDD 형식으로 변환
-    req_date = date.strftime("%Y%m%d")
-
-    params = {
-        "serviceKey": os.environ.get('TEMPERATURE_API_KEY'),
-        "obsCode": nearest.code,
-        "reqDate": req_date,
-        "min": 30,
-        "numOfRows": 300,
-        "type": "json"
-    }
-
-    response = requests.get(base_url, params=params)
-    print(f'response: {response.url}')
-
-    if response.status_code != 200:
-        raise Exception(f"API 요청 실패: {response.status_code}")
-
-    try:
-        data = response.json()
-    except ValueError as e:
-        raise Exception(f"JSON 파싱 실패: {response.text}")
-
-    # header 검증
-    if 'header' not in data:
-        raise Exception("응답 데이터 형식이 올바르지 않습니다")
-    
-    if data['header']['resultCode'] != "00":
-        raise Exception(f"API 오류: {data['header'].get('resultMsg', 'Unknown error')}")
-
-    # body 검증
-    if 'body' not in data or 'items' not in data['body'] or 'item' not in data['body']['items']:
-        raise Exception("응답 데이터 형식이 올바르지 않습니다")
-
-    items = data['body']['items']['item']
-    
+def _average_temperature(items: list):
+    """관측소 수온 데이터의 평균"""
     total_temperature = 0.0
     cnt = 0
 
@@ -181,4 +122,118 @@ def fetch_temperature(date: datetime, lat: float, lot: float):
     if cnt == 0:
         raise Exception("유효한 데이터가 없습니다")
 
-    return total_temperature / cnt
\ No newline at end of file
+    return total_temperature / cnt
+
+# 타일별 CurrentField (KD-tree 인덱스) 재사용: 캐시 키 -> (격자 지점 목록, CurrentField)
+_FIELD_CACHE_SIZE = 64
+_field_cache: OrderedDict = OrderedDict()
+_field_lock = threading.Lock()
+
+def _current_field(key: str, points: list) -> CurrentField:
+    """격자 지점 목록의 CurrentField를 반환합니다 (같은 응답이면 인덱스 재사용)"""
+    with _field_lock:
+        cached = _field_cache.get(key)
+        if cached is not None and cached[0] is points:
+            _field_cache.move_to_end(key)
+            return cached[1]
+
+    field = CurrentField.from_points(points)
+    with _field_lock:
+        _field_cache[key] = (points, field)
+        _field_cache.move_to_end(key)
+        while len(_field_cache) > _FIELD_CACHE_SIZE:
+            _field_cache.popitem(last=False)
+    return field
+
+def _current_key(params: dict) -> str:
+    """해류 응답 캐시 키 (영역 + 시각)"""
+    bbox = f"{params['MinX']},{params['MinY']},{params['MaxX']},{params['MaxY']}"
+    return make_key("current", bbox, params['Date'], params['Hour'] + params['Minute'])
+
+def _station_key(feed: str, params: dict) -> str:
+    """관측소 응답 캐시 키 (관측소 + 날짜)"""
+    return make_key(feed, params['obsCode'], params['reqDate'])
+
+def fetch_current_field(date: datetime, lat: float, lot: float) -> CurrentField:
+    """
+    위경도를 포함하는 타일의 해류 격자를 조회합니다.
+
+    타일은 시각별로 한 번만 다운로드하며, 같은 타일의 모든 좌표는 같은 CurrentField를 공유합니다.
+    """
+    base_url = os.environ.get('CURRENT_API_URL')
+    params = _current_params(date, lat, lot)
+    key = _current_key(params)
+
+    def fetch():
+        response = http_client.get(base_url, params=params)
+        return _current_points(_decode_response(response))
+
+    points = response_cache.get_or_fetch(key, response_cache.ttl_for(date), fetch)
+    return _current_field(key, points)
+
+def _fetch_station_items(feed: str, date: datetime, lat: float, lot: float) -> list:
+    """관측소(바람/수온) 데이터 목록 조회 (캐시 우선)"""
+    base_url = os.environ.get(f'{feed.upper()}_API_URL')
+    params = _station_params(os.environ.get(f'{feed.upper()}_API_KEY'), date, lat, lot)
+
+    def fetch():
+        response = http_client.get(base_url, params=params)
+        return _station_items(_decode_response(response))
+
+    return response_cache.get_or_fetch(_station_key(feed, params), response_cache.ttl_for(date), fetch)
+
+async def fetch_current_field_async(date: datetime, lat: float, lot: float) -> CurrentField:
+    """fetch_current_field의 비동기 버전"""
+    base_url = os.environ.get('CURRENT_API_URL')
+    params = _current_params(date, lat, lot)
+    key = _current_key(params)
+
+    async def fetch():
+        await upstream_rate_limits.acquire("current")
+        response = await async_http_client.get(base_url, params=params)
+        return _current_points(_decode_response(response))
+
+    points = await response_cache.get_or_fetch_async(key, response_cache.ttl_for(date), fetch)
+    return _current_field(key, points)
+
+async def _fetch_station_items_async(feed: str, date: datetime, lat: float, lot: float) -> list:
+    """_fetch_station_items의 비동기 버전"""
+    base_url = os.environ.get(f'{feed.upper()}_API_URL')
+    params = _station_params(os.environ.get(f'{feed.upper()}_API_KEY'), date, lat, lot)
+
+    async def fetch():
+        await upstream_rate_limits.acquire(feed)
+        response = await async_http_client.get(base_url, params=params)
+        return _station_items(_decode_response(response))
+
+    return await response_cache.get_or_fetch_async(_station_key(feed, params), response_cache.ttl_for(date), fetch)
+
+def _current_at(field: CurrentField, lat: float, lot: float, method: str):
+    """CurrentField에서 한 좌표의 (방향, 속도)를 조회합니다."""
+    if method == 'nearest':
+        directions, speeds = field.nearest([lat], [lot])
+    else:
+        directions, speeds = field.interpolate_direction_speed([lat], [lot], method=method)
+    return float(directions[0]), float(speeds[0])
+
+def fetch_current(date: datetime, lat: float, lot: float, method: str = None):
+    return _current_at(fetch_current_field(date, lat, lot), lat, lot, method or CURRENT_INTERPOLATION)
+
+def fetch_wind(date: datetime, lat: float, lot: float):
+    return _average_wind(_fetch_station_items("wind", date, lat, lot))
+
+def fetch_temperature(date: datetime, lat: float, lot: float):
+    return _average_temperature(_fetch_station_items("temperature", date, lat, lot))
+
+async def fetch_current_async(date: datetime, lat: float, lot: float, method: str = None):
+    """fetch_current의 비동기 버전"""
+    field = await fetch_current_field_async(date, lat, lot)
+    return _current_at(field, lat, lot, method or CURRENT_INTERPOLATION)
+
+async def fetch_wind_async(date: datetime, lat: float, lot: float):
+    """fetch_wind의 비동기 버전"""
+    return _average_wind(await _fetch_station_items_async("wind", date, lat, lot))
+
+async def fetch_temperature_async(date: datetime, lat: float, lot: float):
+    """fetch_temperature의 비동기 버전"""
+    return _average_temperature(await _fetch_station_items_async("temperature", date, lat, lot))
@@ -0,0 +1,86 @@
+"""
+업스트림 API별 요청 속도 제한
+
+해류/바람/수온 API마다 초당 요청 수를 토큰 버킷으로 제한합니다.
+비동기 조회(fetch_*_async)에서 캐시에 없는 요청(실제 네트워크 호출)에만 적용되며, 설정하지 않은 feed는 제한하지 않습니다.
+동기 조회(fetch_current, fetch_wind 등)는 API 서버/수집 경로에서 사용하지 않으므로 제한하지 않습니다.
+
+    UPSTREAM_RATE_LIMITS  feed별 초당 요청 수 (예: "current=2,wind=5,temperature=5")
+"""
+import asyncio
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def parse_rate_limits(value: str) -> dict[str, float]:
+    """"feed=rate,feed=rate" 형식의 설정을 dict로 변환합니다."""
+    limits = {}
+    for item in (value or "").split(","):
+        if "=" not in item:
+            continue
+        feed, rate = item.split("=", 1)
+        try:
+            limits[feed.strip()] = float(rate)
+        except ValueError:
+            continue
+    return {feed: rate for feed, rate in limits.items() if feed and rate > 0}
+
+
+class RateLimiter:
+    """토큰 버킷 속도 제한 (이벤트 루프에 묶이지 않아 여러 루프/스레드에서 공유 가능)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            burst: 연속으로 허용하는 최대 요청 수
+        """
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고, 사용 가능해질 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self):
+        """요청 한 건을 보낼 수 있을 때까지 기다립니다."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class UpstreamRateLimits:
+    """feed 이름별 RateLimiter 모음"""
+
+    def __init__(self, limits: dict[str, float] = None):
+        self._limiters: dict[str, RateLimiter] = {}
+        self.configure(limits if limits is not None else parse_rate_limits(os.environ.get("UPSTREAM_RATE_LIMITS", "")))
+
+    def configure(self, limits: dict[str, float]):
+        """feed별 제한을 설정합니다 (기존 설정 대체)."""
+        self._limiters = {feed: RateLimiter(rate) for feed, rate in limits.items()}
+
+    def limits(self) -> dict[str, float]:
+        return {feed: limiter.rate for feed, limiter in self._limiters.items()}
+
+    async def acquire(self, feed: str):
+        """feed에 제한이 설정되어 있으면 요청 가능할 때까지 기다립니다."""
+        limiter = self._limiters.get(feed)
+        if limiter is not None:
+            await limiter.acquire()
+
+
+# 프로세스 전역 업스트림 속도 제한
+upstream_rate_limits = UpstreamRateLimits()
@@ -8,10 +8,13 @@
 """
 import sys
 from core.database import init_db, SessionLocal
+from core.versions import bump_version
 from models.user import User
 from models.beach import Beach
 from models.beach_prediction import BeachPrediction
 from models.coastal_visitor_stats import CoastalVisitorStats
+from models.prediction_rollup import DailyPredictionRollup, MonthlyPredictionRollup, BeachMonthlyRollup
+from models.data_version import DataVersion
 from passlib.context import CryptContext
 
 # bcrypt 설정 (rounds를 12로 설정하여 안전성 확보)
@@ -206,6 +209,8 @@ def create_initial_users():
                     visitor=visitor
                 )
                 db.add(stat)
+            # 실행 중인 API 서버의 대시보드 캐시 무효화
+            bump_version(db)
             db.commit()
             print(f"{len(coastal_stats_data)}개 통계 데이터 생성 완료!")
         else:
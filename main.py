@@ -3,6 +3,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from api.routes import trash, user, chat, dashboard, report
 from utils.scheduler import start_scheduler, stop_scheduler
+from core.predict import model_registry
+from core.render_pool import report_render_pool
+from fetch.client import http_client, async_http_client
 import os
 from dotenv import load_dotenv
 
@@ -13,10 +16,21 @@ load_dotenv()
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 시 실행되는 lifespan 이벤트"""
     # 시작 시
+    # 모델 미리 로드 (첫 예측 요청의 로드 지연 방지)
+    if os.environ.get("MODEL_PATH"):
+        try:
+            model_registry.get(os.environ.get("MODEL_PATH"))
+        except Exception as e:
+            print(f"모델 사전 로드 실패: {e}")
     start_scheduler()
+    # 보고서 렌더링 프로세스 시작 (각 프로세스에서 폰트/로고/스타일 로드)
+    report_render_pool.start()
     yield
     # 종료 시
     stop_scheduler()
+    report_render_pool.shutdown()
+    http_client.close()
+    await async_http_client.aclose()
 
 
 app = FastAPI(
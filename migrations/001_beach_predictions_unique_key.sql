@@ -0,0 +1,13 @@
+-- beach_predictions (beach_name, prediction_date) 유니크 키 추가
+-- 일괄 upsert(INSERT ... ON DUPLICATE KEY UPDATE)를 위해 필요합니다.
+
+-- 1. 중복 데이터 정리 (같은 해변/날짜 중 가장 최근에 저장된 행만 유지)
+DELETE p1 FROM beach_predictions p1
+JOIN beach_predictions p2
+  ON p1.beach_name = p2.beach_name
+ AND p1.prediction_date = p2.prediction_date
+ AND p1.id < p2.id;
+
+-- 2. 유니크 키 추가
+ALTER TABLE beach_predictions
+  ADD UNIQUE KEY uk_beach_date (beach_name, prediction_date);
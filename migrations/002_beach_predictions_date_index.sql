@@ -0,0 +1,9 @@
+-- beach_predictions (prediction_date, beach_name) 복합 인덱스
+-- 대시보드 월별 집계/기간 조회의 날짜 범위 조건(prediction_date >= ? AND prediction_date < ?)용.
+-- 복합 인덱스의 앞 컬럼이 prediction_date이므로 기존 prediction_date 단일 인덱스는 제거합니다.
+
+ALTER TABLE beach_predictions
+  ADD INDEX ix_beach_predictions_date_beach (prediction_date, beach_name);
+
+ALTER TABLE beach_predictions
+  DROP INDEX ix_beach_predictions_prediction_date;
@@ -0,0 +1,68 @@
+-- 예측 집계 테이블 초기 데이터
+-- 테이블은 init_db.py(create_all)가 만들고, 여기서는 기존 beach_predictions로 집계를 채웁니다.
+-- 이후에는 예측 저장 시(core.rollups.refresh_rollups) 갱신되며,
+-- 다시 만들어야 하면 python scripts/rebuild_rollups.py 를 실행합니다.
+
+INSERT INTO daily_prediction_rollups
+  (prediction_date, total_amount, prediction_count, high_count, medium_count, low_count, updated_at)
+SELECT prediction_date,
+       SUM(trash_amount),
+       COUNT(*),
+       SUM(status = 'HIGH'),
+       SUM(status = 'MEDIUM'),
+       SUM(status = 'LOW'),
+       UTC_TIMESTAMP()
+FROM beach_predictions
+GROUP BY prediction_date
+ON DUPLICATE KEY UPDATE
+  total_amount = VALUES(total_amount),
+  prediction_count = VALUES(prediction_count),
+  high_count = VALUES(high_count),
+  medium_count = VALUES(medium_count),
+  low_count = VALUES(low_count),
+  updated_at = VALUES(updated_at);
+
+INSERT INTO monthly_prediction_rollups
+  (`year_month`, total_amount, prediction_count, high_count, medium_count, low_count, updated_at)
+SELECT DATE_FORMAT(prediction_date, '%Y-%m'),
+       SUM(total_amount),
+       SUM(prediction_count),
+       SUM(high_count),
+       SUM(medium_count),
+       SUM(low_count),
+       UTC_TIMESTAMP()
+FROM daily_prediction_rollups
+GROUP BY DATE_FORMAT(prediction_date, '%Y-%m')
+ON DUPLICATE KEY UPDATE
+  total_amount = VALUES(total_amount),
+  prediction_count = VALUES(prediction_count),
+  high_count = VALUES(high_count),
+  medium_count = VALUES(medium_count),
+  low_count = VALUES(low_count),
+  updated_at = VALUES(updated_at);
+
+INSERT INTO beach_monthly_rollups
+  (`year_month`, beach_name, total_amount, prediction_count,
+   latest_date, latest_amount, latest_status, latitude, longitude, updated_at)
+SELECT m.`year_month`, m.beach_name, m.total_amount, m.prediction_count,
+       p.prediction_date, p.trash_amount, p.status, p.latitude, p.longitude, UTC_TIMESTAMP()
+FROM (
+  SELECT DATE_FORMAT(prediction_date, '%Y-%m') AS `year_month`,
+         beach_name,
+         SUM(trash_amount) AS total_amount,
+         COUNT(*) AS prediction_count,
+         MAX(prediction_date) AS latest_date
+  FROM beach_predictions
+  GROUP BY DATE_FORMAT(prediction_date, '%Y-%m'), beach_name
+) m
+JOIN beach_predictions p
+  ON p.beach_name = m.beach_name AND p.prediction_date = m.latest_date
+ON DUPLICATE KEY UPDATE
+  total_amount = VALUES(total_amount),
+  prediction_count = VALUES(prediction_count),
+  latest_date = VALUES(latest_date),
+  latest_amount = VALUES(latest_amount),
+  latest_status = VALUES(latest_status),
+  latitude = VALUES(latitude),
+  longitude = VALUES(longitude),
+  updated_at = VALUES(updated_at);
@@ -0,0 +1,5 @@
+-- 대시보드 응답 캐시용 데이터 버전 카운터 초기 행
+-- 테이블은 init_db.py(create_all)가 만들고, 첫 저장 시 동시에 행을 만들다 충돌하지 않도록 미리 넣어 둡니다.
+
+INSERT IGNORE INTO data_versions (name, version, updated_at)
+VALUES ('dashboard', 0, UTC_TIMESTAMP());
@@ -0,0 +1,6 @@
+-- coastal_visitor_stats (year_month, region) 인덱스
+-- 대시보드 방문객 통계의 기간 조건(year_month BETWEEN ? AND ?)과 최신 월 조회(MAX(year_month))용.
+-- 기존 유니크 키(region, year_month)는 지역을 지정한 경우에만 기간 조건에 사용할 수 있습니다.
+
+ALTER TABLE coastal_visitor_stats
+  ADD INDEX ix_coastal_visitor_stats_month (`year_month`, region);
@@ -0,0 +1,10 @@
+-- beach_predictions 날짜 범위 커버링 인덱스
+-- 해변별 최신 예측(ROW_NUMBER() OVER (PARTITION BY beach_name ORDER BY prediction_date DESC, id DESC))과
+-- 해변별 월 합계가 날짜 구간의 인덱스만 읽도록 조회 컬럼을 포함합니다 (InnoDB 보조 인덱스는 id를 포함).
+-- 앞 컬럼이 같은 (prediction_date, beach_name) 인덱스는 이 인덱스로 대체되므로 제거합니다.
+
+ALTER TABLE beach_predictions
+  ADD INDEX ix_beach_predictions_date_cover (prediction_date, beach_name, trash_amount, status, latitude, longitude);
+
+ALTER TABLE beach_predictions
+  DROP INDEX ix_beach_predictions_date_beach;
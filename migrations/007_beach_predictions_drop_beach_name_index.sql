@@ -0,0 +1,6 @@
+-- beach_predictions beach_name 단일 인덱스 제거
+-- 유니크 키 uk_beach_date (beach_name, prediction_date)가 beach_name으로 시작하는 조회를 모두 처리하므로
+-- 단일 컬럼 인덱스는 중복이며 upsert마다 쓰기 비용만 추가합니다.
+
+ALTER TABLE beach_predictions
+  DROP INDEX ix_beach_predictions_beach_name;
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Date
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, UniqueConstraint, Index
 from datetime import datetime
 from core.database import Base
 
@@ -7,8 +7,8 @@ class BeachPrediction(Base):
     __tablename__ = "beach_predictions"
     
     id = Column(Integer, primary_key=True, index=True)
-    beach_name = Column(String(50), nullable=False, index=True)
-    prediction_date = Column(Date, nullable=False, index=True)
+    beach_name = Column(String(50), nullable=False)  # 조회는 uk_beach_date (beach_name, prediction_date) 사용
+    prediction_date = Column(Date, nullable=False)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
     trash_amount = Column(Float, nullable=False)
@@ -20,5 +20,15 @@ class BeachPrediction(Base):
     wind_speed = Column(Float, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        UniqueConstraint('beach_name', 'prediction_date', name='uk_beach_date'),
+        # 날짜 범위 집계(기간 조회/집계 갱신)용 커버링 인덱스. prediction_date 단일 인덱스를 대체
+        # 해변별 최신 예측(core.rollups.latest_per_beach)과 월 합계가 테이블 행을 읽지 않도록 조회 컬럼을 포함
+        Index(
+            'ix_beach_predictions_date_cover',
+            'prediction_date', 'beach_name', 'trash_amount', 'status', 'latitude', 'longitude'
+        ),
+    )
+    
     def __repr__(self):
         return f"<BeachPrediction(beach_name='{self.beach_name}', date='{self.prediction_date}', trash_amount={self.trash_amount})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, Integer, UniqueConstraint
+from sqlalchemy import Column, BigInteger, String, Integer, UniqueConstraint, Index
 from core.database import Base
 
 
@@ -12,4 +12,6 @@ class CoastalVisitorStats(Base):
     
     __table_args__ = (
         UniqueConstraint('region', 'year_month', name='uk_region_month'),
+        # 지역 조건 없이 기간만으로 조회하는 대시보드 방문객 통계용
+        Index('ix_coastal_visitor_stats_month', 'year_month', 'region'),
     )
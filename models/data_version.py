@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from core.database import Base
+
+
+class DataVersion(Base):
+    """데이터 버전 카운터 (예측 저장 시 증가, 응답 캐시 무효화용)"""
+    __tablename__ = "data_versions"
+    
+    name = Column(String(50), primary_key=True)  # 예: "dashboard"
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<DataVersion(name='{self.name}', version={self.version})>"
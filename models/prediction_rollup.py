@@ -0,0 +1,54 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date
+from datetime import datetime
+from core.database import Base
+
+
+class DailyPredictionRollup(Base):
+    """날짜별 전체 해변 예측 집계 (beach_predictions 저장 시 갱신)"""
+    __tablename__ = "daily_prediction_rollups"
+    
+    prediction_date = Column(Date, primary_key=True)
+    total_amount = Column(Float, nullable=False, default=0.0)  # 쓰레기 예측량 합계 (kg)
+    prediction_count = Column(Integer, nullable=False, default=0)  # 예측 행 수 (해변 수)
+    high_count = Column(Integer, nullable=False, default=0)  # HIGH 해변 수
+    medium_count = Column(Integer, nullable=False, default=0)  # MEDIUM 해변 수
+    low_count = Column(Integer, nullable=False, default=0)  # LOW 해변 수
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<DailyPredictionRollup(date='{self.prediction_date}', total_amount={self.total_amount})>"
+
+
+class MonthlyPredictionRollup(Base):
+    """월별 전체 해변 예측 집계 (일별 집계에서 갱신)"""
+    __tablename__ = "monthly_prediction_rollups"
+    
+    year_month = Column(String(7), primary_key=True)  # YYYY-MM 형식
+    total_amount = Column(Float, nullable=False, default=0.0)
+    prediction_count = Column(Integer, nullable=False, default=0)
+    high_count = Column(Integer, nullable=False, default=0)
+    medium_count = Column(Integer, nullable=False, default=0)
+    low_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<MonthlyPredictionRollup(year_month='{self.year_month}', total_amount={self.total_amount})>"
+
+
+class BeachMonthlyRollup(Base):
+    """해변별 월간 예측 집계 + 해당 월의 최신 예측 (일별 집계와 함께 갱신)"""
+    __tablename__ = "beach_monthly_rollups"
+    
+    year_month = Column(String(7), primary_key=True)  # YYYY-MM 형식
+    beach_name = Column(String(50), primary_key=True)
+    total_amount = Column(Float, nullable=False, default=0.0)
+    prediction_count = Column(Integer, nullable=False, default=0)
+    latest_date = Column(Date, nullable=False)  # 해당 월의 최신 예측 날짜
+    latest_amount = Column(Float, nullable=False)  # 최신 예측 쓰레기 양 (kg)
+    latest_status = Column(String(20), nullable=False)  # 최신 예측 상태 (LOW/MEDIUM/HIGH)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<BeachMonthlyRollup(year_month='{self.year_month}', beach='{self.beach_name}')>"
@@ -0,0 +1,111 @@
+"""
+DB 마이그레이션 실행 스크립트
+
+migrations/ 디렉토리의 SQL 파일을 파일 이름 순서대로 실행하고,
+적용한 파일은 schema_migrations 테이블에 기록하여 다시 실행하지 않습니다.
+
+init_db.py(create_all)로 새로 만든 테이블에는 모델에 정의된 인덱스/제약이 이미 있으므로,
+"이미 존재하는 키", "이미 없는 키" 오류는 적용된 것으로 간주합니다.
+
+사용법:
+    python scripts/migrate.py           (미적용 마이그레이션 실행)
+    python scripts/migrate.py --status  (적용 현황 출력)
+"""
+import os
+import sys
+import argparse
+
+# 프로젝트 루트의 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from core.database import engine
+
+MIGRATIONS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'migrations'))
+
+# 이미 적용된 상태로 볼 수 있는 MySQL 오류 코드
+# 1060: Duplicate column name, 1061: Duplicate key name, 1091: Can't DROP (존재하지 않는 키/컬럼)
+ALREADY_APPLIED_ERRORS = {1060, 1061, 1091}
+
+
+def split_statements(sql):
+    """SQL 파일 내용을 문장 단위로 분리 (주석 줄 제외)"""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [statement.strip() for statement in "\n".join(lines).split(";") if statement.strip()]
+
+
+def migration_files():
+    """migrations/ 디렉토리의 SQL 파일 목록 (이름순)"""
+    if not os.path.isdir(MIGRATIONS_DIR):
+        return []
+    return sorted(name for name in os.listdir(MIGRATIONS_DIR) if name.endswith(".sql"))
+
+
+def ensure_migrations_table(conn):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "version VARCHAR(255) NOT NULL PRIMARY KEY, "
+        "applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+    ))
+
+
+def applied_versions(conn):
+    return {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def apply_migration(conn, name):
+    """마이그레이션 파일 하나를 실행하고 기록합니다."""
+    with open(os.path.join(MIGRATIONS_DIR, name), encoding="utf-8") as f:
+        statements = split_statements(f.read())
+
+    for statement in statements:
+        try:
+            conn.execute(text(statement))
+        except (OperationalError, ProgrammingError) as e:
+            code = e.orig.args[0] if e.orig is not None and e.orig.args else None
+            if code not in ALREADY_APPLIED_ERRORS:
+                raise
+            print(f"  - 이미 적용된 변경 건너뜀: {e.orig.args[1] if len(e.orig.args) > 1 else e.orig}")
+
+    conn.execute(text("INSERT INTO schema_migrations (version) VALUES (:version)"), {"version": name})
+
+
+def migrate():
+    """미적용 마이그레이션을 순서대로 실행합니다."""
+    with engine.begin() as conn:
+        ensure_migrations_table(conn)
+        applied = applied_versions(conn)
+
+    pending = [name for name in migration_files() if name not in applied]
+    if not pending:
+        print("적용할 마이그레이션이 없습니다.")
+        return
+
+    for name in pending:
+        print(f"마이그레이션 적용 중: {name}")
+        # 파일 단위로 트랜잭션 처리 (MySQL DDL은 자동 커밋되므로 파일은 재실행 가능하게 작성)
+        with engine.begin() as conn:
+            apply_migration(conn, name)
+        print(f"✓ {name} 적용 완료")
+
+
+def print_status():
+    """마이그레이션 적용 현황 출력"""
+    with engine.begin() as conn:
+        ensure_migrations_table(conn)
+        applied = applied_versions(conn)
+
+    for name in migration_files():
+        print(f"[{'적용됨' if name in applied else '미적용'}] {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DB 마이그레이션 실행 스크립트")
+    parser.add_argument("--status", action="store_true", help="적용 현황만 출력")
+    args = parser.parse_args()
+
+    if args.status:
+        print_status()
+    else:
+        migrate()
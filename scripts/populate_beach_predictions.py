@@ -1,23 +1,26 @@
 """
 특정 기간의 해변 예측 데이터를 생성하는 스크립트
 
-이 스크립트는 get_beach_predictions API를 반복 호출하여
-지정된 날짜 범위의 예측 데이터를 생성하고 DB에 저장합니다.
+core.backfill 엔진으로 지정된 날짜 범위의 예측 데이터를 여러 날짜씩 동시에 생성하고 DB에 저장합니다.
+(API 서버를 띄울 필요가 없으며, DB에 모든 해변 데이터가 있는 날짜는 건너뜁니다)
+완료된 (날짜, 해변)은 체크포인트 파일에 기록되므로 중단된 경우 같은 명령으로 다시 실행하면 이어서 진행합니다.
 
 사용법:
     python populate_beach_predictions.py --start 2025-06-01 --end 2025-12-18
+    python populate_beach_predictions.py --start 2025-06-01 --end 2025-12-18 --workers 8 --rate current=2,wind=5
     python populate_beach_predictions.py --start 2025-06-01 --end 2025-12-18 --monthly
     python populate_beach_predictions.py  (대화형 모드)
 """
-import requests
-from datetime import datetime, timedelta
-import time
+from datetime import datetime
+import os
 import sys
 import argparse
 
-# API 설정
-BASE_URL = "http://localhost:8000"
-API_ENDPOINT = f"{BASE_URL}/api/v1/trash/beach"
+# 프로젝트 루트의 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.backfill import run_backfill
+from fetch.rate_limit import parse_rate_limits, upstream_rate_limits
 
 
 def parse_date(date_string):
@@ -30,111 +33,54 @@ def parse_date(date_string):
         )
 
 
-def populate_predictions(start_date, end_date):
+def print_summary(summary):
+    """수집 결과 요약 출력"""
+    print("\n" + "=" * 50)
+    print("데이터 생성 완료!")
+    print(f"성공: {summary['success']}일")
+    print(f"건너뜀: {summary['skipped']}일 (이미 저장된 데이터)")
+    print(f"실패: {summary['failed']}일")
+    print(f"전체: {summary['success'] + summary['skipped'] + summary['failed']}일")
+    print(f"소요 시간: {summary['elapsed']:.1f}초 ({summary['days_per_minute']:.1f}일/분)")
+    print("=" * 50)
+
+
+def populate_predictions(start_date, end_date, workers=None, checkpoint=None):
     """지정된 날짜 범위의 예측 데이터 생성
     
     Args:
         start_date: 시작 날짜 (date 객체)
         end_date: 종료 날짜 (date 객체)
+        workers: 동시에 처리할 날짜 수
+        checkpoint: 체크포인트 파일 경로
     """
     print(f"데이터 생성 시작: {start_date} ~ {end_date}")
     print(f"총 {(end_date - start_date).days + 1}일 데이터 생성 예정")
     print("-" * 50)
     
-    success_count = 0
-    fail_count = 0
-    current_date = start_date
-    
-    while current_date <= end_date:
-        date_str = current_date.strftime("%Y-%m-%d")
-        
-        try:
-            print(f"\n[{date_str}] API 호출 중...", end=" ")
-            
-            response = requests.get(
-                API_ENDPOINT,
-                params={"prediction_date": date_str},
-                timeout=300
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                beach_count = len(data)
-                print(f"✓ 성공 ({beach_count}개 해변)")
-                success_count += 1
-                
-                # 처음 3개 해변만 출력
-                for beach in data[:3]:
-                    amount = beach['prediction']['trash_amount']
-                    print(f"  - {beach['name']}: {amount:.2f}kg ({beach['status']})")
-                if beach_count > 3:
-                    print(f"  ... 외 {beach_count - 3}개 해변")
-            else:
-                print(f"✗ 실패 (HTTP {response.status_code})")
-                print(f"  오류: {response.text}")
-                fail_count += 1
-                
-        except requests.exceptions.Timeout:
-            print(f"✗ 타임아웃")
-            fail_count += 1
-        except Exception as e:
-            print(f"✗ 오류: {str(e)}")
-            fail_count += 1
-        
-        current_date += timedelta(days=1)
-        time.sleep(0.5)
-    
-    # 결과 요약
-    print("\n" + "=" * 50)
-    print("데이터 생성 완료!")
-    print(f"성공: {success_count}일")
-    print(f"실패: {fail_count}일")
-    print(f"전체: {success_count + fail_count}일")
-    print("=" * 50)
+    print_summary(run_backfill(start_date, end_date, workers, checkpoint))
 
 
-def populate_monthly_first_day(start_date, end_date):
+def populate_monthly_first_day(start_date, end_date, workers=None, checkpoint=None):
     """지정된 기간 내의 매달 1일 데이터만 생성
     
     Args:
         start_date: 시작 날짜 (date 객체)
         end_date: 종료 날짜 (date 객체)
+        workers: 동시에 처리할 날짜 수
+        checkpoint: 체크포인트 파일 경로
     """
     print("매달 1일 데이터 생성 시작")
     print(f"기간: {start_date} ~ {end_date}")
     print("-" * 50)
     
-    success_count = 0
-    fail_count = 0
-    
-    # 시작 월의 1일부터 시작
+    # 시작 월의 1일부터 종료 월의 1일까지
+    dates = []
     current_date = datetime(start_date.year, start_date.month, 1).date()
     end_month = datetime(end_date.year, end_date.month, 1).date()
     
     while current_date <= end_month:
-        date_str = current_date.strftime("%Y-%m-%d")
-        
-        try:
-            print(f"\n[{date_str}] API 호출 중...", end=" ")
-            
-            response = requests.get(
-                API_ENDPOINT,
-                params={"prediction_date": date_str},
-                timeout=300
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                print(f"✓ 성공 ({len(data)}개 해변)")
-                success_count += 1
-            else:
-                print(f"✗ 실패 (HTTP {response.status_code})")
-                fail_count += 1
-        except Exception as e:
-            print(f"✗ 오류: {str(e)}")
-            fail_count += 1
-        
-        time.sleep(0.5)
+        dates.append(current_date)
         
         # 다음 달 1일로 이동
         if current_date.month == 12:
@@ -142,7 +88,7 @@ def populate_monthly_first_day(start_date, end_date):
         else:
             current_date = datetime(current_date.year, current_date.month + 1, 1).date()
     
-    print(f"\n완료 - 성공: {success_count}, 실패: {fail_count}")
+    print_summary(run_backfill(start_date, end_date, workers, checkpoint, dates=dates))
 
 
 def interactive_mode():
@@ -195,7 +141,7 @@ def interactive_mode():
     
     if choice == "1":
         confirm = input(
-            f"\n약 {days_count}개의 API 호출이 발생합니다. 계속하시겠습니까? (y/n): "
+            f"\n약 {days_count}일치 데이터를 수집합니다. 계속하시겠습니까? (y/n): "
         ).strip().lower()
         if confirm == 'y':
             populate_predictions(start_date, end_date)
@@ -218,6 +164,7 @@ if __name__ == "__main__":
   # 커맨드라인 모드
   python populate_beach_predictions.py --start 2025-06-01 --end 2025-12-18
   python populate_beach_predictions.py --start 2025-06-01 --end 2025-12-18 --monthly
+  python populate_beach_predictions.py --start 2025-06-01 --end 2025-12-18 --workers 8 --rate current=2,wind=5
   
   # 대화형 모드
   python populate_beach_predictions.py
@@ -242,8 +189,27 @@ if __name__ == "__main__":
         help="매달 1일만 생성 (빠른 테스트용)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="동시에 처리할 날짜 수 (기본 BACKFILL_WORKERS 또는 4)"
+    )
+    
+    parser.add_argument(
+        "--checkpoint",
+        help="체크포인트 파일 경로 (기본 BACKFILL_CHECKPOINT 또는 backfill_checkpoint.jsonl)"
+    )
+    
+    parser.add_argument(
+        "--rate",
+        help="업스트림 API별 초당 요청 수 (예: current=2,wind=5,temperature=5)"
+    )
+    
     args = parser.parse_args()
     
+    if args.rate:
+        upstream_rate_limits.configure(parse_rate_limits(args.rate))
+    
     # 커맨드라인 모드
     if args.start and args.end:
         if args.end < args.start:
@@ -263,9 +229,9 @@ if __name__ == "__main__":
         print()
         
         if args.monthly:
-            populate_monthly_first_day(args.start, args.end)
+            populate_monthly_first_day(args.start, args.end, args.workers, args.checkpoint)
         else:
-            populate_predictions(args.start, args.end)
+            populate_predictions(args.start, args.end, args.workers, args.checkpoint)
     elif args.start or args.end:
         print("❌ --start와 --end를 모두 입력해야 합니다.")
         parser.print_help()
@@ -0,0 +1,52 @@
+"""
+예측 집계(rollup) 테이블 재생성 스크립트
+
+beach_predictions에서 일별/월별/해변별 월간 집계를 다시 계산합니다.
+기간을 지정하지 않으면 기존 집계를 모두 지우고 전체 데이터로 다시 만듭니다.
+
+사용법:
+    python scripts/rebuild_rollups.py
+    python scripts/rebuild_rollups.py --start 2025-06-01 --end 2025-12-18
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+
+# 프로젝트 루트의 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.database import SessionLocal
+from core.rollups import rebuild_rollups
+
+
+def parse_date(date_string):
+    """날짜 문자열을 date 객체로 변환"""
+    try:
+        return datetime.strptime(date_string, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"날짜 형식이 올바르지 않습니다: {date_string}. YYYY-MM-DD 형식을 사용하세요."
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="예측 집계 테이블 재생성 스크립트")
+    parser.add_argument("--start", type=parse_date, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=parse_date, help="종료 날짜 (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        months = rebuild_rollups(db, args.start, args.end)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"✗ 집계 재생성 실패: {str(e)}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print(f"✓ 집계 재생성 완료: {months}개월 ({time.perf_counter() - started:.1f}초)")
@@ -0,0 +1,134 @@
+import pytest
+import asyncio
+from unittest.mock import patch, Mock
+from datetime import datetime, date, timedelta
+import sys
+import os
+
+# 상위 디렉토리의 fetch 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+
+from fetch.cache import ResponseCache, response_cache
+from fetch.client import AsyncHttpClient
+from fetch import fetchers
+
+
+class TestResponseCache:
+    def test_lru_eviction(self):
+        """최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목 제거"""
+        cache = ResponseCache(max_entries=2, db_path="")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self):
+        """TTL이 지난 항목은 반환하지 않음"""
+        cache = ResponseCache(db_path="")
+        cache.set("today", [1, 2], ttl=-1)
+
+        assert cache.get("today") is None
+
+    def test_ttl_for_past_and_today(self):
+        """지난 날짜는 영구 보관, 오늘은 TTL 적용"""
+        cache = ResponseCache(db_path="", today_ttl=600)
+
+        assert cache.ttl_for(date.today() - timedelta(days=1)) is None
+        assert cache.ttl_for(datetime.now()) == 600
+
+    def test_disk_tier(self, tmp_path):
+        """SQLite 캐시는 프로세스(인스턴스)가 바뀌어도 유지"""
+        path = str(tmp_path / "cache.sqlite3")
+        ResponseCache(db_path=path).set("wind|DT_0004|20250301", [{"wspd": "1.0"}])
+
+        assert ResponseCache(db_path=path).get("wind|DT_0004|20250301") == [{"wspd": "1.0"}]
+
+    def test_async_coalescing(self):
+        """같은 키의 동시 요청은 업스트림을 한 번만 호출"""
+        cache = ResponseCache(db_path="")
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        async def run():
+            return await asyncio.gather(*(cache.get_or_fetch_async("k", None, fetch) for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert results == [{"value": 1}] * 5
+
+
+class TestCachedFetchers:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        response_cache.clear()
+        yield
+        response_cache.clear()
+
+    @pytest.fixture
+    def wind_response(self):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "header": {"resultCode": "00"},
+            "body": {"items": {"item": [{"wndrct": "90", "wspd": "2.0"}, {"wndrct": "110", "wspd": "4.0"}]}}
+        }
+        return mock_response
+
+    def test_same_station_fetched_once(self, wind_response):
+        """같은 관측소로 매핑되는 해변은 업스트림을 한 번만 호출"""
+        with patch('fetch.fetchers.http_client.get', return_value=wind_response) as mock_get:
+            first = fetchers.fetch_wind(datetime(2025, 3, 1), 33.52, 126.52)
+            second = fetchers.fetch_wind(datetime(2025, 3, 1), 33.50, 126.55)
+
+        assert first == second == pytest.approx((100.0, 3.0))
+        assert mock_get.call_count == 1
+
+    def test_failed_response_not_cached(self, wind_response):
+        """API 오류 응답은 캐시하지 않음"""
+        error_response = Mock()
+        error_response.status_code = 500
+
+        with patch('fetch.fetchers.http_client.get', side_effect=[error_response, wind_response]) as mock_get:
+            with pytest.raises(Exception):
+                fetchers.fetch_wind(datetime(2025, 3, 1), 33.52, 126.52)
+            fetchers.fetch_wind(datetime(2025, 3, 1), 33.52, 126.52)
+
+        assert mock_get.call_count == 2
+
+
+class TestAsyncHttpClient:
+    def test_host_pool_size_limits_concurrency(self):
+        """HTTP_HOST_POOL_SIZES에 설정한 호스트는 설정한 수까지만 동시에 요청"""
+        client = AsyncHttpClient(max_connections=10, host_pool_sizes={"slow.example": 2})
+        active = {"slow.example": 0, "other.example": 0}
+        peak = {"slow.example": 0, "other.example": 0}
+
+        async def handler(request):
+            host = request.url.host
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.02)
+            active[host] -= 1
+            return httpx.Response(200)
+
+        async def run():
+            client._clients[asyncio.get_running_loop()] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            await asyncio.gather(*(
+                client.get(f"https://{host}/api") for host in ["slow.example", "other.example"] * 6
+            ))
+            await client.aclose()
+
+        asyncio.run(run())
+        assert peak["slow.example"] == 2
+        assert peak["other.example"] == 6
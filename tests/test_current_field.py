@@ -0,0 +1,132 @@
+import pytest
+import numpy as np
+from unittest.mock import patch, Mock
+from datetime import datetime
+import sys
+import os
+
+# 상위 디렉토리의 fetch 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fetch.current_field import CurrentField
+from fetch.cache import response_cache
+from fetch import fetchers
+
+
+@pytest.fixture
+def grid_points():
+    """33~34°N, 126~127°E 영역의 0.1° 간격 해류 격자"""
+    rng = np.random.default_rng(0)
+    return [
+        {
+            "pre_lat": f"{lat:.2f}",
+            "pre_lon": f"{lon:.2f}",
+            "current_dir": str(rng.integers(0, 360)),
+            "current_speed": f"{rng.uniform(0, 60):.1f}"
+        }
+        for lat in np.arange(33.0, 34.01, 0.1)
+        for lon in np.arange(126.0, 127.01, 0.1)
+    ]
+
+
+class TestCurrentField:
+    def test_nearest_matches_brute_force(self, grid_points):
+        """KD-tree 최근접 결과가 전체 탐색 결과와 같은지 검증"""
+        field = CurrentField.from_points(grid_points)
+        lats = np.array([33.46129, 33.54323, 33.22843, 33.47330])
+        lons = np.array([126.29343, 126.66986, 126.47737, 126.93454])
+
+        directions, speeds = field.nearest(lats, lons)
+
+        for lat, lon, direction, speed in zip(lats, lons, directions, speeds):
+            distances = np.sqrt((field.lats - lat) ** 2 + (field.lons - lon) ** 2)
+            closest = np.argmin(distances)
+            assert direction == field.directions[closest]
+            assert speed == field.speeds[closest]
+
+    def test_k_nearest(self, grid_points):
+        """k-최근접 조회는 가까운 순서로 k개 반환"""
+        field = CurrentField.from_points(grid_points)
+
+        distances, indices = field.query([33.45], [126.45], k=4)
+
+        assert indices.shape == (1, 4)
+        assert np.all(np.diff(distances[0]) >= 0)
+
+    def test_invalid_points_skipped(self):
+        """필드가 누락된 지점은 제외"""
+        field = CurrentField.from_points([
+            {"current_dir": "100", "current_speed": "10.0", "pre_lat": "33.1", "pre_lon": "126.1"},
+            {"current_dir": "200", "pre_lat": "33.2", "pre_lon": "126.2"},
+            {"current_dir": "300", "current_speed": None, "pre_lat": "33.3", "pre_lon": "126.3"},
+        ])
+
+        assert len(field) == 1
+
+    def test_no_valid_points(self):
+        """유효한 지점이 없는 케이스"""
+        with pytest.raises(Exception) as exc_info:
+            CurrentField.from_points([{"current_dir": "100"}])
+
+        assert "유효한 데이터가 없습니다" in str(exc_info.value)
+
+
+class TestFetchCurrent:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        response_cache.clear()
+        yield
+        response_cache.clear()
+
+    def test_tile_downloaded_once(self, grid_points):
+        """같은 타일의 여러 좌표는 한 번만 다운로드"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"result": {"data": grid_points}}
+
+        with patch('fetch.fetchers.http_client.get', return_value=mock_response) as mock_get:
+            first = fetchers.fetch_current(datetime(2025, 3, 1), 33.46129, 126.29343)
+            second = fetchers.fetch_current(datetime(2025, 3, 1), 33.54323, 126.66986)
+
+        assert mock_get.call_count == 1
+        assert first != second
+
+
+class TestInterpolation:
+    @pytest.fixture
+    def linear_field(self):
+        """u = 위도, v = 경도인 선형 해류장 (0.5° 간격 정규 격자)"""
+        lats, lons = np.meshgrid(np.arange(33.0, 34.01, 0.5), np.arange(126.0, 127.01, 0.5), indexing="ij")
+        u, v = lats.ravel(), lons.ravel()
+        return CurrentField(lats.ravel(), lons.ravel(), np.rad2deg(np.arctan2(v, u)), np.hypot(u, v))
+
+    def test_bilinear_exact_on_linear_field(self, linear_field):
+        """선형 해류장에서 bilinear 보간은 정확한 값을 반환"""
+        lats = np.array([33.1, 33.25, 33.9])
+        lons = np.array([126.3, 126.75, 126.05])
+
+        u, v = linear_field.interpolate(lats, lons, method="bilinear")
+
+        assert u == pytest.approx(lats)
+        assert v == pytest.approx(lons)
+
+    def test_idw_at_grid_point(self, linear_field):
+        """격자 지점과 일치하는 좌표는 해당 지점 값"""
+        u, v = linear_field.interpolate([33.5], [126.5], method="idw")
+
+        assert u == pytest.approx([33.5])
+        assert v == pytest.approx([126.5])
+
+    def test_idw_within_neighbour_range(self, linear_field):
+        """IDW 결과는 주변 격자 값 범위 안"""
+        u, v = linear_field.interpolate([33.2], [126.2], method="idw", k=4)
+
+        assert 33.0 <= u[0] <= 33.5
+        assert 126.0 <= v[0] <= 126.5
+
+    def test_bilinear_outside_grid_falls_back(self, linear_field):
+        """격자 범위 밖은 IDW로 대체"""
+        u, v = linear_field.interpolate([34.5], [126.5], method="bilinear")
+
+        assert not np.isnan(u).any()
+        assert not np.isnan(v).any()
@@ -0,0 +1,152 @@
+import pytest
+from datetime import date
+from unittest.mock import patch
+import sys
+import os
+
+# 상위 디렉토리의 api 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.database import Base
+from core.rollups import rebuild_rollups
+from core.versions import bump_version
+from core.dashboard import DashboardCache, VisitorFilter, month_range, add_months, build_dashboard
+from api.routes.dashboard import etag_matches
+from models.beach_prediction import BeachPrediction
+from models.coastal_visitor_stats import CoastalVisitorStats
+from models.data_version import DataVersion
+from models.prediction_rollup import BeachMonthlyRollup, DailyPredictionRollup, MonthlyPredictionRollup
+
+
+@pytest.fixture
+def db():
+    """2024-11 ~ 2025-03 매일 해변 2곳의 예측 데이터 (2025-01은 없음)"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[
+        BeachPrediction.__table__, CoastalVisitorStats.__table__, DailyPredictionRollup.__table__,
+        MonthlyPredictionRollup.__table__, BeachMonthlyRollup.__table__, DataVersion.__table__
+    ])
+    session = sessionmaker(bind=engine)()
+
+    current = date(2024, 11, 1)
+    while current <= date(2025, 3, 31):
+        if current.month != 1:
+            for name, amount in (("해변A", 100.0), ("해변B", 350.0)):
+                session.add(BeachPrediction(
+                    beach_name=name, prediction_date=current, latitude=33.3, longitude=126.3,
+                    trash_amount=amount, status="LOW"
+                ))
+        current = date.fromordinal(current.toordinal() + 1)
+    session.flush()
+    rebuild_rollups(session)
+    session.commit()
+    yield session
+    session.close()
+
+
+class TestMonthRange:
+    def test_half_open_range(self):
+        """월 구간은 [해당 월 1일, 다음 달 1일)"""
+        assert month_range(2024, 2) == (date(2024, 2, 1), date(2024, 3, 1))
+
+    def test_december(self):
+        """12월의 끝은 다음 해 1월 1일"""
+        assert month_range(2025, 12) == (date(2025, 12, 1), date(2026, 1, 1))
+
+
+class TestAddMonths:
+    def test_across_year(self):
+        assert add_months(2025, 1, -1) == (2024, 12)
+        assert add_months(2024, 11, 14) == (2026, 1)
+
+
+class TestBuildDashboard:
+    def test_trend_exact_calendar_months(self, db):
+        """월별 추이는 달력 월 단위이며 데이터가 없는 달은 0"""
+        dashboard = build_dashboard(db, months=6, target_month="2025-03")
+
+        assert [(t.year, t.month) for t in dashboard.monthly_trends] == [
+            (2024, "Oct"), (2024, "Nov"), (2024, "Dec"), (2025, "Jan"), (2025, "Feb"), (2025, "Mar")
+        ]
+        assert [t.total_amount for t in dashboard.monthly_trends] == [
+            0.0, 450.0 * 30, 450.0 * 31, 0.0, 450.0 * 28, 450.0 * 31
+        ]
+
+    def test_summary_and_risk_areas(self, db):
+        dashboard = build_dashboard(db, target_month="2025-03")
+
+        assert dashboard.target_month == "2025-03"
+        assert dashboard.summary.total_predicted_amount == 450.0 * 31
+        assert dashboard.summary.high_risk_count == 1
+        assert [area.beach_name for area in dashboard.risk_areas] == ["해변B", "해변A"]
+
+    def test_invalid_target_month(self, db):
+        with pytest.raises(Exception) as exc_info:
+            build_dashboard(db, target_month="2025-13")
+
+        assert "기준 월 형식" in str(exc_info.value)
+
+
+class TestDashboardCache:
+    def test_cached_until_version_bump(self, db):
+        """버전이 같으면 다시 계산하지 않고, 예측 저장으로 버전이 오르면 다시 계산"""
+        cache = DashboardCache()
+        with patch('core.dashboard.build_dashboard', wraps=build_dashboard) as build:
+            first, etag = cache.get(db, target_month="2025-03")
+            second, second_etag = cache.get(db, target_month="2025-03")
+            assert build.call_count == 1
+            assert second is first and second_etag == etag
+
+            bump_version(db)
+            db.commit()
+            cache.get(db, target_month="2025-03")
+            assert build.call_count == 2
+
+    def test_etag_matches(self):
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('W/"abc", "def"', '"abc"')
+        assert etag_matches('*', '"abc"')
+        assert not etag_matches(None, '"abc"')
+        assert not etag_matches('"def"', '"abc"')
+
+
+class TestVisitorStats:
+    @pytest.fixture
+    def visitor_db(self, db):
+        """2023-01 ~ 2025-03 지역 2곳의 월별 방문객 (지역B는 짝수 달만)"""
+        # BigInteger 기본 키는 SQLite에서 자동 증가하지 않으므로 id 지정
+        for i in range(27):
+            year, month = add_months(2023, 1, i)
+            db.add(CoastalVisitorStats(id=i * 2 + 1, region="지역A", year_month=f"{year}-{month:02d}", visitor=i))
+            if month % 2 == 0:
+                db.add(CoastalVisitorStats(
+                    id=i * 2 + 2, region="지역B", year_month=f"{year}-{month:02d}", visitor=100 + i
+                ))
+        db.commit()
+        return db
+
+    def test_default_window_latest_months(self, visitor_db):
+        """기간 미지정시 최신 데이터 월 기준 최근 24개월만 포함"""
+        dashboard = build_dashboard(visitor_db, target_month="2025-03")
+
+        months = sorted({stat.year_month for stat in dashboard.visitor_stats})
+        assert (months[0], months[-1], len(months)) == ("2023-04", "2025-03", 24)
+        assert dashboard.visitor_matrix is None
+
+    def test_matrix_with_region_and_window(self, visitor_db):
+        """지역/기간 조건의 지역 × 월 행렬 (데이터 없는 칸은 0)"""
+        visitor_filter = VisitorFilter(regions=("지역B",), start_month="2024-11", end_month="2025-02", format="matrix")
+        dashboard = build_dashboard(visitor_db, target_month="2025-03", visitor_filter=visitor_filter)
+
+        assert dashboard.visitor_stats == []
+        assert dashboard.visitor_matrix.regions == ["지역B"]
+        assert dashboard.visitor_matrix.months == ["2024-12", "2025-02"]
+        assert dashboard.visitor_matrix.visitors == [[123, 125]]
+
+    def test_invalid_window(self, visitor_db):
+        with pytest.raises(ValueError):
+            build_dashboard(visitor_db, visitor_filter=VisitorFilter(end_month="2025-13"))
@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+from datetime import date, datetime
+import os
+import sys
+
+# 상위 디렉토리의 core 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.features import FeatureBuilder
+
+
+def scalar_features(date_obj, current_dir, current_speed, wind_dir, wind_speed):
+    """기존 단건 계산 방식의 feature"""
+    rad = np.deg2rad(current_dir)
+    current_u = current_speed * np.cos(rad)
+    current_v = current_speed * np.sin(rad)
+
+    rad = np.deg2rad(wind_dir)
+    wind_u = wind_speed * np.cos(rad)
+    wind_v = wind_speed * np.sin(rad)
+
+    dayofyear = date_obj.timetuple().tm_yday
+    day_sin = np.sin(2 * np.pi * dayofyear / 365)
+    day_cos = np.cos(2 * np.pi * dayofyear / 365)
+
+    return [dayofyear, day_sin, day_cos, wind_speed, current_speed, wind_u, wind_v, current_u, current_v]
+
+
+class TestFeatureBuilder:
+    @pytest.fixture
+    def builder(self):
+        return FeatureBuilder()
+
+    def test_matches_scalar_calculation(self, builder):
+        """벡터화 결과가 기존 단건 계산과 같은지 검증"""
+        dates = [datetime(2025, 1, 1, 15, 20), date(2024, 12, 31), date(2025, 7, 15)]
+        current_dir = [143.0, 20.0, 300.0]
+        current_speed = [5.0, 59.0, 0.0]
+        wind_dir = [10.0, 270.0, 180.0]
+        wind_speed = [3.5, 1.2, 8.0]
+
+        features = builder.build(dates, current_dir, current_speed, wind_dir, wind_speed)
+
+        expected = [
+            scalar_features(d, *values)
+            for d, values in zip(dates, zip(current_dir, current_speed, wind_dir, wind_speed))
+        ]
+        assert features.shape == (3, 9)
+        assert features == pytest.approx(np.array(expected))
+
+    def test_dayofyear_leap_year(self, builder):
+        """윤년 12월 31일은 366"""
+        assert builder.dayofyear([date(2024, 12, 31), date(2025, 12, 31)]).tolist() == [366, 365]
+
+    def test_single_date_broadcast(self, builder):
+        """단일 날짜를 여러 지점에 적용하는 케이스"""
+        features = builder.build_from_components(
+            [date(2025, 3, 1)], current_u=[1.0, 0.0], current_v=[0.0, 2.0], wind_u=[3.0, 0.0], wind_v=[4.0, 1.0]
+        )
+
+        assert features[:, 0].tolist() == [60, 60]
+        assert features[:, 3] == pytest.approx([5.0, 1.0])
+        assert features[:, 4] == pytest.approx([1.0, 2.0])
@@ -0,0 +1,240 @@
+import pytest
+import asyncio
+import numpy as np
+from unittest.mock import patch
+from datetime import date
+import sys
+import os
+import time
+
+# 상위 디렉토리의 core 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.database import Base
+from core import ingestion
+from core.backfill import BackfillEngine, Checkpoint
+from core.rollups import latest_per_beach
+from fetch.rate_limit import RateLimiter, parse_rate_limits
+from models.beach import Beach
+from models.beach_prediction import BeachPrediction
+from models.data_version import DataVersion
+from models.prediction_rollup import BeachMonthlyRollup, DailyPredictionRollup, MonthlyPredictionRollup
+
+
+@pytest.fixture
+def session_factory():
+    """해변 3곳이 등록된 인메모리 SQLite DB"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[
+        Beach.__table__, BeachPrediction.__table__, DailyPredictionRollup.__table__,
+        MonthlyPredictionRollup.__table__, BeachMonthlyRollup.__table__, DataVersion.__table__
+    ])
+    factory = sessionmaker(bind=engine)
+
+    db = factory()
+    for i in range(3):
+        db.add(Beach(name=f"해변{i}", latitude=33.2 + i * 0.1, longitude=126.2 + i * 0.1))
+    db.commit()
+    db.close()
+    return factory
+
+
+@pytest.fixture
+def upstream():
+    """업스트림 조회와 모델 예측을 대체 (호출 수 기록)"""
+    calls = []
+
+    async def fetch_current(date_obj, lat, lon):
+        calls.append("current")
+        return 90.0, 2.0
+
+    async def fetch_wind(date_obj, lat, lon):
+        calls.append("wind")
+        return 180.0, 3.0
+
+    async def fetch_temperature(date_obj, lat, lon):
+        calls.append("temperature")
+        return 15.0
+
+    with patch('fetch.fetchers.fetch_current_async', fetch_current), \
+         patch('fetch.fetchers.fetch_wind_async', fetch_wind), \
+         patch('fetch.fetchers.fetch_temperature_async', fetch_temperature), \
+         patch('core.ingestion.predict_many', side_effect=lambda path, features: np.full(len(features), 250.0)):
+        yield calls
+
+
+class TestIngestion:
+    def test_ingest_range_writes_all_beaches(self, session_factory, upstream):
+        """날짜별로 모든 해변 예측이 저장되고 입력값도 함께 저장"""
+        with patch('core.ingestion.SessionLocal', session_factory):
+            summary = asyncio.run(ingestion.ingest_range(date(2025, 3, 1), date(2025, 3, 2)))
+
+        assert summary["success"] == 2
+        assert summary["rows"] == 6
+
+        db = session_factory()
+        rows = db.query(BeachPrediction).all()
+        db.close()
+        assert len(rows) == 6
+        assert all(row.status == "MEDIUM" and row.wind_speed == 3.0 for row in rows)
+
+    def test_complete_dates_skipped(self, session_factory, upstream):
+        """이미 모든 해변 데이터가 있는 날짜는 업스트림을 호출하지 않음"""
+        with patch('core.ingestion.SessionLocal', session_factory):
+            asyncio.run(ingestion.ingest_range(date(2025, 3, 1), date(2025, 3, 1)))
+            upstream.clear()
+            summary = asyncio.run(ingestion.ingest_range(date(2025, 3, 1), date(2025, 3, 1)))
+
+        assert summary["skipped"] == 1
+        assert upstream == []
+
+    def test_ensure_computes_missing_beaches_only(self, session_factory, upstream):
+        """저장된 해변은 그대로 반환하고 누락된 해변만 업스트림 조회"""
+        db = session_factory()
+        beaches = db.query(Beach).order_by(Beach.id).all()
+        asyncio.run(ingestion.ensure_beach_predictions(db, date(2025, 3, 1), beaches[:2]))
+        upstream.clear()
+
+        rows = asyncio.run(ingestion.ensure_beach_predictions(db, date(2025, 3, 1), beaches))
+        db.close()
+
+        assert [row["beach_name"] for row in rows] == ["해변0", "해변1", "해변2"]
+        assert upstream.count("wind") == 1
+
+    def test_concurrent_requests_coalesced(self, session_factory, upstream):
+        """같은 날짜의 동시 요청은 한 번만 계산하고 결과를 공유"""
+        async def run():
+            sessions = [session_factory() for _ in range(5)]
+            beaches = sessions[0].query(Beach).order_by(Beach.id).all()
+            try:
+                return await asyncio.gather(*(
+                    ingestion.ensure_beach_predictions(db, date(2025, 3, 1), beaches) for db in sessions
+                ))
+            finally:
+                for db in sessions:
+                    db.close()
+
+        results = asyncio.run(run())
+
+        assert upstream.count("wind") == 3
+        assert all(len(rows) == 3 for rows in results)
+
+
+class TestBulkWriter:
+    def _row(self, name, amount):
+        return {
+            "beach_name": name,
+            "prediction_date": date(2025, 3, 1),
+            "latitude": 33.3,
+            "longitude": 126.3,
+            "trash_amount": amount,
+            "status": ingestion.classify_trash_amount(amount).value,
+            "temperature": 15.0
+        }
+
+    def test_upsert_updates_existing_rows(self, session_factory):
+        """같은 (해변, 날짜)는 새 값으로 갱신되고 다른 해변 데이터는 유지"""
+        db = session_factory()
+        ingestion.write_beach_predictions(db, [self._row("해변0", 100.0), self._row("해변1", 100.0)])
+        db.commit()
+        ingestion.write_beach_predictions(db, [self._row("해변1", 350.0), self._row("해변2", 250.0)], batch_size=1)
+        db.commit()
+
+        rows = {row.beach_name: row for row in db.query(BeachPrediction).all()}
+        db.close()
+        assert len(rows) == 3
+        assert rows["해변0"].trash_amount == 100.0
+        assert rows["해변1"].trash_amount == 350.0
+        assert rows["해변1"].status == "HIGH"
+
+    def test_rollups_updated_on_write(self, session_factory):
+        """저장한 날짜의 일별/월별/해변별 집계가 같은 트랜잭션에서 갱신"""
+        db = session_factory()
+        ingestion.write_beach_predictions(db, [self._row("해변0", 100.0), self._row("해변1", 350.0)])
+        db.commit()
+        ingestion.write_beach_predictions(db, [self._row("해변0", 250.0)])
+        db.commit()
+
+        daily = db.get(DailyPredictionRollup, date(2025, 3, 1))
+        monthly = db.get(MonthlyPredictionRollup, "2025-03")
+        beach = db.get(BeachMonthlyRollup, ("2025-03", "해변0"))
+        db.close()
+        assert (daily.total_amount, daily.high_count, daily.medium_count, daily.low_count) == (600.0, 1, 1, 0)
+        assert (monthly.total_amount, monthly.prediction_count) == (600.0, 2)
+        assert (beach.latest_amount, beach.latest_status) == (250.0, "MEDIUM")
+
+    def test_latest_per_beach(self, session_factory):
+        """해변마다 구간 안의 최신 예측 한 건만 반환"""
+        db = session_factory()
+        rows = [self._row("해변0", 100.0), self._row("해변1", 350.0)]
+        later = dict(self._row("해변0", 250.0), prediction_date=date(2025, 3, 20))
+        outside = dict(self._row("해변0", 400.0), prediction_date=date(2025, 4, 1))
+        ingestion.write_beach_predictions(db, rows + [later, outside])
+        db.commit()
+
+        latest = db.execute(latest_per_beach(date(2025, 3, 1), date(2025, 4, 1))).all()
+        db.close()
+        assert sorted((row.beach_name, row.prediction_date, row.trash_amount) for row in latest) == [
+            ("해변0", date(2025, 3, 20), 250.0), ("해변1", date(2025, 3, 1), 350.0)
+        ]
+
+    def test_mysql_statement(self):
+        """MySQL에서는 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 저장"""
+        from sqlalchemy.dialects import mysql
+
+        stmt = ingestion._upsert_statement("mysql", [self._row("해변0", 100.0), self._row("해변1", 200.0)])
+        sql = str(stmt.compile(dialect=mysql.dialect()))
+
+        assert "ON DUPLICATE KEY UPDATE" in sql
+        assert "beach_name = VALUES(beach_name)" not in sql
+        assert "trash_amount = VALUES(trash_amount)" in sql
+
+
+class TestBackfill:
+    def test_resume_from_checkpoint(self, session_factory, upstream, tmp_path):
+        """체크포인트에 기록된 해변은 다시 계산하지 않음"""
+        checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+        Checkpoint(checkpoint_path).record(date(2025, 3, 1), ["해변0", "해변1", "해변2"])
+        Checkpoint(checkpoint_path).record(date(2025, 3, 2), ["해변0"])
+
+        engine = BackfillEngine(date(2025, 3, 1), date(2025, 3, 3), workers=2, checkpoint_path=checkpoint_path)
+        with patch('core.backfill.SessionLocal', session_factory):
+            summary = asyncio.run(engine.run())
+
+        assert summary["skipped"] == 1
+        assert summary["success"] == 2
+        assert summary["rows"] == 5
+        assert Checkpoint(checkpoint_path).load()[date(2025, 3, 2)] == {"해변0", "해변1", "해변2"}
+
+    def test_stored_dates_skipped_without_network(self, session_factory, upstream):
+        """DB에 모든 해변 데이터가 있는 날짜는 업스트림을 호출하지 않음"""
+        with patch('core.ingestion.SessionLocal', session_factory):
+            asyncio.run(ingestion.ingest_range(date(2025, 3, 1), date(2025, 3, 1)))
+        upstream.clear()
+
+        engine = BackfillEngine(date(2025, 3, 1), date(2025, 3, 1), checkpoint_path="")
+        with patch('core.backfill.SessionLocal', session_factory):
+            summary = asyncio.run(engine.run())
+
+        assert summary["skipped"] == 1
+        assert upstream == []
+
+
+class TestRateLimit:
+    def test_parse_rate_limits(self):
+        assert parse_rate_limits("current=2, wind=0.5,bad,temperature=x") == {"current": 2.0, "wind": 0.5}
+
+    def test_rate_limiter_spaces_requests(self):
+        """초당 20건 제한에서 5건은 약 0.2초 소요"""
+        limiter = RateLimiter(rate=20)
+
+        async def run():
+            started = time.perf_counter()
+            await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+            return time.perf_counter() - started
+
+        assert asyncio.run(run()) >= 0.18
@@ -0,0 +1,89 @@
+import pytest
+import joblib
+import numpy as np
+import os
+import sys
+
+# 상위 디렉토리의 core 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sklearn.linear_model import LinearRegression
+from core.predict import ModelRegistry, FEATURE_ORDER, predict_many
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    """9개 feature를 받는 간단한 회귀 모델 파일"""
+    X = np.arange(90, dtype=float).reshape(10, 9)
+    y = X.sum(axis=1)
+    model = LinearRegression().fit(X, y)
+    path = tmp_path / "model.pkl"
+    joblib.dump(model, path)
+    return str(path)
+
+
+class TestModelRegistry:
+    def test_loads_once(self, model_file, mocker):
+        """같은 파일은 한 번만 로드하는 케이스"""
+        registry = ModelRegistry()
+        load_spy = mocker.spy(joblib, "load")
+
+        first = registry.get(model_file)
+        second = registry.get(model_file)
+
+        assert first is second
+        assert load_spy.call_count == 1
+
+    def test_reloads_when_file_changes(self, model_file):
+        """파일이 교체되면 다시 로드하는 케이스"""
+        registry = ModelRegistry()
+        first = registry.get(model_file)
+
+        joblib.dump(LinearRegression().fit(np.eye(9), np.arange(9)), model_file)
+        stat = os.stat(model_file)
+        os.utime(model_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert registry.get(model_file) is not first
+
+    def test_missing_file(self, tmp_path):
+        """모델 파일이 없는 케이스"""
+        registry = ModelRegistry()
+        with pytest.raises(Exception) as exc_info:
+            registry.get(str(tmp_path / "missing.pkl"))
+
+        assert "모델 파일을 찾을 수 없습니다" in str(exc_info.value)
+
+    def test_stats(self, model_file):
+        """로드 시간과 메모리 사용량 통계"""
+        registry = ModelRegistry()
+        registry.get(model_file)
+
+        stats = registry.stats()
+        assert len(stats) == 1
+        assert stats[0]["load_seconds"] >= 0
+        assert stats[0]["memory_bytes"] > 0
+
+
+class TestPredictMany:
+    def test_matrix_input(self, model_file):
+        """N×9 행렬을 한 번에 예측하는 케이스"""
+        features = np.arange(27, dtype=float).reshape(3, 9)
+
+        predictions = predict_many(model_file, features)
+
+        assert predictions.shape == (3,)
+        assert predictions == pytest.approx(features.sum(axis=1))
+
+    def test_columnar_input(self, model_file):
+        """FEATURE_ORDER 이름을 키로 하는 열 단위 dict 입력"""
+        features = np.arange(18, dtype=float).reshape(2, 9)
+        columns = {name: features[:, i] for i, name in enumerate(FEATURE_ORDER)}
+
+        assert predict_many(model_file, columns) == pytest.approx(predict_many(model_file, features))
+
+    def test_invalid_shape(self, model_file):
+        """feature 개수가 맞지 않는 케이스"""
+        with pytest.raises(Exception) as exc_info:
+            predict_many(model_file, np.zeros((2, 8)))
+
+        assert "feature 행렬 형태가 올바르지 않습니다" in str(exc_info.value)
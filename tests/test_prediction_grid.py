@@ -0,0 +1,115 @@
+import pytest
+import asyncio
+import gzip
+import json
+import numpy as np
+from unittest.mock import patch
+from datetime import date
+import sys
+import os
+
+# 상위 디렉토리의 core 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core import prediction_grid
+from core.prediction_grid import TileStore, compute_tile, tile_bounds, tiles_for_bounds
+from fetch.current_field import CurrentField
+from api.routes import trash
+
+
+@pytest.fixture
+def stub_upstream():
+    """업스트림 조회와 모델 예측을 고정 값으로 대체"""
+    field = CurrentField.from_points([
+        {"pre_lat": f"{lat:.1f}", "pre_lon": f"{lon:.1f}", "current_dir": "90", "current_speed": "20"}
+        for lat in np.arange(33.0, 34.01, 0.5)
+        for lon in np.arange(126.0, 127.01, 0.5)
+    ])
+
+    async def fetch_current_field_async(date_obj, lat, lon):
+        return field
+
+    async def fetch_wind_async(date_obj, lat, lon):
+        return 90.0, 2.0
+
+    with patch("core.prediction_grid.fetchers.fetch_current_field_async", side_effect=fetch_current_field_async) as current, \
+         patch("core.prediction_grid.fetchers.fetch_wind_async", side_effect=fetch_wind_async), \
+         patch("core.prediction_grid.predict_many", side_effect=lambda model_path, features: np.full(len(features), 1.5)):
+        yield current
+
+
+class TestTiles:
+    def test_tile_bounds(self):
+        min_lat, min_lon, max_lat, max_lon = tile_bounds(1, 1, 0)
+        assert (min_lat, min_lon, max_lon) == pytest.approx((0.0, 0.0, 180.0))
+        assert max_lat == pytest.approx(85.0511, abs=1e-4)
+
+    def test_tile_outside_jeju_is_empty(self, stub_upstream):
+        """예측 영역 밖의 타일은 업스트림 호출 없이 빈 결과"""
+        tile = asyncio.run(compute_tile(date(2025, 3, 1), 10, 0, 0))
+
+        assert tile["lats"] == tile["lons"] == tile["trash_amount"] == []
+        assert stub_upstream.call_count == 0
+
+    def test_jeju_tile_clipped_to_grid_bounds(self, stub_upstream):
+        x, y = tiles_for_bounds(10)[0]
+        tile = asyncio.run(compute_tile(date(2025, 3, 1), 10, x, y))
+
+        min_lat, min_lon, max_lat, max_lon = prediction_grid.GRID_BOUNDS
+        assert tile["trash_amount"] and set(tile["trash_amount"]) == {1.5}
+        assert all(min_lat <= lat <= max_lat for lat in tile["lats"])
+        assert all(min_lon <= lon <= max_lon for lon in tile["lons"])
+
+
+class TestTileStore:
+    def test_compute_once_and_serve_from_disk(self, tmp_path):
+        """같은 타일의 동시 요청은 한 번만 계산하고, 이후에는 디스크에서 제공"""
+        computed = []
+
+        async def fake_compute(target_date, z, x, y):
+            computed.append((z, x, y))
+            await asyncio.sleep(0.02)
+            return {"z": z, "x": x, "y": y}
+
+        store = TileStore(directory=str(tmp_path))
+        with patch("core.prediction_grid.compute_tile", side_effect=fake_compute):
+            async def run():
+                return await asyncio.gather(*(store.get_or_compute(date(2025, 3, 1), 10, 1, 2) for _ in range(3)))
+
+            results = asyncio.run(run())
+
+            # 새 저장소(다른 프로세스)도 디스크의 타일 사용
+            content = asyncio.run(TileStore(directory=str(tmp_path)).get_or_compute(date(2025, 3, 1), 10, 1, 2))
+
+        assert len(computed) == 1
+        assert len(set(results)) == 1
+        assert json.loads(gzip.decompress(content)) == {"z": 10, "x": 1, "y": 2}
+
+
+class TestGridRoute:
+    @pytest.fixture
+    def client(self, stub_upstream):
+        app = FastAPI()
+        app.include_router(trash.router, prefix="/api")
+        with patch.object(prediction_grid, "tile_store", TileStore(directory="")):
+            yield TestClient(app)
+
+    def test_out_of_range_tile(self, client):
+        assert client.get("/api/v1/trash/grid/10/1024/0").status_code == 400
+        assert client.get("/api/v1/trash/grid/10/0/1024").status_code == 400
+
+    def test_gzip_only_when_accepted(self, client):
+        x, y = tiles_for_bounds(10)[0]
+        url = f"/api/v1/trash/grid/10/{x}/{y}?prediction_date=2025-03-01"
+
+        compressed = client.get(url, headers={"Accept-Encoding": "gzip"})
+        plain = client.get(url, headers={"Accept-Encoding": "identity"})
+
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in plain.headers
+        assert plain.headers["vary"] == "Accept-Encoding"
+        assert plain.json() == compressed.json()
+        assert plain.json()["trash_amount"]
@@ -0,0 +1,48 @@
+import pytest
+import asyncio
+import time
+import sys
+import os
+
+# 상위 디렉토리의 core 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.render_pool import RenderPool, RenderPoolBusy, RenderTimeout
+
+
+@pytest.fixture
+def pool():
+    pool = RenderPool(workers=1, max_queue=1, timeout=10)
+    yield pool
+    pool.shutdown()
+
+
+class TestRenderPool:
+    def test_runs_in_worker_process(self, pool):
+        """작업은 다른 프로세스에서 실행되고 결과가 반환됨"""
+        assert asyncio.run(pool.submit(os.getpid)) != os.getpid()
+        assert pool.pending == 0
+
+    def test_queue_limit(self, pool):
+        """실행 중 + 대기 중 작업이 한도를 넘으면 RenderPoolBusy"""
+        async def run():
+            running = [asyncio.ensure_future(pool.submit(time.sleep, 0.5)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with pytest.raises(RenderPoolBusy):
+                await pool.submit(time.sleep, 0)
+            await asyncio.gather(*running)
+
+        asyncio.run(run())
+        assert pool.pending == 0
+
+    def test_timeout(self, pool):
+        """제한 시간을 넘기면 RenderTimeout (작업이 끝날 때까지 대기 한도에 포함)"""
+        pool.timeout = 0.2
+
+        async def run():
+            await pool.submit(os.getpid)  # 프로세스 시작 시간 제외
+            with pytest.raises(RenderTimeout):
+                await pool.submit(time.sleep, 1)
+            assert pool.pending == 1
+
+        asyncio.run(run())
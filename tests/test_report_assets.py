@@ -0,0 +1,33 @@
+import os
+import sys
+
+# 상위 디렉토리의 core 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.report_assets import LOGO_PATH, ReportAssets
+
+
+class TestReportAssets:
+    def test_load_once(self, tmp_path):
+        """폰트가 없으면 기본 폰트로 대체하고, 두 번째 load는 다시 불러오지 않음"""
+        assets = ReportAssets(font_dir=str(tmp_path))
+        assets.load()
+        timings = dict(assets.timings)
+        assets.load()
+
+        assert assets.font == "Helvetica"
+        assert assets.styles["body"].fontName == "Helvetica"
+        assert {"fonts", "logos", "styles", "total"} <= set(timings)
+        assert assets.timings == timings
+
+    def test_logo_prescaled(self, tmp_path):
+        """로고는 출력 크기에 맞게 축소된 PNG로 보관"""
+        from PIL import Image
+        from io import BytesIO
+
+        assets = ReportAssets(font_dir=str(tmp_path)).load()
+
+        with Image.open(BytesIO(assets.logos[LOGO_PATH])) as image:
+            assert max(image.size) <= 200
+        assert assets.logo() is not None
+        assert assets.logo("없는 파일.png") is None
@@ -0,0 +1,57 @@
+import pytest
+import asyncio
+import os
+import sys
+
+# 상위 디렉토리의 core 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.report_cache import ReportCache, content_key
+
+
+class TestReportCache:
+    def test_content_key_ignores_key_order(self):
+        assert content_key({"a": 1, "b": [1, 2]}) == content_key({"b": [1, 2], "a": 1})
+        assert content_key({"a": 1}) != content_key({"a": 2})
+
+    def test_render_once_for_concurrent_requests(self, tmp_path):
+        """같은 키의 동시 요청은 한 번만 렌더링하고, 이후 요청은 저장된 파일 사용"""
+        cache = ReportCache(directory=str(tmp_path))
+        renders = []
+
+        async def render():
+            renders.append(1)
+            await asyncio.sleep(0.05)
+            return b"%PDF-test"
+
+        async def run():
+            paths = await asyncio.gather(*(cache.get_or_render("ab" * 32, render) for _ in range(3)))
+            paths.append(await cache.get_or_render("ab" * 32, render))
+            return paths
+
+        paths = asyncio.run(run())
+        assert len(renders) == 1
+        assert len(set(paths)) == 1
+        with open(paths[0], "rb") as f:
+            assert f.read() == b"%PDF-test"
+
+    def test_prune_least_recently_used(self, tmp_path):
+        """최대 파일 수를 넘으면 오래 사용하지 않은 파일부터 삭제"""
+        cache = ReportCache(directory=str(tmp_path), max_files=2)
+        for i, key in enumerate(["a1" * 32, "b2" * 32]):
+            os.utime(cache.put(key, b"pdf"), (i, i))
+        cache.put("c3" * 32, b"pdf")
+
+        assert cache.get("a1" * 32) is None
+        assert cache.get("b2" * 32) is not None
+
+    def test_recently_served_file_not_pruned(self, tmp_path):
+        """get()으로 받은 파일은 전송 전에 다른 저장으로 삭제되지 않음"""
+        cache = ReportCache(directory=str(tmp_path), max_files=1)
+        cache.put("a1" * 32, b"pdf-a")
+        served = cache.get("a1" * 32)
+
+        cache.put("b2" * 32, b"pdf-b")
+
+        with open(served, "rb") as f:
+            assert f.read() == b"pdf-a"
@@ -0,0 +1,74 @@
+import pytest
+import asyncio
+import json
+import os
+import sys
+
+# 상위 디렉토리의 core 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.report_jobs import ReportJobManager
+
+
+class TestReportJobManager:
+    def test_batch_job_persists_artifacts(self, tmp_path):
+        """보고서별 결과를 작업 디렉토리에 저장하고, 일부 실패하면 completed_with_errors"""
+        source = tmp_path / "source.pdf"
+        source.write_bytes(b"%PDF-test")
+        manager = ReportJobManager(directory=str(tmp_path / "jobs"), concurrency=2)
+
+        async def render(spec):
+            await asyncio.sleep(0.01)
+            if spec["month"] == "2025-13":
+                raise Exception("월 형식 오류")
+            return str(source), f"{spec['month']}.pdf"
+
+        async def run():
+            job = manager.submit(
+                [{"month": "2025-03", "organization_name": "A"}, {"month": "2025-13", "organization_name": "B"}],
+                render
+            )
+            await manager.wait()
+            return job["job_id"]
+
+        job_id = asyncio.run(run())
+
+        # 완료된 작업은 새 관리자(서버 재시작)에서도 디스크에서 조회
+        job = ReportJobManager(directory=str(tmp_path / "jobs")).get(job_id)
+        assert job["status"] == "completed_with_errors"
+        assert [a["status"] for a in job["artifacts"]] == ["completed", "failed"]
+        assert job["artifacts"][0]["filename"] == "2025-03.pdf"
+
+        path = manager.artifact_path(job_id, 0)
+        with open(path, "rb") as f:
+            assert f.read() == b"%PDF-test"
+        assert manager.artifact_path(job_id, 1) is None
+
+    def test_interrupted_job_marked_failed(self, tmp_path):
+        """실행 중 서버가 재시작된 작업은 조회 시 실패로 표시"""
+        job_id = "0" * 32
+        job_dir = tmp_path / job_id
+        job_dir.mkdir()
+        (job_dir / "job.json").write_text(json.dumps({
+            "job_id": job_id,
+            "status": "running",
+            "created_at": "2025-03-01T00:00:00",
+            "finished_at": None,
+            "artifacts": [{"index": 0, "month": "2025-03", "organization_name": "A",
+                           "status": "running", "filename": None, "error": None}]
+        }))
+
+        manager = ReportJobManager(directory=str(tmp_path))
+        job = manager.get(job_id)
+        assert job["status"] == "failed"
+        assert job["artifacts"][0]["status"] == "failed"
+        assert manager.get("../etc") is None
+
+    def test_rejects_too_many_specs(self, tmp_path):
+        manager = ReportJobManager(directory=str(tmp_path))
+
+        async def run():
+            manager.submit([{"month": "2025-03", "organization_name": "A"}] * 1000, None)
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
@@ -0,0 +1,97 @@
+import pytest
+import json
+from unittest.mock import patch
+from datetime import date
+import sys
+import os
+
+# 상위 디렉토리의 api 모듈을 import하기 위해 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.database import Base
+from api.routes import trash
+from models.beach_prediction import BeachPrediction
+
+
+@pytest.fixture
+def session_factory():
+    """3월 1~3일, 해변 2곳의 예측이 저장된 인메모리 SQLite DB (날짜/해변 순서를 섞어 저장)"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[BeachPrediction.__table__])
+    factory = sessionmaker(bind=engine)
+
+    db = factory()
+    for day in (3, 1, 2):
+        for name in ("해변B", "해변A"):
+            db.add(BeachPrediction(
+                beach_name=name,
+                prediction_date=date(2025, 3, day),
+                latitude=33.3,
+                longitude=126.3,
+                trash_amount=float(day * 100),
+                status="LOW",
+                temperature=None
+            ))
+    db.commit()
+    db.close()
+    return factory
+
+
+@pytest.fixture
+def client(session_factory):
+    app = FastAPI()
+    app.include_router(trash.router, prefix="/api")
+    with patch("api.routes.trash.SessionLocal", session_factory):
+        yield TestClient(app)
+
+
+def fetch_rows(client, format: str, **params) -> list:
+    """기간 조회 결과를 형식에 맞게 파싱 (잘못된 JSON이면 예외)"""
+    response = client.get("/api/v1/trash/beach/range", params={**params, "format": format})
+    assert response.status_code == 200
+    if format == "json":
+        assert response.headers["content-type"].startswith("application/json")
+        return json.loads(response.text)
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestBeachPredictionRange:
+    def test_sorted_by_date_then_beach_with_inclusive_end(self, client):
+        rows = fetch_rows(client, "ndjson", start="2025-03-01", end="2025-03-02")
+
+        assert [(row["date"], row["name"]) for row in rows] == [
+            ("2025-03-01", "해변A"), ("2025-03-01", "해변B"),
+            ("2025-03-02", "해변A"), ("2025-03-02", "해변B"),
+        ]
+        assert rows[0]["prediction"] == {"trash_amount": 100.0}
+        assert rows[0]["temperature"] == 0.0
+
+    def test_beach_filter(self, client):
+        rows = fetch_rows(client, "ndjson", start="2025-03-01", end="2025-03-03", beach="해변B")
+
+        assert [row["date"] for row in rows] == ["2025-03-01", "2025-03-02", "2025-03-03"]
+        assert {row["name"] for row in rows} == {"해변B"}
+
+    @pytest.mark.parametrize("format", ["ndjson", "json"])
+    @pytest.mark.parametrize("params, expected", [
+        ({"start": "2025-04-01", "end": "2025-04-30"}, 0),
+        ({"start": "2025-03-03", "end": "2025-03-03", "beach": "해변A"}, 1),
+        ({"start": "2025-03-01", "end": "2025-03-03"}, 6),
+    ])
+    def test_valid_output_for_zero_one_many_rows(self, client, format, params, expected):
+        assert len(fetch_rows(client, format, **params)) == expected
+
+    @pytest.mark.parametrize("params", [
+        {"start": "2025-03-03", "end": "2025-03-01"},
+        {"start": "2025-3-1x", "end": "2025-03-01"},
+        {"start": "2025-03-01", "end": "2025/03/02"},
+    ])
+    def test_invalid_range(self, client, params):
+        assert client.get("/api/v1/trash/beach/range", params=params).status_code == 400
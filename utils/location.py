@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from dataclasses import dataclass
 
 
@@ -101,6 +102,27 @@ def find_nearest_location(latitude: float, longitude: float) -> ObservatoryLocat
     )
 
 
+def find_nearest_location_indices(latitudes, longitudes) -> np.ndarray:
+    """
+    여러 지점에 대해 가장 가까운 관측소의 인덱스를 한 번에 찾습니다.
+    
+    Args:
+        latitudes: 위도 배열
+        longitudes: 경도 배열
+    
+    Returns:
+        OBSERVATORY_LOCATIONS 인덱스 배열
+    """
+    lat1 = np.radians(np.asarray(latitudes, dtype=float).reshape(-1, 1))
+    lon1 = np.radians(np.asarray(longitudes, dtype=float).reshape(-1, 1))
+    lat2 = np.radians([loc.latitude for loc in OBSERVATORY_LOCATIONS])
+    lon2 = np.radians([loc.longitude for loc in OBSERVATORY_LOCATIONS])
+    
+    # Haversine formula (지구 반지름은 비교에 영향이 없으므로 생략)
+    a = np.sin((lat2 - lat1) / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2)**2
+    return np.argmin(a, axis=1)
+
+
 def get_location_by_code(code: str) -> ObservatoryLocation | None:
     """
     코드로 관측소 위치를 찾습니다.
@@ -3,26 +3,22 @@
 매일 아침 6시에 해변 예측 데이터를 자동으로 수집합니다.
 """
 import logging
-import subprocess
-import sys
-from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from core.ingestion import run_ingestion
+from core.prediction_grid import PRECOMPUTE_ZOOMS, run_precompute_tiles
+from core.reports import prerender_monthly_report
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 스크립트 경로
-BASE_DIR = Path(__file__).resolve().parent.parent
-SCRIPT_PATH = BASE_DIR / "scripts" / "populate_beach_predictions.py"
-
 
 def collect_beach_predictions():
     """
     해변 예측 데이터 수집 작업
-    오늘 날짜의 데이터를 생성합니다.
+    오늘 날짜의 데이터를 생성하고, 예측 격자 타일과 이번 달 기본 보고서 PDF를 미리 만들어 둡니다.
     """
     logger.info("=== 해변 예측 데이터 수집 시작 ===")
     start_time = datetime.now()
@@ -30,41 +26,39 @@ def collect_beach_predictions():
     # 오늘 날짜만 실행
     today = datetime.now().date()
     
-    start_str = today.strftime("%Y-%m-%d")
-    end_str = today.strftime("%Y-%m-%d")
-    
-    logger.info(f"수집 기간: {start_str} ~ {end_str}")
-    logger.info(f"스크립트 실행: {SCRIPT_PATH}")
+    logger.info(f"수집 기간: {today} ~ {today}")
     
     try:
-        # Python 스크립트 실행
-        result = subprocess.run(
-            [sys.executable, str(SCRIPT_PATH), "--start", start_str, "--end", end_str],
-            cwd=str(BASE_DIR),
-            capture_output=True,
-            text=True,
-            timeout=3600  # 1시간 타임아웃
-        )
-        
-        # 출력 로깅
-        if result.stdout:
-            for line in result.stdout.strip().split('\n'):
-                logger.info(line)
+        # 같은 프로세스에서 수집 파이프라인 실행 (스케줄러 스레드의 별도 이벤트 루프)
+        summary = run_ingestion(today, today)
         
-        if result.returncode == 0:
-            elapsed_time = datetime.now() - start_time
+        elapsed_time = datetime.now() - start_time
+        if summary["failed"]:
+            logger.error(f"데이터 수집 실패 ({summary['failed']}일)")
+        else:
             logger.info("=" * 50)
-            logger.info(f"데이터 수집 완료! (소요 시간: {elapsed_time})")
+            logger.info(
+                f"데이터 수집 완료! (저장 {summary['rows']}건, 건너뜀 {summary['skipped']}일, 소요 시간: {elapsed_time})"
+            )
             logger.info("=" * 50)
-        else:
-            logger.error(f"스크립트 실행 실패 (exit code: {result.returncode})")
-            if result.stderr:
-                logger.error(f"에러: {result.stderr}")
-                
-    except subprocess.TimeoutExpired:
-        logger.error("스크립트 실행 타임아웃 (1시간 초과)")
     except Exception as e:
-        logger.error(f"스크립트 실행 중 오류 발생: {str(e)}")
+        logger.error(f"데이터 수집 중 오류 발생: {str(e)}")
+        return
+    
+    # 오늘 예측 격자 타일 미리 계산 (지도 첫 이동이 모델/업스트림 호출을 기다리지 않도록)
+    if PRECOMPUTE_ZOOMS:
+        try:
+            tile_count = run_precompute_tiles(today, PRECOMPUTE_ZOOMS)
+            logger.info(f"예측 격자 타일 미리 계산 완료: {tile_count}개 (줌 {PRECOMPUTE_ZOOMS})")
+        except Exception as e:
+            logger.error(f"예측 격자 타일 미리 계산 실패: {str(e)}")
+    
+    # 이번 달 기본 보고서 미리 생성 (당일 첫 다운로드가 렌더링을 기다리지 않도록)
+    try:
+        report_path = prerender_monthly_report()
+        logger.info(f"월간 보고서 미리 생성 완료: {report_path}")
+    except Exception as e:
+        logger.error(f"월간 보고서 미리 생성 실패: {str(e)}")
 
 
 # 스케줄러 인스턴스